@@ -18,6 +18,7 @@ from byceps.services.webhooks import webhook_service
 from byceps.services.webhooks.models import AnnouncementRequest, OutgoingWebhook
 from byceps.util.jobqueue import enqueue, enqueue_at
 
+from . import delivery
 from .connections import get_signals, registry
 
 
@@ -56,12 +57,9 @@ def get_name_for_event(event: _BaseEvent) -> str:
 
 
 def _get_webhooks(event_name: str) -> list[OutgoingWebhook]:
-    webhooks = webhook_service.get_enabled_outgoing_webhooks(event_name)
-
-    # Stable order is easier to test.
-    webhooks.sort(key=lambda wh: wh.extra_fields.get('channel', ''))
-
-    return webhooks
+    # Look up in the process-local routing table instead of querying
+    # the database on the request thread that emitted the event.
+    return webhook_service.get_routing_table().get_webhooks(event_name)
 
 
 def _handle_event(event: _BaseEvent, webhook: OutgoingWebhook) -> None:
@@ -106,6 +104,7 @@ def assemble_announcement_request(
         data=data,
         expected_response_status_code=expected_response_status_code,
         announce_at=announce_at,
+        format=webhook.format,
     )
 
 
@@ -155,10 +154,10 @@ def announce(announcement_request: AnnouncementRequest) -> None:
     announce_at = announcement_request.announce_at
     if announce_at is not None:
         # Schedule job to announce later.
-        enqueue_at(announce_at, call_webhook, announcement_request)
+        enqueue_at(announce_at, delivery.submit, announcement_request)
     else:
         # Announce now.
-        call_webhook(announcement_request)
+        delivery.submit(announcement_request)
 
 
 def call_webhook(announcement_request: AnnouncementRequest) -> None:
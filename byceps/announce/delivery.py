@@ -0,0 +1,586 @@
+"""
+byceps.announce.delivery
+~~~~~~~~~~~~~~~~~~~~~~~~
+
+Deliver announcements to webhooks from the worker.
+
+Announcements are put into an outbox per webhook (in Redis) and
+delivered by a job shortly afterwards. This allows to
+
+- coalesce announcements that arrived in the meantime into fewer
+  messages (for chat services that show multi-line messages),
+- reuse HTTP connections (pooled per host) for all messages of a
+  burst, and
+- pace requests with a token bucket per webhook, and pause for as long
+  as the endpoint asks to (via `Retry-After`) if it throttles anyway.
+
+Only one delivery job per webhook is scheduled, and only one delivers,
+at a time. The job moves the announcements from the outbox to a list
+of those being processed, and removes each of them only once it has
+been delivered, has failed for good, or has been put back into the
+outbox for later. Announcements left behind by a job that crashed are
+delivered by the next one.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Sequence
+import dataclasses
+from dataclasses import dataclass
+from datetime import datetime, timedelta, UTC
+from email.utils import parsedate_to_datetime
+import json
+import time
+from typing import Any, Self
+from urllib.parse import urlsplit
+
+from flask import current_app
+from redis import Redis
+import requests
+from requests.adapters import HTTPAdapter
+
+from byceps.services.webhooks import webhook_delivery_stats_service
+from byceps.services.webhooks.models import AnnouncementRequest, WebhookID
+from byceps.util.jobqueue import enqueue_at
+
+
+REQUEST_TIMEOUT = 15  # seconds
+
+# Wait this long for more announcements to coalesce.
+COALESCE_DELAY = timedelta(seconds=2)
+
+# Stay below Discord's limit of 2,000 characters per message.
+MAX_MESSAGE_LENGTH = 1800
+
+MAX_ATTEMPTS = 3
+RETRY_DELAY = timedelta(seconds=10)  # multiplied by the attempt number
+DEFAULT_RETRY_AFTER = timedelta(seconds=5)
+
+# Wait within a job for tokens for at most this long; reschedule the
+# job to wait longer.
+MAX_WAIT_WITHIN_JOB = timedelta(seconds=5)
+MAX_JOB_DURATION = timedelta(seconds=60)
+
+# Release the delivery lock eventually in case the job crashed.
+DELIVERY_LOCK_TTL = timedelta(minutes=5)
+
+_KEY_PREFIX = 'byceps:announce:delivery'
+
+# Keys of the request data fields that contain the message text
+_TEXT_KEYS = ('content', 'text')
+
+# Formats of webhooks whose announcements may be joined into a single
+# multi-line message. IRC (via Weitersager) shows only the first line.
+_COALESCABLE_FORMATS = frozenset(['discord', 'matrix', 'mattermost'])
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    capacity: int  # maximum burst size
+    refill_rate: float  # requests per second
+
+
+_DEFAULT_RATE_LIMIT = RateLimit(capacity=10, refill_rate=1.0)
+
+_RATE_LIMITS_BY_HOST = {
+    # Discord allows 5 requests per 2 seconds, and 30 per minute, to
+    # each webhook.
+    'discord.com': RateLimit(capacity=5, refill_rate=0.5),
+    'discordapp.com': RateLimit(capacity=5, refill_rate=0.5),
+}
+
+
+@dataclass(frozen=True)
+class PendingDelivery:
+    url: str
+    data: dict[str, Any]
+    expected_response_status_code: int | None
+    format: str | None = None
+    attempt: int = 0
+
+    @classmethod
+    def from_announcement_request(
+        cls, announcement_request: AnnouncementRequest
+    ) -> Self:
+        expected_response_status_code = (
+            announcement_request.expected_response_status_code
+        )
+
+        return cls(
+            url=announcement_request.url,
+            data=announcement_request.data,
+            expected_response_status_code=expected_response_status_code,
+            format=announcement_request.format,
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(dataclasses.asdict(self))
+
+    @classmethod
+    def from_json(cls, value: str | bytes) -> Self:
+        return cls(**json.loads(value))
+
+
+@dataclass
+class TokenBucket:
+    """Allow requests at a rate, with bursts up to the capacity."""
+
+    capacity: int
+    refill_rate: float
+    tokens: float
+    updated_at: float  # seconds since the epoch
+    blocked_until: float = 0.0
+
+    @classmethod
+    def create_full(cls, rate_limit: RateLimit, now: float) -> Self:
+        return cls(
+            capacity=rate_limit.capacity,
+            refill_rate=rate_limit.refill_rate,
+            tokens=float(rate_limit.capacity),
+            updated_at=now,
+        )
+
+    def get_wait_time(self, now: float) -> float:
+        """Return the number of seconds until a request is allowed."""
+        self._refill(now)
+
+        wait_time = max(0.0, self.blocked_until - now)
+
+        if self.tokens < 1:
+            wait_time = max(wait_time, (1 - self.tokens) / self.refill_rate)
+
+        return wait_time
+
+    def take(self, now: float) -> None:
+        """Use up a token for a request."""
+        self._refill(now)
+        self.tokens -= 1
+
+    def block(self, now: float, seconds: float) -> None:
+        """Allow no requests for that many seconds."""
+        self.blocked_until = max(self.blocked_until, now + seconds)
+        self.tokens = 0.0
+        self.updated_at = max(self.updated_at, self.blocked_until)
+
+    def _refill(self, now: float) -> None:
+        if now <= self.updated_at:
+            return
+
+        elapsed = now - self.updated_at
+        self.tokens = min(
+            float(self.capacity), self.tokens + elapsed * self.refill_rate
+        )
+        self.updated_at = now
+
+
+# -------------------------------------------------------------------- #
+# submission
+
+
+def submit(announcement_request: AnnouncementRequest) -> None:
+    """Put the announcement into the webhook's outbox, and make sure it
+    gets delivered.
+    """
+    webhook_id = announcement_request.webhook_id
+    delivery = PendingDelivery.from_announcement_request(announcement_request)
+
+    _get_redis().rpush(_get_outbox_key(webhook_id), delivery.to_json())
+
+    if not current_app.config['JOBS_ASYNC']:
+        # Without a worker, scheduled jobs would never be run.
+        deliver_pending_announcements(webhook_id)
+        return
+
+    _schedule_delivery(webhook_id, COALESCE_DELAY)
+
+
+def _schedule_delivery(webhook_id: WebhookID, delay: timedelta) -> None:
+    # Expire the mark eventually in case the job got lost.
+    ttl = int(delay.total_seconds()) + int(MAX_JOB_DURATION.total_seconds()) * 2
+    was_set = _get_redis().set(
+        _get_delivery_scheduled_key(webhook_id), '1', nx=True, ex=ttl
+    )
+    if not was_set:
+        # A delivery is already scheduled.
+        return
+
+    enqueue_at(
+        datetime.now(UTC) + delay, deliver_pending_announcements, webhook_id
+    )
+
+
+# -------------------------------------------------------------------- #
+# delivery
+
+
+def deliver_pending_announcements(webhook_id: WebhookID) -> None:
+    """Deliver the announcements waiting in the webhook's outbox.
+
+    Meant to be run as a job on the worker.
+    """
+    redis = _get_redis()
+
+    # Clear the mark first so announcements submitted from now on
+    # schedule another delivery.
+    redis.delete(_get_delivery_scheduled_key(webhook_id))
+
+    lock_key = _get_delivery_lock_key(webhook_id)
+    lock_ttl = int(DELIVERY_LOCK_TTL.total_seconds())
+    if not redis.set(lock_key, '1', nx=True, ex=lock_ttl):
+        # Another job is still delivering. Try again later.
+        _schedule_delivery(webhook_id, COALESCE_DELAY)
+        return
+
+    try:
+        _deliver_pending_announcements(webhook_id)
+    finally:
+        redis.delete(lock_key)
+
+
+def _deliver_pending_announcements(webhook_id: WebhookID) -> None:
+    deliveries = _take_pending_deliveries(webhook_id)
+    if not deliveries:
+        return
+
+    messages_and_counts = _coalesce_counted(deliveries)
+    messages = [message for message, _ in messages_and_counts]
+    _increment_count(webhook_id, 'coalesced', len(deliveries) - len(messages))
+
+    bucket = _load_bucket(webhook_id, messages[0].url)
+    started_at = time.monotonic()
+
+    for index, (message, num_deliveries) in enumerate(messages_and_counts):
+        now = time.time()
+        wait_time = bucket.get_wait_time(now)
+
+        if wait_time > 0:
+            elapsed = time.monotonic() - started_at
+            if (wait_time > MAX_WAIT_WITHIN_JOB.total_seconds()) or (
+                elapsed + wait_time > MAX_JOB_DURATION.total_seconds()
+            ):
+                _postpone_remaining(
+                    webhook_id, messages_and_counts[index:], wait_time
+                )
+                _increment_count(webhook_id, 'throttled', len(messages) - index)
+                break
+
+            time.sleep(wait_time)
+            now = time.time()
+
+        bucket.take(now)
+
+        result = _send(message)
+
+        if result.delivered:
+            _complete(webhook_id, num_deliveries)
+            _increment_count(webhook_id, 'delivered')
+        elif result.retry_after is not None:
+            # The endpoint throttles us. Pause as requested.
+            bucket.block(time.time(), result.retry_after)
+            _postpone_remaining(
+                webhook_id, messages_and_counts[index:], result.retry_after
+            )
+            _increment_count(webhook_id, 'rate_limited')
+            break
+        elif result.retryable and (message.attempt + 1 < MAX_ATTEMPTS):
+            attempt = message.attempt + 1
+            _postpone(
+                webhook_id,
+                [dataclasses.replace(message, attempt=attempt)],
+                num_deliveries,
+                (RETRY_DELAY * attempt).total_seconds(),
+            )
+            _increment_count(webhook_id, 'retried')
+        else:
+            current_app.logger.warning(
+                'Delivery to webhook %s failed: %s', webhook_id, result.error
+            )
+            _complete(webhook_id, num_deliveries)
+            _increment_count(webhook_id, 'failed')
+
+    _save_bucket(webhook_id, bucket)
+
+
+def coalesce(deliveries: Sequence[PendingDelivery]) -> list[PendingDelivery]:
+    """Combine consecutive deliveries into as few messages as possible,
+    keeping their order.
+    """
+    return [message for message, _ in _coalesce_counted(deliveries)]
+
+
+def _coalesce_counted(
+    deliveries: Sequence[PendingDelivery],
+) -> list[tuple[PendingDelivery, int]]:
+    """Coalesce the deliveries, and return each message along with the
+    number of deliveries it combines.
+    """
+    messages_and_counts: list[tuple[PendingDelivery, int]] = []
+
+    for delivery in deliveries:
+        if messages_and_counts:
+            message, count = messages_and_counts[-1]
+            if _can_be_merged(message, delivery):
+                messages_and_counts[-1] = (_merge(message, delivery), count + 1)
+                continue
+
+        messages_and_counts.append((delivery, 1))
+
+    return messages_and_counts
+
+
+def _can_be_merged(first: PendingDelivery, second: PendingDelivery) -> bool:
+    if (first.url != second.url) or (
+        first.expected_response_status_code
+        != second.expected_response_status_code
+    ):
+        return False
+
+    if (first.format not in _COALESCABLE_FORMATS) or (
+        first.format != second.format
+    ):
+        return False
+
+    text_key = _find_text_key(first.data)
+    if (text_key is None) or (text_key != _find_text_key(second.data)):
+        return False
+
+    # Everything apart from the text (e.g. an IRC channel) must match.
+    if _without(first.data, text_key) != _without(second.data, text_key):
+        return False
+
+    merged_length = len(first.data[text_key]) + 1 + len(second.data[text_key])
+    return merged_length <= MAX_MESSAGE_LENGTH
+
+
+def _merge(first: PendingDelivery, second: PendingDelivery) -> PendingDelivery:
+    text_key = _find_text_key(first.data)
+    data = dict(first.data)
+    data[text_key] = first.data[text_key] + '\n' + second.data[text_key]
+
+    return dataclasses.replace(
+        first, data=data, attempt=max(first.attempt, second.attempt)
+    )
+
+
+def _find_text_key(data: dict[str, Any]) -> str | None:
+    for key in _TEXT_KEYS:
+        if isinstance(data.get(key), str):
+            return key
+
+    return None
+
+
+def _without(data: dict[str, Any], key: str) -> dict[str, Any]:
+    return {k: v for k, v in data.items() if k != key}
+
+
+def _take_pending_deliveries(webhook_id: WebhookID) -> list[PendingDelivery]:
+    """Move the announcements from the outbox to the list of those being
+    processed, and return all of the latter.
+
+    Announcements left behind by an interrupted delivery come first.
+    """
+    redis = _get_redis()
+    outbox_key = _get_outbox_key(webhook_id)
+    processing_key = _get_processing_key(webhook_id)
+
+    num_pending = redis.llen(outbox_key)
+
+    pipeline = redis.pipeline(transaction=True)
+    for _ in range(num_pending):
+        pipeline.lmove(outbox_key, processing_key, 'LEFT', 'RIGHT')
+    pipeline.lrange(processing_key, 0, -1)
+    values = pipeline.execute()[-1]
+
+    return [PendingDelivery.from_json(value) for value in values]
+
+
+def _complete(webhook_id: WebhookID, num_deliveries: int) -> None:
+    """Remove that many deliveries from the front of the list of those
+    being processed.
+    """
+    _get_redis().ltrim(_get_processing_key(webhook_id), num_deliveries, -1)
+
+
+def _postpone_remaining(
+    webhook_id: WebhookID,
+    messages_and_counts: Sequence[tuple[PendingDelivery, int]],
+    delay: float,
+) -> None:
+    messages = [message for message, _ in messages_and_counts]
+    num_deliveries = sum(count for _, count in messages_and_counts)
+    _postpone(webhook_id, messages, num_deliveries, delay)
+
+
+def _postpone(
+    webhook_id: WebhookID,
+    messages: Sequence[PendingDelivery],
+    num_deliveries: int,
+    delay: float,
+) -> None:
+    """Put the messages back in front of the outbox in place of the
+    deliveries they combine, and schedule their delivery.
+    """
+    pipeline = _get_redis().pipeline(transaction=True)
+    pipeline.lpush(
+        _get_outbox_key(webhook_id),
+        *[message.to_json() for message in reversed(messages)],
+    )
+    pipeline.ltrim(_get_processing_key(webhook_id), num_deliveries, -1)
+    pipeline.execute()
+
+    _schedule_delivery(webhook_id, timedelta(seconds=delay))
+
+
+# -------------------------------------------------------------------- #
+# HTTP
+
+
+@dataclass(frozen=True)
+class _SendResult:
+    delivered: bool
+    retryable: bool = False
+    retry_after: float | None = None
+    error: str | None = None
+
+
+def _send(delivery: PendingDelivery) -> _SendResult:
+    try:
+        response = _get_session(delivery.url).post(
+            delivery.url, json=delivery.data, timeout=REQUEST_TIMEOUT
+        )
+    except requests.RequestException as e:
+        return _SendResult(delivered=False, retryable=True, error=str(e))
+
+    status_code = response.status_code
+
+    if status_code == 429:
+        return _SendResult(
+            delivered=False,
+            retry_after=_get_retry_after(response),
+            error='rate limited',
+        )
+
+    expected_status_code = delivery.expected_response_status_code
+    if (expected_status_code is None) or (status_code == expected_status_code):
+        return _SendResult(delivered=True)
+
+    return _SendResult(
+        delivered=False,
+        retryable=(status_code >= 500),
+        error=f'unexpected status code {status_code}',
+    )
+
+
+def _get_retry_after(response: requests.Response) -> float:
+    """Return the number of seconds to wait before the next request."""
+    value = response.headers.get('Retry-After')
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            pass
+        else:
+            return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+    return DEFAULT_RETRY_AFTER.total_seconds()
+
+
+# Sessions are kept for the lifetime of the process. As the worker forks
+# a process per job, connections are reused for all messages delivered
+# by a job.
+_sessions_by_host: dict[str, requests.Session] = {}
+
+
+def _get_session(url: str) -> requests.Session:
+    parts = urlsplit(url)
+    host = f'{parts.scheme}://{parts.netloc}'
+
+    session = _sessions_by_host.get(host)
+    if session is None:
+        session = requests.Session()
+        # Retries are handled by the delivery itself.
+        session.mount(host, HTTPAdapter(pool_maxsize=4, max_retries=0))
+        _sessions_by_host[host] = session
+
+    return session
+
+
+# -------------------------------------------------------------------- #
+# rate limiting
+
+
+def get_rate_limit(url: str) -> RateLimit:
+    host = urlsplit(url).hostname or ''
+    return _RATE_LIMITS_BY_HOST.get(host, _DEFAULT_RATE_LIMIT)
+
+
+def _load_bucket(webhook_id: WebhookID, url: str) -> TokenBucket:
+    rate_limit = get_rate_limit(url)
+    now = time.time()
+
+    value = _get_redis().get(_get_bucket_key(webhook_id))
+    if value is None:
+        return TokenBucket.create_full(rate_limit, now)
+
+    state = json.loads(value)
+    return TokenBucket(
+        capacity=rate_limit.capacity,
+        refill_rate=rate_limit.refill_rate,
+        tokens=state['tokens'],
+        updated_at=state['updated_at'],
+        blocked_until=state['blocked_until'],
+    )
+
+
+def _save_bucket(webhook_id: WebhookID, bucket: TokenBucket) -> None:
+    state = {
+        'tokens': bucket.tokens,
+        'updated_at': bucket.updated_at,
+        'blocked_until': bucket.blocked_until,
+    }
+
+    # An unused bucket is full again after a while anyway.
+    _get_redis().set(_get_bucket_key(webhook_id), json.dumps(state), ex=3600)
+
+
+# -------------------------------------------------------------------- #
+# helpers
+
+
+def _increment_count(
+    webhook_id: WebhookID, outcome: str, amount: int = 1
+) -> None:
+    webhook_delivery_stats_service.increment_count(
+        webhook_id, outcome, amount=amount
+    )
+
+
+def _get_redis() -> Redis:
+    return current_app.redis_client
+
+
+def _get_outbox_key(webhook_id: WebhookID) -> str:
+    return f'{_KEY_PREFIX}:outbox:{webhook_id}'
+
+
+def _get_processing_key(webhook_id: WebhookID) -> str:
+    return f'{_KEY_PREFIX}:processing:{webhook_id}'
+
+
+def _get_delivery_lock_key(webhook_id: WebhookID) -> str:
+    return f'{_KEY_PREFIX}:lock:{webhook_id}'
+
+
+def _get_delivery_scheduled_key(webhook_id: WebhookID) -> str:
+    return f'{_KEY_PREFIX}:scheduled:{webhook_id}'
+
+
+def _get_bucket_key(webhook_id: WebhookID) -> str:
+    return f'{_KEY_PREFIX}:bucket:{webhook_id}'
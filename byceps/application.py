@@ -31,6 +31,7 @@ from byceps.config import (
     parse_value_from_environment,
 )
 from byceps.database import db
+from byceps.services.board import board_author_decoration_service
 from byceps.util import templatefilters
 from byceps.util.authz import load_permissions
 from byceps.util.framework.blueprint import get_blueprint
@@ -169,6 +170,8 @@ def _create_app(*, config_overrides: dict[str, Any] | None = None) -> Flask:
 
     enable_announcements()
 
+    board_author_decoration_service.connect_signals()
+
     debug_toolbar_enabled = (
         app.config.get('DEBUG_TOOLBAR_ENABLED', False)
         and (app_mode.is_admin() or app_mode.is_site())
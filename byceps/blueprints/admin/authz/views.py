@@ -6,6 +6,8 @@ byceps.blueprints.admin.authz.views
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections import defaultdict
+
 from flask import abort
 
 from byceps.services.authz import authz_service
@@ -19,6 +21,9 @@ from byceps.util.views import permission_required
 blueprint = create_blueprint('authz_admin', __name__)
 
 
+ROLE_INDEX_USER_LIMIT = 10
+
+
 @blueprint.get('/permissions')
 @permission_required('role.view')
 @templated
@@ -26,9 +31,14 @@ def permission_index():
     """List permissions."""
     all_permissions = permission_registry.get_registered_permissions()
 
-    role_ids_by_permission_id = (
-        authz_service.get_assigned_roles_for_permissions()
-    )
+    authz_index = authz_service.get_index()
+
+    permission_ids_by_role_id = authz_index.permission_ids_by_role_id
+
+    role_ids_by_permission_id = defaultdict(set)
+    for role_id, permission_ids in permission_ids_by_role_id.items():
+        for permission_id in permission_ids:
+            role_ids_by_permission_id[permission_id].add(role_id)
 
     permissions_and_roles = [
         (permission, role_ids_by_permission_id.get(permission.id, frozenset()))
@@ -43,20 +53,40 @@ def permission_index():
 @templated
 def role_index():
     """List roles."""
-    roles_permissions_users = (
-        authz_service.get_all_roles_with_permissions_and_users()
-    )
+    authz_index = authz_service.get_index()
+
+    roles_permissions_user_ids = [
+        (
+            role,
+            authz_index.get_permission_ids_for_role(role.id),
+            authz_index.get_user_ids_for_role(role.id),
+        )
+        for role in authz_index.roles_by_id.values()
+    ]
 
-    user_ids = {
-        user.id for _, _, users in roles_permissions_users for user in users
+    # Only fetch users of roles that have few enough of them to be
+    # listed.
+    listed_user_ids_by_role_id = {
+        role.id: role_user_ids
+        for role, _, role_user_ids in roles_permissions_user_ids
+        if len(role_user_ids) <= ROLE_INDEX_USER_LIMIT
     }
     users_by_id = user_service.get_users_indexed_by_id(
-        user_ids, include_avatars=True
+        set().union(*listed_user_ids_by_role_id.values()),
+        include_avatars=True,
     )
+    users_by_role_id = {
+        role_id: sorted(
+            (users_by_id[user_id] for user_id in role_user_ids),
+            key=lambda user: user.screen_name or '',
+        )
+        for role_id, role_user_ids in listed_user_ids_by_role_id.items()
+    }
 
     return {
-        'roles_permissions_users': roles_permissions_users,
-        'users_by_id': users_by_id,
+        'roles_permissions_user_ids': roles_permissions_user_ids,
+        'users_by_role_id': users_by_role_id,
+        'user_limit': ROLE_INDEX_USER_LIMIT,
     }
 
 
@@ -65,14 +95,16 @@ def role_index():
 @templated
 def role_view(role_id):
     """View role details."""
-    role = authz_service.find_role(role_id)
+    authz_index = authz_service.get_index()
+
+    role = authz_index.roles_by_id.get(role_id)
 
     if role is None:
         abort(404)
 
     all_permissions = permission_registry.get_registered_permissions()
 
-    role_permission_ids = authz_service.get_permission_ids_for_role(role.id)
+    role_permission_ids = authz_index.get_permission_ids_for_role(role.id)
 
     permissions = {
         permission
@@ -80,8 +112,8 @@ def role_view(role_id):
         if permission.id in role_permission_ids
     }
 
-    user_ids = authz_service.find_user_ids_for_role(role.id)
-    users = user_service.get_users(user_ids, include_avatars=True)
+    user_ids = authz_index.get_user_ids_for_role(role.id)
+    users = user_service.get_users(set(user_ids), include_avatars=True)
 
     return {
         'role': role,
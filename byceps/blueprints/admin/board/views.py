@@ -13,6 +13,7 @@ from flask import abort, request
 from flask_babel import gettext
 
 from byceps.services.board import (
+    board_aggregation_service,
     board_category_command_service,
     board_category_query_service,
     board_posting_query_service,
@@ -24,6 +25,7 @@ from byceps.services.brand import brand_service
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.framework.flash import flash_error, flash_success
 from byceps.util.framework.templating import templated
+from byceps.util.jobqueue import enqueue
 from byceps.util.views import (
     permission_required,
     redirect_to,
@@ -130,6 +132,23 @@ def board_create(brand_id):
     return redirect_to('.board_view', board_id=board.id)
 
 
+@blueprint.post('/boards/<board_id>/recount')
+@permission_required('board_category.update')
+@respond_no_content
+def board_recount(board_id):
+    """Recount the board's topics and categories in the background."""
+    board = _get_board_or_404(board_id)
+
+    enqueue(board_aggregation_service.aggregate_board, board.id)
+
+    flash_success(
+        gettext(
+            'Board "%(board_id)s" is being recounted.',
+            board_id=board.id,
+        )
+    )
+
+
 # -------------------------------------------------------------------- #
 # categories
 
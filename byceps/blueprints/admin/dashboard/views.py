@@ -27,7 +27,7 @@ from byceps.services.shop.order import order_service as shop_order_service
 from byceps.services.shop.shop import shop_service
 from byceps.services.shop.storefront import storefront_service
 from byceps.services.site import site_service
-from byceps.services.ticketing import ticket_service
+from byceps.services.ticketing import ticket_count_service, ticket_service
 from byceps.services.user import user_service, user_stats_service
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.framework.templating import templated
@@ -173,9 +173,8 @@ def view_party(party_id):
     seat_count = seat_service.count_seats_for_party(party.id)
 
     ticket_sale_stats = ticket_service.get_ticket_sale_stats(party.id)
-    tickets_checked_in = ticket_service.count_tickets_checked_in_for_party(
-        party.id
-    )
+    ticket_counts = ticket_count_service.get_counts(party.id)
+    tickets_checked_in = ticket_counts.tickets_checked_in
 
     seat_utilization = seat_service.get_seat_utilization(party.id)
 
@@ -12,6 +12,7 @@ from flask_babel import gettext
 from byceps.services.party import party_service
 from byceps.services.shop.order import order_service
 from byceps.services.ticketing import (
+    barcode_service,
     ticket_bundle_service,
     ticket_category_service,
     ticket_service,
@@ -104,6 +105,36 @@ def index_for_party(party_id, page):
     }
 
 
+@blueprint.get('/tickets/for_party/<party_id>/printable.html')
+@permission_required('ticketing.view')
+@templated
+def view_printable_html_for_party(party_id):
+    """Show the party's tickets (optionally only those of an order) on
+    a printable sheet.
+    """
+    party = _get_party_or_404(party_id)
+
+    order_number = request.args.get('order_number', default='').strip()
+
+    tickets = ticket_service.get_tickets_for_printing(
+        party.id, order_number=order_number or None
+    )
+
+    barcode_svgs = barcode_service.render_svgs(
+        ticket.code for ticket in tickets
+    )
+    barcode_svgs_inline = {
+        code: barcode_service.encode_svg_for_data_uri(svg)
+        for code, svg in barcode_svgs.items()
+    }
+
+    return {
+        'party': party,
+        'tickets': tickets,
+        'barcode_svgs_inline': barcode_svgs_inline,
+    }
+
+
 @blueprint.get('/tickets/<uuid:ticket_id>')
 @permission_required('ticketing.view')
 @templated
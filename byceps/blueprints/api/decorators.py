@@ -21,7 +21,9 @@ def api_token_required(func):
     def wrapper(*args, **kwargs):
         request_token = _extract_token_from_request()
         if request_token:
-            api_token = authn_api_service.find_api_token_by_token(request_token)
+            api_token = authn_api_service.find_api_token_by_token_cached(
+                request_token
+            )
         else:
             api_token = None
 
@@ -10,7 +10,7 @@ from flask import jsonify
 
 from byceps.blueprints.api.decorators import api_token_required
 from byceps.blueprints.site.snippet.templating import get_rendered_snippet_body
-from byceps.services.snippet import snippet_service
+from byceps.services.snippet import snippet_index_service
 from byceps.services.snippet.models import SnippetScope
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.views import create_empty_json_response
@@ -28,7 +28,7 @@ def get_snippet_by_name(scope_type, scope_name, snippet_name, language_code):
     scope.
     """
     scope = SnippetScope(scope_type, scope_name)
-    version = snippet_service.find_current_version_of_snippet_with_name(
+    version = snippet_index_service.find_current_version(
         scope, snippet_name, language_code
     )
     if version is None:
@@ -0,0 +1,23 @@
+"""
+byceps.blueprints.api.v1.ticketing.models
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class OfflineCheckInRequestItem(BaseModel):
+    idempotency_key: str = Field(min_length=1, max_length=100)
+    ticket_id: UUID
+    occurred_at: datetime
+
+
+class CheckInUsersInBulkRequest(BaseModel):
+    initiator_id: UUID
+    check_ins: list[OfflineCheckInRequestItem] = Field(max_length=1000)
@@ -6,14 +6,31 @@ byceps.blueprints.api.v1.ticketing
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from flask import abort, jsonify
+from datetime import datetime, UTC
+
+from flask import abort, jsonify, request
+from pydantic import ValidationError
 
 from byceps.blueprints.api.decorators import api_token_required
 from byceps.services.party import party_service
 from byceps.services.party.models import Party, PartyID
-from byceps.services.ticketing import ticket_service
+from byceps.services.ticketing import (
+    ticket_checkin_snapshot_service,
+    ticket_service,
+    ticket_user_checkin_service,
+)
+from byceps.services.ticketing.models.checkin import (
+    CheckInSnapshotTicket,
+    OfflineCheckIn,
+    OfflineCheckInResult,
+)
+from byceps.services.ticketing.models.ticket import TicketID
+from byceps.services.user import user_service
+from byceps.signals import ticketing as ticketing_signals
 from byceps.util.framework.blueprint import create_blueprint
 
+from .models import CheckInUsersInBulkRequest
+
 
 blueprint = create_blueprint('ticketing_api', __name__)
 
@@ -36,6 +53,126 @@ def get_sale_stats(party_id):
     )
 
 
+@blueprint.get('/checkin_snapshot/<party_id>')
+@api_token_required
+def get_checkin_snapshot(party_id):
+    """Return the party's tickets for check-in desks to look them up
+    locally.
+
+    The snapshot's version is also its entity tag, so a desk can fetch
+    it conditionally.
+    """
+    party = _get_party_or_404(party_id)
+
+    snapshot = ticket_checkin_snapshot_service.get_snapshot(party.id)
+
+    response = jsonify(
+        {
+            'party_id': snapshot.party_id,
+            'version': snapshot.version,
+            'created_at': snapshot.created_at.isoformat(),
+            'categories': {
+                str(category_id): title
+                for category_id, title in snapshot.category_titles_by_id.items()
+            },
+            'tickets': [
+                _snapshot_ticket_to_json(ticket) for ticket in snapshot.tickets
+            ],
+        }
+    )
+    response.set_etag(snapshot.version)
+
+    return response.make_conditional(request)
+
+
+def _snapshot_ticket_to_json(ticket: CheckInSnapshotTicket) -> dict:
+    used_by = ticket.used_by
+
+    return {
+        'id': str(ticket.id),
+        'code': ticket.code,
+        'category_id': str(ticket.category_id),
+        'revoked': ticket.revoked,
+        'user_checked_in': ticket.user_checked_in,
+        'user': {
+            'id': str(used_by.id),
+            'screen_name': used_by.screen_name,
+            'first_name': used_by.first_name,
+            'last_name': used_by.last_name,
+            'suspended': used_by.suspended,
+            'deleted': used_by.deleted,
+        }
+        if used_by is not None
+        else None,
+        'seat': {
+            'label': ticket.seat_label,
+            'area': ticket.seating_area_title,
+        }
+        if ticket.seat_label is not None
+        else None,
+    }
+
+
+@blueprint.post('/checkins/<party_id>')
+@api_token_required
+def check_in_users_in_bulk(party_id):
+    """Apply check-ins recorded at a desk.
+
+    Check-ins whose idempotency key has already been applied are
+    reported as such, but not applied again, so a desk can safely
+    repeat a synchronization.
+    """
+    party = _get_party_or_404(party_id)
+
+    if not request.is_json:
+        abort(415)
+
+    try:
+        req = CheckInUsersInBulkRequest.model_validate(request.get_json())
+    except ValidationError as e:
+        abort(400, e.json())
+
+    initiator = user_service.find_user(req.initiator_id)
+    if not initiator:
+        abort(400, 'Initiator ID unknown')
+
+    offline_check_ins = [
+        OfflineCheckIn(
+            idempotency_key=item.idempotency_key,
+            ticket_id=TicketID(item.ticket_id),
+            occurred_at=_to_naive_utc(item.occurred_at),
+        )
+        for item in req.check_ins
+    ]
+
+    results, events = ticket_user_checkin_service.check_in_users_in_bulk(
+        party.id, offline_check_ins, initiator
+    )
+
+    for event in events:
+        ticketing_signals.ticket_checked_in.send(None, event=event)
+
+    return jsonify(
+        {'results': [_check_in_result_to_json(result) for result in results]}
+    )
+
+
+def _to_naive_utc(dt: datetime) -> datetime:
+    if dt.tzinfo is None:
+        return dt
+
+    return dt.astimezone(UTC).replace(tzinfo=None)
+
+
+def _check_in_result_to_json(result: OfflineCheckInResult) -> dict:
+    return {
+        'idempotency_key': result.idempotency_key,
+        'ticket_id': str(result.ticket_id),
+        'status': result.status.name,
+        'error': result.error_message,
+    }
+
+
 def _get_party_or_404(party_id: PartyID) -> Party:
     party = party_service.find_party(party_id)
 
@@ -6,7 +6,9 @@ byceps.blueprints.site.board._helpers
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from flask import abort, g, url_for
+from uuid import UUID
+
+from flask import abort, g, request, url_for
 
 from byceps.services.board import (
     board_access_control_service,
@@ -114,3 +116,25 @@ def build_url_for_posting_in_topic_view(db_posting, page, **kwargs):
         _anchor=f'posting-{db_posting.id}',
         **kwargs,
     )
+
+
+def get_after_arg() -> UUID | None:
+    """Return the ID of the item after which a (keyset) page begins, if
+    given and valid.
+    """
+    value = request.args.get('after')
+    if not value:
+        return None
+
+    try:
+        return UUID(value)
+    except ValueError:
+        return None
+
+
+def get_next_page_url_args(pagination) -> dict[str, str]:
+    """Return the URL arguments to select the next page by keyset."""
+    if not pagination.has_next or not pagination.items:
+        return {}
+
+    return {'after': str(pagination.items[-1].id)}
@@ -6,6 +6,7 @@ byceps.blueprints.site.board.models
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
 from typing import Self
 
@@ -55,7 +56,7 @@ class Creator(User):
     def from_(
         cls,
         user: User,
-        orga_ids: set[UserID],
+        orga_ids: AbstractSet[UserID],
         badges: set[Badge],
         ticket: Ticket | None,
     ) -> Self:
@@ -14,24 +14,24 @@ from flask import g
 from byceps.services.authn.session.models import CurrentUser
 from byceps.services.board import (
     board_access_control_service,
+    board_author_decoration_service,
     board_last_view_service,
     board_posting_query_service,
+    board_posting_rendering_service,
     board_topic_query_service,
 )
 from byceps.services.board.dbmodels.posting import DbPosting
 from byceps.services.board.dbmodels.topic import DbTopic
 from byceps.services.board.models import BoardCategoryWithLastUpdate
 from byceps.services.brand.models import BrandID
-from byceps.services.orga_team import orga_team_service
 from byceps.services.party import party_service
 from byceps.services.party.models import Party, PartyID
 from byceps.services.site import site_setting_service
-from byceps.services.ticketing import ticket_service
 from byceps.services.user import user_service
 from byceps.services.user.models.user import UserID
-from byceps.services.user_badge import user_badge_awarding_service
 from byceps.services.user_badge.models import Badge
 from byceps.util.authz import has_current_user_permission
+from byceps.util.l10n import get_locale_str
 
 from .models import CategoryWithLastUpdateAndUnseenFlag, Creator, Ticket
 
@@ -74,25 +74,21 @@ def add_unseen_postings_flag_to_categories(
     """Add flag to each category stating if it contains postings unseen
     by the user.
     """
-    categories_with_flag = []
-
-    for category in categories:
-        contains_unseen_postings = (
-            user.authenticated
-            and board_last_view_service.contains_category_unseen_postings(
-                category, user.id
+    if user.authenticated:
+        category_ids_with_unseen_postings = (
+            board_last_view_service.select_categories_with_unseen_postings(
+                categories, user.id
             )
         )
+    else:
+        category_ids_with_unseen_postings = set()
 
-        category_with_flag = (
-            CategoryWithLastUpdateAndUnseenFlag.from_category_with_last_update(
-                category, contains_unseen_postings
-            )
+    return [
+        CategoryWithLastUpdateAndUnseenFlag.from_category_with_last_update(
+            category, category.id in category_ids_with_unseen_postings
         )
-
-        categories_with_flag.append(category_with_flag)
-
-    return categories_with_flag
+        for category in categories
+    ]
 
 
 def add_topic_creators(db_topics: Iterable[DbTopic]) -> None:
@@ -110,12 +106,18 @@ def add_topic_unseen_flag(
     db_topics: Iterable[DbTopic], user: CurrentUser
 ) -> None:
     """Add `unseen` flag to topics."""
+    if user.authenticated:
+        topic_ids_with_unseen_postings = (
+            board_last_view_service.select_topics_with_unseen_postings(
+                db_topics, user.id
+            )
+        )
+    else:
+        topic_ids_with_unseen_postings = set()
+
     for db_topic in db_topics:
         db_topic.contains_unseen_postings = (
-            user.authenticated
-            and board_last_view_service.contains_topic_unseen_postings(
-                db_topic, user.id
-            )
+            db_topic.id in topic_ids_with_unseen_postings
         )
 
 
@@ -142,6 +144,16 @@ def is_posting_unseen(db_posting: DbPosting, last_viewed_at: datetime) -> bool:
     return (last_viewed_at is None) or (db_posting.created_at > last_viewed_at)
 
 
+def add_html_to_postings(db_postings: Iterable[DbPosting]) -> None:
+    """Add the attribute 'body_html' to each post."""
+    html_by_posting_id = board_posting_rendering_service.get_html_by_posting_id(
+        db_postings, get_locale_str()
+    )
+
+    for db_posting in db_postings:
+        db_posting.body_html = html_by_posting_id[db_posting.id]
+
+
 def enrich_creators(
     db_postings: Iterable[DbPosting],
     brand_id: BrandID,
@@ -154,17 +166,15 @@ def enrich_creators(
 
     party: Party | None
     if party_id is not None:
-        party = party_service.get_party(party_id)
-        orga_ids = orga_team_service.select_orgas_for_party(
-            creator_ids, party_id
-        )
-        ticket_users = ticket_service.select_ticket_users_for_party(
-            creator_ids, party.id
+        party = party_service.get_party_cached(party_id)
+        orga_ids = board_author_decoration_service.get_orga_ids(party_id)
+        ticket_users = board_author_decoration_service.get_ticket_user_ids(
+            party.id
         )
     else:
         party = None
-        orga_ids = set()
-        ticket_users = set()
+        orga_ids = frozenset()
+        ticket_users = frozenset()
 
     for db_posting in db_postings:
         user_id = db_posting.creator_id
@@ -186,8 +196,8 @@ def _get_badges_for_users(
     user_ids: set[UserID], brand_id: BrandID
 ) -> dict[UserID, set[Badge]]:
     """Fetch users' badges that are either global or belong to the brand."""
-    badges_by_user_id = user_badge_awarding_service.get_badges_awarded_to_users(
-        user_ids, featured_only=True
+    badges_by_user_id = board_author_decoration_service.get_featured_badges(
+        user_ids
     )
 
     def generate_items():
@@ -6,5 +6,10 @@ byceps.blueprints.site.board.views
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from . import views_category, views_posting, views_topic  # noqa: F401
+from . import (  # noqa: F401
+    views_category,
+    views_posting,
+    views_search,
+    views_topic,
+)
 from .blueprint import blueprint  # noqa: F401
@@ -79,7 +79,11 @@ def category_view(slug, page):
     topics_per_page = service.get_topics_per_page_value()
 
     topics = board_topic_query_service.paginate_topics_of_category(
-        category.id, page, topics_per_page, include_hidden=include_hidden
+        category.id,
+        page,
+        topics_per_page,
+        include_hidden=include_hidden,
+        after=h.get_after_arg(),
     )
 
     service.add_topic_creators(topics.items)
@@ -88,6 +92,7 @@ def category_view(slug, page):
     return {
         'category': category,
         'topics': topics,
+        'next_page_url_args': h.get_next_page_url_args(topics),
     }
 
 
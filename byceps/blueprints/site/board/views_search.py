@@ -0,0 +1,64 @@
+"""
+byceps.blueprints.site.board.views_search
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from flask import g, request
+
+from byceps.blueprints.site.site.navigation import subnavigation_for_view
+from byceps.services.board import board_search_service
+from byceps.services.user import user_service
+from byceps.util.framework.templating import templated
+
+from . import _helpers as h, service
+from .blueprint import blueprint
+
+
+RESULTS_PER_PAGE = 20
+
+
+@blueprint.get('/search')
+@templated
+@subnavigation_for_view('board')
+def search():
+    """Search postings and topic titles."""
+    board_id = h.get_board_id()
+    user = g.user
+
+    h.require_board_access(board_id, user.id)
+
+    search_term = request.args.get('search_term', default='').strip()
+    after = h.get_after_arg()
+
+    if not search_term:
+        return {
+            'search_term': search_term,
+            'results': None,
+            'next_after': None,
+            'creators_by_id': {},
+        }
+
+    include_hidden = service.may_current_user_view_hidden()
+
+    result_page = board_search_service.search_postings(
+        board_id,
+        search_term,
+        include_hidden=include_hidden,
+        limit=RESULTS_PER_PAGE,
+        after=after,
+    )
+
+    creator_ids = {result.creator_id for result in result_page.results}
+    creators_by_id = user_service.get_users_indexed_by_id(
+        creator_ids, include_avatars=True
+    )
+
+    return {
+        'search_term': search_term,
+        'results': result_page.results,
+        'next_after': result_page.next_after,
+        'creators_by_id': creators_by_id,
+    }
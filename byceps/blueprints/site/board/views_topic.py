@@ -125,10 +125,15 @@ def topic_view(topic_id, page):
         board_last_view_service.mark_topic_as_just_viewed(topic.id, user.id)
 
     postings = board_posting_query_service.paginate_postings(
-        topic.id, include_hidden, page, postings_per_page
+        topic.id,
+        include_hidden,
+        page,
+        postings_per_page,
+        after=h.get_after_arg(),
     )
 
     service.add_unseen_flag_to_postings(postings.items, last_viewed_at)
+    service.add_html_to_postings(postings.items)
 
     is_last_page = not postings.has_next
 
@@ -142,6 +147,7 @@ def topic_view(topic_id, page):
     context = {
         'topic': topic,
         'postings': postings,
+        'next_page_url_args': h.get_next_page_url_args(postings),
         'is_last_page': is_last_page,
         'may_topic_be_updated_by_current_user': service.may_topic_be_updated_by_current_user,
         'may_posting_be_updated_by_current_user': service.may_posting_be_updated_by_current_user,
@@ -12,6 +12,7 @@ from flask import current_app, g, request, url_for
 from flask_babel import get_locale
 import sentry_sdk
 
+from byceps.services.brand import brand_service
 from byceps.services.party import party_service
 from byceps.services.site import site_service
 from byceps.services.text_markup import text_markup_service
@@ -40,18 +41,20 @@ def url_for_site_file(filename, **kwargs) -> str | None:
 @blueprint.before_app_request
 def prepare_request_globals() -> None:
     site_id = current_app.config['SITE_ID']
-    site = site_service.get_site(site_id)
+    site = site_service.get_site_cached(site_id)
     g.site = site
     g.site_id = site.id
     sentry_sdk.set_tag('site_id', g.site_id)
 
-    g.brand_id = site.brand_id
+    brand = brand_service.get_brand_cached(site.brand_id)
+    g.brand = brand
+    g.brand_id = brand.id
     sentry_sdk.set_tag('brand_id', g.brand_id)
 
     party = None
     party_id = site.party_id
     if party_id is not None:
-        party = party_service.get_party(party_id)
+        party = party_service.get_party_cached(party_id)
         party_id = party.id
     g.party = party
     g.party_id = party_id
@@ -15,11 +15,15 @@ import structlog
 from byceps.blueprints.site.snippet.templating import (
     render_snippet_as_partial_from_template,
 )
-from byceps.services.page import page_service
+from byceps.services.page import page_service, rendered_page_cache
 from byceps.services.page.models import Page, PageVersion
 from byceps.services.site_navigation import site_navigation_service
 from byceps.services.site_navigation.models import NavMenuID
-from byceps.util.l10n import get_default_locale, get_locale_str
+from byceps.util.l10n import (
+    get_current_user_locale,
+    get_default_locale,
+    get_locale_str,
+)
 from byceps.util.templating import load_template
 
 
@@ -32,9 +36,7 @@ Context = dict[str, Any]
 def render_page(page: Page, version: PageVersion) -> str | tuple[str, int]:
     """Render the page, or an error page if that fails."""
     try:
-        context = build_template_context(
-            version.title, version.head, version.body
-        )
+        context = _get_rendered_template_context(version)
         context['current_page'] = page.current_page_id
 
         subnav_menu_id = _find_subnav_menu_id(page)
@@ -55,14 +57,26 @@ def render_page(page: Page, version: PageVersion) -> str | tuple[str, int]:
         return render_template('site/page/error.html', **context), 500
 
 
+def _get_rendered_template_context(version: PageVersion) -> Context:
+    # Snippets are rendered in the current user's language.
+    language_code = get_current_user_locale() or get_default_locale()
+
+    return rendered_page_cache.get_context(
+        version.id,
+        language_code,
+        lambda: build_template_context(
+            version.title, version.head, version.body
+        ),
+    )
+
+
 def _find_subnav_menu_id(page: Page) -> NavMenuID | None:
     if page.nav_menu_id:
         return page.nav_menu_id
 
     language_code = get_locale_str() or get_default_locale()
-    return site_navigation_service.find_submenu_id_for_page(
-        g.site_id, language_code, page.name
-    )
+    navigation_index = site_navigation_service.get_index_for_site(g.site_id)
+    return navigation_index.find_submenu_id_for_page(language_code, page.name)
 
 
 def build_template_context(
@@ -102,27 +116,9 @@ def url_for_site_page(site_id: str, name: str, **kwargs) -> str:
     """Render an URL pointing to the page's URL path."""
     # Page name is unique per site.
 
-    url_paths_by_page_name = _get_url_paths_by_page_name(site_id)
+    page_index = page_service.get_index_for_site(site_id)
+    url_paths_by_page_name = page_index.url_paths_by_page_name
 
     url_path = url_paths_by_page_name[name]
 
     return url_for('page.view', url_path=url_path, **kwargs)
-
-
-def _get_url_paths_by_page_name(site_id) -> dict[str, str]:
-    """Return site-specific mapping from page names to URL paths.
-
-    Preferably from request-local cache, if available. From the database
-    if not yet cached.
-    """
-    request_context_key = f'page_url_paths_by_page_name_for_site_{site_id}'
-
-    url_paths_by_page_name_from_request_context = g.get(request_context_key)
-    if url_paths_by_page_name_from_request_context:
-        return url_paths_by_page_name_from_request_context
-    else:
-        url_paths_by_page_name_from_database = (
-            page_service.get_url_paths_by_page_name_for_site(site_id)
-        )
-        setattr(g, request_context_key, url_paths_by_page_name_from_database)
-        return url_paths_by_page_name_from_database
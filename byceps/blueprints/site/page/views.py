@@ -27,19 +27,19 @@ def view(url_path):
     """
     url_path = '/' + url_path
 
-    version = _get_page_version(url_path, get_locale_str())
-    if version is None:
-        version = _get_page_version(url_path, get_default_locale())
+    page_index = page_service.get_index_for_site(g.site_id)
 
-    if version is None:
+    page_and_version = page_index.find_page_and_version_for_url_path(
+        url_path, get_locale_str()
+    )
+    if page_and_version is None:
+        page_and_version = page_index.find_page_and_version_for_url_path(
+            url_path, get_default_locale()
+        )
+
+    if page_and_version is None:
         abort(404)
 
-    page = page_service.get_page(version.page_id)
+    page, version = page_and_version
 
     return render_page(page, version)
-
-
-def _get_page_version(url_path: str, language_code: str):
-    return page_service.find_current_version_for_url_path(
-        g.site_id, url_path, language_code
-    )
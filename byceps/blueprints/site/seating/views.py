@@ -13,6 +13,7 @@ from flask_babel import gettext
 
 from byceps.blueprints.site.site.navigation import subnavigation_for_view
 from byceps.services.seating import (
+    seat_map_service,
     seat_service,
     seating_area_service,
     seating_area_tickets_service,
@@ -84,20 +85,14 @@ def view_area(slug):
 def _render_view_area(area: SeatingArea) -> dict[str, Any]:
     seat_management_enabled = _is_seat_management_enabled()
 
-    seats_with_tickets = seat_service.get_seats_with_tickets_for_area(area.id)
+    seat_map = seat_map_service.get_seat_map(area.id)
 
-    users_by_id = seating_area_tickets_service.get_users(seats_with_tickets, [])
-
-    seats_and_tickets = seating_area_tickets_service.get_seats_and_tickets(
-        seats_with_tickets, users_by_id
-    )
-
-    seat_utilization = seat_service.get_seat_utilization(g.party_id)
+    seat_utilization = seat_map_service.get_seat_utilization(g.party_id)
 
     return {
         'area': area,
         'seat_management_enabled': seat_management_enabled,
-        'seats_and_tickets': seats_and_tickets,
+        'seat_map': seat_map,
         'seat_utilization': seat_utilization,
         'manage_mode': False,
     }
@@ -136,7 +131,7 @@ def manage_seats_in_area(slug):
     elif seat_management_enabled:
         seat_manager_id = g.user.id
 
-    seats_with_tickets = seat_service.get_seats_with_tickets_for_area(area.id)
+    seat_map = seat_map_service.get_seat_map(area.id)
 
     if seat_manager_id is not None:
         tickets = ticket_service.get_tickets_for_seat_manager(
@@ -145,13 +140,7 @@ def manage_seats_in_area(slug):
     else:
         tickets = []
 
-    users_by_id = seating_area_tickets_service.get_users(
-        seats_with_tickets, tickets
-    )
-
-    seats_and_tickets = seating_area_tickets_service.get_seats_and_tickets(
-        seats_with_tickets, users_by_id
-    )
+    users_by_id = seating_area_tickets_service.get_users([], tickets)
 
     if seat_management_enabled:
         managed_tickets = list(
@@ -162,11 +151,11 @@ def manage_seats_in_area(slug):
     else:
         managed_tickets = []
 
-    seat_utilization = seat_service.get_seat_utilization(g.party_id)
+    seat_utilization = seat_map_service.get_seat_utilization(g.party_id)
 
     return {
         'area': area,
-        'seats_and_tickets': seats_and_tickets,
+        'seat_map': seat_map,
         'seat_utilization': seat_utilization,
         'manage_mode': True,
         'seat_management_enabled': seat_management_enabled,
@@ -12,7 +12,6 @@ from flask import abort, g, request
 from flask_babel import gettext
 import structlog
 
-from byceps.services.brand import brand_service
 from byceps.services.email import (
     email_config_service,
     email_footer_service,
@@ -478,7 +477,7 @@ def _send_refund_request_confirmation_email(
 
     screen_name = g.user.screen_name or 'User'
 
-    brand = brand_service.get_brand(g.brand_id)
+    brand = g.brand
     language_code = get_user_locale(g.user)
 
     footer_result = email_footer_service.get_footer(brand, language_code)
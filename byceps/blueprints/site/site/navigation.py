@@ -18,9 +18,8 @@ from byceps.util.l10n import get_default_locale, get_locale_str
 def find_subnav_menu_id(view_name: str) -> NavMenuID | None:
     """Return the ID of the navigation submenu for the view."""
     language_code = get_locale_str() or get_default_locale()
-    return site_navigation_service.find_submenu_id_for_view(
-        g.site_id, language_code, view_name
-    )
+    navigation_index = site_navigation_service.get_index_for_site(g.site_id)
+    return navigation_index.find_submenu_id_for_view(language_code, view_name)
 
 
 def subnavigation_for_view(view_name: str):
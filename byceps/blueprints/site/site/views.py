@@ -30,9 +30,8 @@ def get_nav_menu_items(menu_name: str) -> list[NavItemForRendering]:
     if locale_str is None:  # outside of request
         return []
 
-    items = site_navigation_service.get_items_for_menu(
-        g.site_id, menu_name, locale_str
-    )
+    navigation_index = site_navigation_service.get_index_for_site(g.site_id)
+    items = navigation_index.get_items_for_menu(menu_name, locale_str)
     return _to_items_for_rendering(g.site_id, items)
 
 
@@ -41,7 +40,8 @@ def get_nav_menu_items_for_menu_id(
     menu_id: NavMenuID,
 ) -> list[NavItemForRendering]:
     """Make navigation menus accessible to templates."""
-    items = site_navigation_service.get_items_for_menu_id(menu_id)
+    navigation_index = site_navigation_service.get_index_for_site(g.site_id)
+    items = navigation_index.get_items_for_menu_id(menu_id)
     return _to_items_for_rendering(g.site_id, items)
 
 
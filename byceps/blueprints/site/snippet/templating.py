@@ -6,17 +6,21 @@ byceps.blueprints.site.snippet.templating
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from functools import cache
 from typing import Any
 
 from flask import g
-from jinja2 import Template
+from jinja2 import Environment, Template
 import structlog
 
-from byceps.services.snippet import snippet_service
+from byceps.services.snippet import (
+    snippet_index_service,
+    snippet_template_cache,
+)
 from byceps.services.snippet.dbmodels import DbSnippetVersion
-from byceps.services.snippet.models import SnippetScope
+from byceps.services.snippet.models import CurrentSnippetVersion, SnippetScope
 from byceps.util.l10n import get_current_user_locale, get_default_locale
-from byceps.util.templating import load_template
+from byceps.util.templating import create_sandboxed_environment
 
 
 log = structlog.get_logger()
@@ -25,9 +29,11 @@ log = structlog.get_logger()
 Context = dict[str, Any]
 
 
-def get_rendered_snippet_body(version: DbSnippetVersion) -> str:
+def get_rendered_snippet_body(
+    version: DbSnippetVersion | CurrentSnippetVersion,
+) -> str:
     """Return the rendered body of the snippet."""
-    template = _load_template_with_globals(version.body)
+    template = _get_template(version)
     return template.render()
 
 
@@ -76,7 +82,7 @@ def render_snippet_as_partial(
     if scope is None:
         scope = SnippetScope.for_site(g.site_id)
 
-    current_version = snippet_service.find_current_version_of_snippet_with_name(
+    current_version = snippet_index_service.find_current_version(
         scope, name, language_code
     )
 
@@ -90,7 +96,8 @@ def render_snippet_as_partial(
         context = {}
 
     try:
-        return _render_template(current_version.body, context=context)
+        template = _get_template(current_version)
+        return template.render(**context)
     except Exception as e:
         log.error(
             'Error in snippet markup',
@@ -101,21 +108,20 @@ def render_snippet_as_partial(
         raise e
 
 
-def _render_template(source, *, context: Context | None = None) -> str:
-    template = _load_template_with_globals(source)
-
-    if context is None:
-        context = {}
-
-    return template.render(**context)
-
+def _get_template(
+    version: DbSnippetVersion | CurrentSnippetVersion,
+) -> Template:
+    return snippet_template_cache.get_template(
+        version.id, version.body, _get_environment()
+    )
 
-def _load_template_with_globals(source: str) -> Template:
-    template_globals = {
-        'render_snippet': render_snippet_as_partial_from_template,
-    }
 
-    return load_template(source, template_globals=template_globals)
+@cache
+def _get_environment() -> Environment:
+    """Return the sandboxed environment shared by all snippets."""
+    env = create_sandboxed_environment()
+    env.globals['render_snippet'] = render_snippet_as_partial_from_template
+    return env
 
 
 class SnippetNotFoundException(Exception):
@@ -18,7 +18,10 @@ from .commands.generate_secret_key import generate_secret_key
 from .commands.import_roles import import_roles
 from .commands.import_seats import import_seats
 from .commands.import_users import import_users
+from .commands.index_board_postings import index_board_postings
 from .commands.initialize_database import initialize_database
+from .commands.rebuild_ticket_counts import rebuild_ticket_counts
+from .commands.render_board_postings import render_board_postings
 from .commands.shell import shell
 
 
@@ -35,7 +38,10 @@ for func in [
     import_roles,
     import_seats,
     import_users,
+    index_board_postings,
     initialize_database,
+    rebuild_ticket_counts,
+    render_board_postings,
     shell,
 ]:
     cli.add_command(func)
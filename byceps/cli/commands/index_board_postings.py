@@ -0,0 +1,44 @@
+"""
+byceps.cli.command.index_board_postings
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Build the full-text search documents of board postings that lack an
+up-to-date one.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import click
+from flask.cli import with_appcontext
+
+from byceps.services.board import board_search_service
+from byceps.util.jobqueue import enqueue
+
+
+@click.command()
+@click.option(
+    '--batch-size',
+    type=click.IntRange(min=1),
+    default=500,
+    show_default=True,
+    help='number of postings to index per job',
+)
+@with_appcontext
+def index_board_postings(batch_size: int) -> None:
+    """Enqueue jobs to index board postings for full-text search."""
+    posting_ids = board_search_service.get_ids_of_postings_to_index()
+
+    batches = [
+        posting_ids[i : i + batch_size]
+        for i in range(0, len(posting_ids), batch_size)
+    ]
+
+    for batch in batches:
+        enqueue(board_search_service.index_postings, batch)
+
+    click.secho(
+        f'Enqueued {len(batches)} job(s) to index {len(posting_ids)} '
+        'posting(s).',
+        fg='green',
+    )
@@ -0,0 +1,37 @@
+"""
+byceps.cli.command.rebuild_ticket_counts
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Rebuild the materialized ticket counts from the tickets themselves.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import click
+from flask.cli import with_appcontext
+
+from byceps.services.party import party_service
+from byceps.services.party.models import PartyID
+from byceps.services.ticketing import ticket_count_service
+
+
+@click.command()
+@click.argument('party_ids', nargs=-1)
+@with_appcontext
+def rebuild_ticket_counts(party_ids: tuple[PartyID, ...]) -> None:
+    """Rebuild ticket counts of the given (or else all) parties."""
+    if not party_ids:
+        party_ids = tuple(party.id for party in party_service.get_all_parties())
+
+    for party_id in party_ids:
+        click.echo(
+            f'Rebuilding ticket counts for party "{party_id}" ... ', nl=False
+        )
+        counts = ticket_count_service.rebuild_counts(party_id)
+        click.secho(
+            f'done. {counts.tickets_sold} sold, '
+            f'{counts.tickets_revoked} revoked, '
+            f'{counts.tickets_checked_in} checked in.',
+            fg='green',
+        )
@@ -0,0 +1,45 @@
+"""
+byceps.cli.command.render_board_postings
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Render the bodies of board postings that lack an up-to-date rendering.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import click
+from flask.cli import with_appcontext
+
+from byceps.services.board import board_posting_rendering_service
+from byceps.util.jobqueue import enqueue
+
+
+@click.command()
+@click.option(
+    '--batch-size',
+    type=click.IntRange(min=1),
+    default=500,
+    show_default=True,
+    help='number of postings to render per job',
+)
+@with_appcontext
+def render_board_postings(batch_size: int) -> None:
+    """Enqueue jobs to render board postings as HTML."""
+    posting_ids = (
+        board_posting_rendering_service.get_ids_of_postings_to_render()
+    )
+
+    batches = [
+        posting_ids[i : i + batch_size]
+        for i in range(0, len(posting_ids), batch_size)
+    ]
+
+    for batch in batches:
+        enqueue(board_posting_rendering_service.render_postings, batch)
+
+    click.secho(
+        f'Enqueued {len(batches)} job(s) to render {len(posting_ids)} '
+        'posting(s).',
+        fg='green',
+    )
@@ -8,14 +8,16 @@ Database utilities.
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
+from math import ceil
 from typing import Any, TypeVar
 
 from flask_sqlalchemy import SQLAlchemy
 from flask_sqlalchemy.pagination import Pagination
+from sqlalchemy import DDL, event
 from sqlalchemy.dialects.postgresql import insert, JSONB
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.sql import Select
+from sqlalchemy.sql import ColumnElement, Select
 from sqlalchemy.sql.dml import Insert
 from sqlalchemy.sql.schema import Table
 
@@ -36,6 +38,12 @@ db = SQLAlchemy(model_class=Base)
 db.JSONB = JSONB
 
 
+# Trigram indexes (operator class `gin_trgm_ops`) require this extension.
+event.listen(
+    db.metadata, 'before_create', DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+)
+
+
 def paginate(
     stmt: Select,
     page: int,
@@ -54,6 +62,115 @@ def paginate(
     return pagination
 
 
+class PrecountedPagination:
+    """A page of items whose total has been determined separately.
+
+    Offers the same interface to templates as Flask-SQLAlchemy's
+    pagination.
+    """
+
+    def __init__(
+        self, page: int, per_page: int, total: int, items: list[Any]
+    ) -> None:
+        self.page = page
+        self.per_page = per_page
+        self.total = total
+        self.items = items
+
+    @property
+    def pages(self) -> int:
+        """The total number of pages."""
+        return ceil(self.total / self.per_page) if self.total else 0
+
+    @property
+    def has_prev(self) -> bool:
+        return self.page > 1
+
+    @property
+    def prev_num(self) -> int | None:
+        return self.page - 1 if self.has_prev else None
+
+    @property
+    def has_next(self) -> bool:
+        return self.page < self.pages
+
+    @property
+    def next_num(self) -> int | None:
+        return self.page + 1 if self.has_next else None
+
+    def iter_pages(
+        self,
+        *,
+        left_edge: int = 2,
+        left_current: int = 2,
+        right_current: int = 4,
+        right_edge: int = 2,
+    ) -> Iterator[int | None]:
+        """Yield page numbers for a pagination widget, with `None` in
+        place of skipped pages.
+        """
+        pages_end = self.pages + 1
+        if pages_end == 1:
+            return
+
+        left_end = min(1 + left_edge, pages_end)
+        yield from range(1, left_end)
+        if left_end == pages_end:
+            return
+
+        mid_start = max(left_end, self.page - left_current)
+        mid_end = min(self.page + right_current + 1, pages_end)
+        if mid_start > left_end:
+            yield None
+        yield from range(mid_start, mid_end)
+        if mid_end == pages_end:
+            return
+
+        right_start = max(mid_end, pages_end - right_edge)
+        if right_start > mid_end:
+            yield None
+        yield from range(right_start, pages_end)
+
+    def __iter__(self) -> Iterator[Any]:
+        yield from self.items
+
+
+def paginate_without_count(
+    stmt: Select,
+    page: int,
+    per_page: int,
+    total: int,
+    *,
+    keyset_condition: ColumnElement[bool] | None = None,
+    item_mapper: Mapper | None = None,
+) -> PrecountedPagination:
+    """Return `per_page` items from page `page`.
+
+    Instead of counting the items, their total has to be passed (e.g.
+    from a maintained aggregate).
+
+    If given, the keyset condition (which has to select the items that
+    follow the previous page's last item in the statement's order) is
+    used instead of an offset, which gets slow for high page numbers as
+    all preceding rows have to be skipped.
+    """
+    page = max(page, 1)
+
+    if keyset_condition is not None:
+        stmt = stmt.filter(keyset_condition)
+    else:
+        stmt = stmt.offset((page - 1) * per_page)
+
+    stmt = stmt.limit(per_page)
+
+    items = list(db.session.execute(stmt).unique().scalars())
+
+    if item_mapper is not None:
+        items = [item_mapper(item) for item in items]
+
+    return PrecountedPagination(page, per_page, total, items)
+
+
 def insert_ignore_on_conflict(table: Table, values: dict[str, Any]) -> None:
     """Insert the record identified by the primary key (specified as
     part of the values), or do nothing on conflict.
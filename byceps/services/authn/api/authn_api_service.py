@@ -6,6 +6,7 @@ byceps.services.authn.api.authn_api_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from hashlib import sha256
 from uuid import UUID
 
 from sqlalchemy import delete, select
@@ -13,12 +14,18 @@ from sqlalchemy import delete, select
 from byceps.database import db
 from byceps.services.authz.models import PermissionID
 from byceps.services.user.models.user import UserID
+from byceps.util.cache import VersionedCache
 
 from . import authn_api_domain_service
 from .dbmodels import DbApiToken
 from .models import ApiToken
 
 
+_api_token_cache: VersionedCache[str, ApiToken] = VersionedCache(
+    'api-token', max_size=1000
+)
+
+
 def create_api_token(
     creator_id: UserID,
     permissions: set[PermissionID],
@@ -61,6 +68,25 @@ def find_api_token_by_token(token: str) -> ApiToken | None:
     return _db_entity_to_api_token(db_api_token)
 
 
+def find_api_token_by_token_cached(token: str) -> ApiToken | None:
+    """Return the API token for that token, or nothing if not found.
+
+    Serve the API token from a bounded, process-local cache, indexed by
+    the token's digest. The cache is invalidated in all processes
+    whenever an API token is suspended, unsuspended, or deleted.
+
+    Unknown tokens are not cached so that requests with made-up tokens
+    cannot evict known ones.
+    """
+    token_digest = sha256(token.encode()).hexdigest()
+
+    def load(_: set[str]) -> dict[str, ApiToken]:
+        api_token = find_api_token_by_token(token)
+        return {token_digest: api_token} if (api_token is not None) else {}
+
+    return _api_token_cache.get_many({token_digest}, load).get(token_digest)
+
+
 def get_all_api_tokens() -> list[ApiToken]:
     """Return all API tokens."""
     db_api_tokens = db.session.scalars(select(DbApiToken)).unique().all()
@@ -76,6 +102,8 @@ def suspend_api_token(api_token_id: UUID) -> None:
     db_api_token.suspended = True
     db.session.commit()
 
+    _api_token_cache.invalidate()
+
 
 def unsuspend_api_token(api_token_id: UUID) -> None:
     """Unsuspend the API token."""
@@ -83,6 +111,8 @@ def unsuspend_api_token(api_token_id: UUID) -> None:
     db_api_token.suspended = False
     db.session.commit()
 
+    _api_token_cache.invalidate()
+
 
 def _get_db_api_token(api_token_id: UUID) -> DbApiToken:
     db_api_token = db.session.get(DbApiToken, api_token_id)
@@ -102,6 +132,8 @@ def delete_api_token(api_token_id: UUID) -> None:
     )
     db.session.commit()
 
+    _api_token_cache.invalidate()
+
 
 def _db_entity_to_api_token(db_api_token: DbApiToken) -> ApiToken:
     return ApiToken(
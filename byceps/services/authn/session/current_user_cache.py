@@ -0,0 +1,140 @@
+"""
+byceps.services.authn.session.current_user_cache
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Short-lived cache, stored in Redis, for users that have been
+identified by ID and authentication token, including the permissions
+they have been granted.
+
+Entries of a user are kept in a Redis hash, one field per
+authentication token (as a digest), so that all of them can be
+discarded at once.
+
+Invalidate a user's entries whenever something changes that would
+affect the outcome of identifying that user (logout, password change,
+suspension, deletion, role (de)assignment, screen name, locale, or
+avatar update).
+
+Each entry records the version of the authorization index the
+permissions have been taken from. An entry is only returned for the
+version that is current, so that permissions written by a process that
+has not yet noticed a change to roles do not come back.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from hashlib import sha256
+import json
+from uuid import UUID
+
+from flask import current_app
+
+from byceps.services.user.models.user import User, UserID
+
+
+TTL_IN_SECONDS = 60
+
+_KEY_PREFIX = 'byceps:current-user:'
+
+
+def find_user_with_permissions(
+    user_id: UserID, auth_token: str, permissions_version: int
+) -> tuple[User, frozenset[str]] | None:
+    """Return the cached user and permissions, if available for that
+    version of the authorization index.
+    """
+    key = _get_key(user_id)
+    field = _get_field(auth_token)
+
+    value = _get_redis_client().hget(key, field)
+    if value is None:
+        return None
+
+    user, permissions, cached_permissions_version = _deserialize(value)
+    if cached_permissions_version != permissions_version:
+        return None
+
+    return user, permissions
+
+
+def store_user_with_permissions(
+    user: User,
+    auth_token: str,
+    permissions: frozenset[str],
+    permissions_version: int,
+) -> None:
+    """Cache the user, identified by that authentication token, and
+    their permissions, taken from that version of the authorization
+    index.
+    """
+    key = _get_key(user.id)
+    field = _get_field(auth_token)
+    value = _serialize(user, permissions, permissions_version)
+
+    pipeline = _get_redis_client().pipeline()
+    pipeline.hset(key, field, value)
+    pipeline.expire(key, TTL_IN_SECONDS)
+    pipeline.execute()
+
+
+def invalidate_user(user_id: UserID) -> None:
+    """Discard all cached entries for the user."""
+    _get_redis_client().delete(_get_key(user_id))
+
+
+def invalidate_all_users() -> None:
+    """Discard all cached entries for all users."""
+    redis_client = _get_redis_client()
+
+    keys = list(redis_client.scan_iter(match=f'{_KEY_PREFIX}*', count=1000))
+    if keys:
+        redis_client.delete(*keys)
+
+
+def _get_key(user_id: UserID) -> str:
+    return f'{_KEY_PREFIX}{user_id}'
+
+
+def _get_field(auth_token: str) -> str:
+    return sha256(auth_token.encode()).hexdigest()
+
+
+def _serialize(
+    user: User, permissions: frozenset[str], permissions_version: int
+) -> str:
+    return json.dumps(
+        {
+            'id': str(user.id),
+            'screen_name': user.screen_name,
+            'initialized': user.initialized,
+            'suspended': user.suspended,
+            'deleted': user.deleted,
+            'locale': user.locale,
+            'avatar_url': user.avatar_url,
+            'permissions': sorted(permissions),
+            'permissions_version': permissions_version,
+        }
+    )
+
+
+def _deserialize(value: bytes | str) -> tuple[User, frozenset[str], int]:
+    data = json.loads(value)
+
+    user = User(
+        id=UserID(UUID(data['id'])),
+        screen_name=data['screen_name'],
+        initialized=data['initialized'],
+        suspended=data['suspended'],
+        deleted=data['deleted'],
+        locale=data['locale'],
+        avatar_url=data['avatar_url'],
+    )
+    permissions = frozenset(data['permissions'])
+    permissions_version = data['permissions_version']
+
+    return user, permissions, permissions_version
+
+
+def _get_redis_client():
+    return current_app.redis_client
@@ -17,14 +17,21 @@ from byceps.events.authz import (
     RoleAssignedToUserEvent,
     RoleDeassignedFromUserEvent,
 )
-from byceps.services.user import user_log_service, user_service
+from byceps.services.authn.session import current_user_cache
+from byceps.services.user import user_log_service
 from byceps.services.user.models.log import UserLogEntry
 from byceps.services.user.models.user import User, UserID
+from byceps.util.cache import VersionedCache
 from byceps.util.result import Err, Ok, Result
 
 from . import authz_domain_service
 from .dbmodels import DbRole, DbRolePermission, DbUserRole
-from .models import PermissionID, Role, RoleID
+from .models import AuthzIndex, PermissionID, Role, RoleID
+
+
+_INDEX_CACHE_KEY = 'all'
+
+_index_cache: VersionedCache[str, AuthzIndex] = VersionedCache('authz-index')
 
 
 def create_role(role_id: RoleID, title: str) -> Result[Role, IntegrityError]:
@@ -39,6 +46,8 @@ def create_role(role_id: RoleID, title: str) -> Result[Role, IntegrityError]:
         db.session.rollback()
         return Err(e)
 
+    invalidate_index()
+
     return Ok(db_role).map(_db_entity_to_role)
 
 
@@ -50,6 +59,9 @@ def delete_role(role_id: RoleID) -> None:
     db.session.execute(delete(DbRole).where(DbRole.id == role_id))
     db.session.commit()
 
+    invalidate_index()
+    current_user_cache.invalidate_all_users()
+
 
 def find_role(role_id: RoleID) -> Role | None:
     """Return the role with that id, or `None` if not found."""
@@ -94,6 +106,9 @@ def assign_permission_to_role(
     db.session.add(db_role_permission)
     db.session.commit()
 
+    invalidate_index()
+    current_user_cache.invalidate_all_users()
+
 
 def deassign_permission_from_role(
     permission_id: PermissionID, role_id: RoleID
@@ -109,6 +124,9 @@ def deassign_permission_from_role(
     db.session.delete(db_role_permission)
     db.session.commit()
 
+    invalidate_index()
+    current_user_cache.invalidate_all_users()
+
     return Ok(None)
 
 
@@ -140,6 +158,9 @@ def _persist_role_assignment_to_user(
 
     db.session.commit()
 
+    invalidate_index()
+    current_user_cache.invalidate_user(user.id)
+
 
 def deassign_role_from_user(
     role_id: RoleID, user: User, *, initiator: User | None = None
@@ -162,6 +183,8 @@ def deassign_role_from_user(
 def _persist_role_deassignment_from_user(
     db_user_role: DbUserRole, log_entry: UserLogEntry
 ) -> None:
+    user_id = db_user_role.user_id
+
     db.session.delete(db_user_role)
 
     db_log_entry = user_log_service.to_db_entry(log_entry)
@@ -169,15 +192,23 @@ def _persist_role_deassignment_from_user(
 
     db.session.commit()
 
+    invalidate_index()
+    current_user_cache.invalidate_user(user_id)
+
 
 def deassign_all_roles_from_user(
     user: User, *, initiator: User | None = None, commit: bool = True
 ) -> None:
-    """Deassign all roles from the user."""
+    """Deassign all roles from the user.
+
+    If not committing here, call `invalidate_index` after committing.
+    """
     db.session.execute(delete(DbUserRole).where(DbUserRole.user_id == user.id))
 
     if commit:
         db.session.commit()
+        invalidate_index()
+        current_user_cache.invalidate_user(user.id)
 
 
 def _is_role_assigned_to_user(role_id: RoleID, user_id: UserID) -> bool:
@@ -235,37 +266,6 @@ def get_all_role_ids() -> set[RoleID]:
     return set(role_ids)
 
 
-def get_all_roles_with_permissions_and_users() -> (
-    list[tuple[Role, set[PermissionID], set[User]]]
-):
-    """Return all roles with titles, permission IDs, and assigned users."""
-    db_roles = (
-        db.session.scalars(
-            select(DbRole).options(
-                db.undefer(DbRole.title),
-                db.joinedload(DbRole.user_roles).joinedload(DbUserRole.user),
-            )
-        )
-        .unique()
-        .all()
-    )
-
-    return [
-        (
-            _db_entity_to_role(db_role),
-            {
-                db_role_permission.permission_id
-                for db_role_permission in db_role.role_permissions
-            },
-            {
-                user_service._db_entity_to_user(db_user)
-                for db_user in db_role.users
-            },
-        )
-        for db_role in db_roles
-    ]
-
-
 def get_permission_ids_by_role() -> dict[Role, frozenset[PermissionID]]:
     """Return all roles with their assigned permission IDs.
 
@@ -349,6 +349,84 @@ def get_permission_ids_for_role(role_id: RoleID) -> set[PermissionID]:
     return {PermissionID(permission_id) for permission_id in permission_ids}
 
 
+def get_index() -> AuthzIndex:
+    """Return the index of roles, their permissions, and their users.
+
+    The index is loaded once per process and kept until roles or their
+    assignments change.
+    """
+    return _index_cache.get(_INDEX_CACHE_KEY, _load_index)
+
+
+def get_index_with_version() -> tuple[AuthzIndex, int]:
+    """Return the index of roles, their permissions, and their users,
+    and the version it has been loaded for.
+    """
+    return _index_cache.get_with_version(_INDEX_CACHE_KEY, _load_index)
+
+
+def get_current_index_version() -> int:
+    """Return the version of the index that is current in all
+    processes.
+    """
+    return _index_cache.get_shared_version()
+
+
+def invalidate_index() -> None:
+    """Have the index be reloaded, in all processes."""
+    _index_cache.invalidate()
+
+
+def _load_index(_: str) -> AuthzIndex:
+    db_roles = db.session.scalars(
+        select(DbRole).options(db.undefer(DbRole.title))
+    ).all()
+
+    role_ids_and_permission_ids = (
+        db.session.execute(
+            select(DbRolePermission.role_id, DbRolePermission.permission_id)
+        )
+        .tuples()
+        .all()
+    )
+
+    user_ids_and_role_ids = (
+        db.session.execute(select(DbUserRole.user_id, DbUserRole.role_id))
+        .tuples()
+        .all()
+    )
+
+    roles_by_id = {
+        db_role.id: _db_entity_to_role(db_role) for db_role in db_roles
+    }
+
+    permission_ids_by_role_id = defaultdict(set)
+    for role_id, permission_id in role_ids_and_permission_ids:
+        permission_ids_by_role_id[role_id].add(permission_id)
+
+    role_ids_by_user_id = defaultdict(set)
+    user_ids_by_role_id = defaultdict(set)
+    for user_id, role_id in user_ids_and_role_ids:
+        role_ids_by_user_id[user_id].add(role_id)
+        user_ids_by_role_id[role_id].add(user_id)
+
+    return AuthzIndex(
+        roles_by_id=roles_by_id,
+        permission_ids_by_role_id={
+            role_id: frozenset(permission_ids)
+            for role_id, permission_ids in permission_ids_by_role_id.items()
+        },
+        role_ids_by_user_id={
+            user_id: frozenset(role_ids)
+            for user_id, role_ids in role_ids_by_user_id.items()
+        },
+        user_ids_by_role_id={
+            role_id: frozenset(user_ids)
+            for role_id, user_ids in user_ids_by_role_id.items()
+        },
+    )
+
+
 def _db_entity_to_role(db_role: DbRole) -> Role:
     return Role(
         id=db_role.id,
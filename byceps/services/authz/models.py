@@ -9,6 +9,8 @@ byceps.services.authz.models
 from dataclasses import dataclass
 from typing import NewType
 
+from byceps.services.user.models.user import UserID
+
 
 PermissionID = NewType('PermissionID', str)
 
@@ -26,3 +28,40 @@ class Permission:
 class Role:
     id: RoleID
     title: str
+
+
+@dataclass(frozen=True)
+class AuthzIndex:
+    """All roles, and the permissions and users assigned to them."""
+
+    roles_by_id: dict[RoleID, Role]
+    permission_ids_by_role_id: dict[RoleID, frozenset[PermissionID]]
+    role_ids_by_user_id: dict[UserID, frozenset[RoleID]]
+    user_ids_by_role_id: dict[RoleID, frozenset[UserID]]
+
+    def get_role_ids_for_user(self, user_id: UserID) -> frozenset[RoleID]:
+        """Return the IDs of the roles assigned to the user."""
+        return self.role_ids_by_user_id.get(user_id, frozenset())
+
+    def get_permission_ids_for_role(
+        self, role_id: RoleID
+    ) -> frozenset[PermissionID]:
+        """Return the IDs of the permissions assigned to the role."""
+        return self.permission_ids_by_role_id.get(role_id, frozenset())
+
+    def get_permission_ids_for_user(
+        self, user_id: UserID
+    ) -> frozenset[PermissionID]:
+        """Return the IDs of all permissions the user has through the
+        roles assigned to it.
+        """
+        return frozenset().union(
+            *(
+                self.get_permission_ids_for_role(role_id)
+                for role_id in self.get_role_ids_for_user(user_id)
+            )
+        )
+
+    def get_user_ids_for_role(self, role_id: RoleID) -> frozenset[UserID]:
+        """Return the IDs of the users that have the role assigned."""
+        return self.user_ids_by_role_id.get(role_id, frozenset())
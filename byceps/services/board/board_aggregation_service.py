@@ -2,6 +2,13 @@
 byceps.services.board.board_aggregation_service
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+Topics and categories carry denormalized counts and latest-posting
+fields.
+
+Writes adjust them incrementally, by deltas, within the same
+transaction as the change itself. The `aggregate_*` functions recount
+them from scratch and are meant to repair aggregates that have drifted.
+
 :Copyright: 2014-2024 Jochen Kupperschmidt
 :License: Revised BSD (see `LICENSE` file for details)
 """
@@ -9,7 +16,7 @@ byceps.services.board.board_aggregation_service
 from dataclasses import dataclass
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import case, or_, select
 
 from byceps.database import db
 from byceps.services.user.models.user import UserID
@@ -17,7 +24,7 @@ from byceps.services.user.models.user import UserID
 from .dbmodels.category import DbBoardCategory
 from .dbmodels.posting import DbPosting
 from .dbmodels.topic import DbTopic
-from .models import BoardCategoryID, TopicID
+from .models import BoardCategoryID, BoardID, TopicID
 
 
 @dataclass(frozen=True)
@@ -26,14 +33,224 @@ class LatestPostingInfo:
     creator_id: UserID
 
 
-def aggregate_category(db_category: DbBoardCategory) -> None:
-    """Update the category's count and latest fields."""
+# -------------------------------------------------------------------- #
+# incremental adjustment
+
+
+def add_topic(db_topic: DbTopic, db_initial_posting: DbPosting) -> None:
+    """Account for a newly created topic and its initial posting.
+
+    The topic and posting must have been flushed already.
+    """
+    latest_posting_info = _to_latest_posting_info(db_initial_posting)
+
+    _adjust_topic(db_topic, 1, latest_posting_info)
+    _adjust_category(db_topic.category, 1, 1, latest_posting_info)
+
+
+def add_posting(db_posting: DbPosting) -> None:
+    """Account for a posting that has been created or made visible.
+
+    The posting must have been flushed already.
+    """
+    db_topic = db_posting.topic
+    latest_posting_info = _to_latest_posting_info(db_posting)
+
+    _adjust_topic(db_topic, 1, latest_posting_info)
+
+    if not db_topic.hidden:
+        _adjust_category(db_topic.category, 0, 1, latest_posting_info)
+
+
+def remove_posting(db_posting: DbPosting) -> None:
+    """Account for a posting that has been hidden."""
+    db_topic = db_posting.topic
+
+    _adjust_topic(db_topic, -1, None)
+    _set_topic_latest(db_topic, _get_topic_latest_posting_info(db_topic.id))
+
+    if not db_topic.hidden:
+        db_category = db_topic.category
+        _adjust_category(db_category, 0, -1, None)
+        _set_category_latest(
+            db_category, _get_category_latest_topic_info(db_category.id)
+        )
+
+
+def add_topic_to_category(
+    db_topic: DbTopic, db_category: DbBoardCategory
+) -> None:
+    """Account for a visible topic that has been unhidden in, or moved
+    to, the category.
+    """
+    latest_posting_info = _to_topic_latest_posting_info(db_topic)
+
+    _adjust_category(
+        db_category, 1, db_topic.posting_count, latest_posting_info
+    )
+
+
+def remove_topic_from_category(
+    db_topic: DbTopic, db_category: DbBoardCategory
+) -> None:
+    """Account for a formerly visible topic that has been hidden in, or
+    moved away from, the category.
+
+    The topic must have been hidden or moved already.
+    """
+    _adjust_category(db_category, -1, -db_topic.posting_count, None)
+    _set_category_latest(
+        db_category, _get_category_latest_topic_info(db_category.id)
+    )
+
+
+def _adjust_topic(
+    db_topic: DbTopic,
+    posting_delta: int,
+    latest_posting_info: LatestPostingInfo | None,
+) -> None:
+    """Adjust the topic's count by a delta, and its latest fields if the
+    given posting is newer.
+
+    The changes are expressed in SQL so that concurrent adjustments do
+    not overwrite each other.
+    """
+    db_topic.posting_count = DbTopic.posting_count + posting_delta
+
+    if latest_posting_info is None:
+        return
+
+    is_newer = or_(
+        DbTopic.last_updated_at.is_(None),
+        DbTopic.last_updated_at < latest_posting_info.created_at,
+    )
+    db_topic.last_updated_at = case(
+        (is_newer, latest_posting_info.created_at),
+        else_=DbTopic.last_updated_at,
+    )
+    db_topic.last_updated_by_id = case(
+        (is_newer, latest_posting_info.creator_id),
+        else_=DbTopic.last_updated_by_id,
+    )
+
+
+def _adjust_category(
+    db_category: DbBoardCategory,
+    topic_delta: int,
+    posting_delta: int,
+    latest_posting_info: LatestPostingInfo | None,
+) -> None:
+    """Adjust the category's counts by deltas, and its latest fields if
+    the given posting is newer.
+
+    The changes are expressed in SQL so that concurrent adjustments do
+    not overwrite each other.
+    """
+    db_category.topic_count = DbBoardCategory.topic_count + topic_delta
+    db_category.posting_count = DbBoardCategory.posting_count + posting_delta
+
+    if latest_posting_info is None:
+        return
+
+    is_newer = or_(
+        DbBoardCategory.last_posting_updated_at.is_(None),
+        DbBoardCategory.last_posting_updated_at
+        < latest_posting_info.created_at,
+    )
+    db_category.last_posting_updated_at = case(
+        (is_newer, latest_posting_info.created_at),
+        else_=DbBoardCategory.last_posting_updated_at,
+    )
+    db_category.last_posting_updated_by_id = case(
+        (is_newer, latest_posting_info.creator_id),
+        else_=DbBoardCategory.last_posting_updated_by_id,
+    )
+
+
+def _get_category_latest_topic_info(
+    category_id: BoardCategoryID,
+) -> LatestPostingInfo | None:
+    """Return the latest posting info of the category's visible topics.
+
+    Relies on the topics' aggregates instead of scanning postings.
+    """
+    row = db.session.execute(
+        select(DbTopic.last_updated_at, DbTopic.last_updated_by_id)
+        .filter(DbTopic.category_id == category_id)
+        .filter(DbTopic.hidden == False)  # noqa: E712
+        .filter(DbTopic.posting_count > 0)
+        .filter(DbTopic.last_updated_at.is_not(None))
+        .order_by(DbTopic.last_updated_at.desc())
+        .limit(1)
+    ).first()
+
+    if row is None:
+        return None
+
+    created_at, creator_id = row
+    return LatestPostingInfo(created_at=created_at, creator_id=creator_id)
+
+
+def _to_latest_posting_info(db_posting: DbPosting) -> LatestPostingInfo:
+    return LatestPostingInfo(
+        created_at=db_posting.created_at,
+        creator_id=db_posting.creator_id,
+    )
+
+
+def _to_topic_latest_posting_info(
+    db_topic: DbTopic,
+) -> LatestPostingInfo | None:
+    if db_topic.posting_count == 0 or db_topic.last_updated_at is None:
+        return None
+
+    return LatestPostingInfo(
+        created_at=db_topic.last_updated_at,
+        creator_id=db_topic.last_updated_by_id,
+    )
+
+
+# -------------------------------------------------------------------- #
+# full recount
+
+
+def aggregate_board(board_id: BoardID) -> None:
+    """Recount all topics and categories of the board.
+
+    Intended to be run in the job queue worker.
+    """
+    db_categories = db.session.scalars(
+        select(DbBoardCategory).filter_by(board_id=board_id)
+    ).all()
+
+    for db_category in db_categories:
+        db_topics = db.session.scalars(
+            select(DbTopic).filter_by(category_id=db_category.id)
+        ).all()
+
+        for db_topic in db_topics:
+            _aggregate_topic(db_topic)
+
+        _aggregate_category(db_category)
+
+        # Keep transactions (and row locks) per category short.
+        db.session.commit()
+
+
+def _aggregate_category(db_category: DbBoardCategory) -> None:
     topic_count = _get_category_topic_count(db_category.id)
     posting_count = _get_category_posting_count(db_category.id)
     latest_posting_info = _get_category_latest_posting_info(db_category.id)
 
     db_category.topic_count = topic_count
     db_category.posting_count = posting_count
+    _set_category_latest(db_category, latest_posting_info)
+
+
+def _set_category_latest(
+    db_category: DbBoardCategory,
+    latest_posting_info: LatestPostingInfo | None,
+) -> None:
     db_category.last_posting_updated_at = (
         latest_posting_info.created_at if latest_posting_info else None
     )
@@ -41,8 +258,6 @@ def aggregate_category(db_category: DbBoardCategory) -> None:
         latest_posting_info.creator_id if latest_posting_info else None
     )
 
-    db.session.commit()
-
 
 def _get_category_topic_count(category_id: BoardCategoryID) -> int:
     topic_count = db.session.scalar(
@@ -85,12 +300,17 @@ def _get_category_latest_posting_info(
     )
 
 
-def aggregate_topic(db_topic: DbTopic) -> None:
-    """Update the topic's count and latest fields."""
+def _aggregate_topic(db_topic: DbTopic) -> None:
     posting_count = _get_topic_posting_count(db_topic.id)
     latest_posting_info = _get_topic_latest_posting_info(db_topic.id)
 
     db_topic.posting_count = posting_count
+    _set_topic_latest(db_topic, latest_posting_info)
+
+
+def _set_topic_latest(
+    db_topic: DbTopic, latest_posting_info: LatestPostingInfo | None
+) -> None:
     db_topic.last_updated_at = (
         latest_posting_info.created_at if latest_posting_info else None
     )
@@ -98,10 +318,6 @@ def aggregate_topic(db_topic: DbTopic) -> None:
         latest_posting_info.creator_id if latest_posting_info else None
     )
 
-    db.session.commit()
-
-    aggregate_category(db_topic.category)
-
 
 def _get_topic_posting_count(topic_id: TopicID) -> int:
     posting_count = db.session.scalar(
@@ -0,0 +1,56 @@
+"""
+byceps.services.board.board_author_decoration_cache
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+The process-local caches for what decorates the authors of postings.
+
+They are kept apart from the service that fills them so that the
+services changing orga team memberships, ticket users, and badges can
+discard them without importing that service (and, through it, each
+other).
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.party.models import PartyID
+from byceps.services.user.models.user import UserID
+from byceps.services.user_badge.models import Badge
+from byceps.util.cache import VersionedCache
+
+
+orga_ids_cache: VersionedCache[PartyID, frozenset[UserID]] = VersionedCache(
+    'board-author-orga-ids'
+)
+
+ticket_user_ids_cache: VersionedCache[PartyID, frozenset[UserID]] = (
+    VersionedCache('board-author-ticket-user-ids')
+)
+
+featured_badges_cache: VersionedCache[UserID, frozenset[Badge]] = (
+    VersionedCache('board-author-featured-badges', max_size=10_000)
+)
+
+
+def invalidate_orga_ids() -> None:
+    """Discard the cached organizers.
+
+    Call after orga team memberships have changed.
+    """
+    orga_ids_cache.invalidate()
+
+
+def invalidate_ticket_user_ids() -> None:
+    """Discard the cached ticket users.
+
+    Call after tickets have been (re)assigned to users or revoked.
+    """
+    ticket_user_ids_cache.invalidate()
+
+
+def invalidate_featured_badges() -> None:
+    """Discard the cached badges.
+
+    Call after badges have been awarded or changed.
+    """
+    featured_badges_cache.invalidate()
@@ -0,0 +1,102 @@
+"""
+byceps.services.board.board_author_decoration_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Provide what decorates the authors of postings (orga status, party
+ticket, featured badges) from process-local caches so that a topic
+page does not have to query for them on every view.
+
+The caches are discarded (in all processes) by the services that change
+orga team memberships, ticket users, and badges. Ticket sales, order
+cancelations, and badge awardings are picked up through their signals
+once `connect_signals` has been called.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Iterable
+
+from byceps.events.shop import ShopOrderCanceledEvent
+from byceps.events.ticketing import TicketsSoldEvent
+from byceps.events.user_badge import UserBadgeAwardedEvent
+from byceps.services.orga_team import orga_team_service
+from byceps.services.party.models import PartyID
+from byceps.services.ticketing import ticket_service
+from byceps.services.user.models.user import UserID
+from byceps.services.user_badge import user_badge_awarding_service
+from byceps.services.user_badge.models import Badge
+from byceps.signals.shop import order_canceled
+from byceps.signals.ticketing import tickets_sold
+from byceps.signals.user_badge import user_badge_awarded
+
+from . import board_author_decoration_cache
+
+
+def get_orga_ids(party_id: PartyID) -> frozenset[UserID]:
+    """Return the IDs of the party's organizers."""
+    return board_author_decoration_cache.orga_ids_cache.get(
+        party_id, _load_orga_ids
+    )
+
+
+def _load_orga_ids(party_id: PartyID) -> frozenset[UserID]:
+    return frozenset(orga_team_service.get_orga_ids_for_party(party_id))
+
+
+def get_ticket_user_ids(party_id: PartyID) -> frozenset[UserID]:
+    """Return the IDs of the users of tickets for the party."""
+    return board_author_decoration_cache.ticket_user_ids_cache.get(
+        party_id, _load_ticket_user_ids
+    )
+
+
+def _load_ticket_user_ids(party_id: PartyID) -> frozenset[UserID]:
+    return frozenset(ticket_service.get_ticket_users_for_party(party_id))
+
+
+def get_featured_badges(
+    user_ids: Iterable[UserID],
+) -> dict[UserID, frozenset[Badge]]:
+    """Return the featured badges awarded to the users, regardless of
+    brand.
+    """
+    return board_author_decoration_cache.featured_badges_cache.get_many(
+        user_ids, _load_featured_badges
+    )
+
+
+def _load_featured_badges(
+    user_ids: set[UserID],
+) -> dict[UserID, frozenset[Badge]]:
+    badges_by_user_id = user_badge_awarding_service.get_badges_awarded_to_users(
+        user_ids, featured_only=True
+    )
+
+    # Also cache that users have no featured badges.
+    return {
+        user_id: frozenset(badges_by_user_id.get(user_id, set()))
+        for user_id in user_ids
+    }
+
+
+def connect_signals() -> None:
+    """Discard cached decorations when tickets are sold, orders are
+    canceled, or badges are awarded.
+    """
+    tickets_sold.connect(_on_tickets_sold)
+    order_canceled.connect(_on_order_canceled)
+    user_badge_awarded.connect(_on_user_badge_awarded)
+
+
+def _on_tickets_sold(sender, *, event: TicketsSoldEvent) -> None:
+    board_author_decoration_cache.invalidate_ticket_user_ids()
+
+
+def _on_order_canceled(sender, *, event: ShopOrderCanceledEvent) -> None:
+    # Tickets (and bundles) of canceled orders are revoked.
+    board_author_decoration_cache.invalidate_ticket_user_ids()
+
+
+def _on_user_badge_awarded(sender, *, event: UserBadgeAwardedEvent) -> None:
+    board_author_decoration_cache.invalidate_featured_badges()
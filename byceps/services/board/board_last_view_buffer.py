@@ -0,0 +1,197 @@
+"""
+byceps.services.board.board_last_view_buffer
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Buffer users' views of topics and categories in Redis until they are
+written to the database in bulk.
+
+Per user, there is a sorted set for topic views and one for category
+views, with the time of the view as score. Adding with `GT` keeps the
+latest view time without a read-modify-write cycle.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Iterable
+from datetime import datetime, UTC
+from uuid import UUID
+
+from flask import current_app
+from redis import Redis
+
+from byceps.services.user.models.user import UserID
+
+from .models import BoardCategoryID, TopicID
+
+
+_KEY_PREFIX = 'byceps:board:last_views'
+_USER_IDS_KEY = f'{_KEY_PREFIX}:users'
+_FLUSH_SCHEDULED_KEY = f'{_KEY_PREFIX}:flush_scheduled'
+
+
+# -------------------------------------------------------------------- #
+# recording
+
+
+def record_topic_view(
+    user_id: UserID, topic_id: TopicID, occurred_at: datetime
+) -> None:
+    """Buffer the user's view of the topic."""
+    _record_view(_get_topic_views_key(user_id), user_id, topic_id, occurred_at)
+
+
+def record_category_view(
+    user_id: UserID, category_id: BoardCategoryID, occurred_at: datetime
+) -> None:
+    """Buffer the user's view of the category."""
+    _record_view(
+        _get_category_views_key(user_id), user_id, category_id, occurred_at
+    )
+
+
+def _record_view(
+    key: str, user_id: UserID, target_id: UUID, occurred_at: datetime
+) -> None:
+    pipeline = _get_redis().pipeline()
+    pipeline.zadd(key, {str(target_id): _to_score(occurred_at)}, gt=True)
+    pipeline.sadd(_USER_IDS_KEY, str(user_id))
+    pipeline.execute()
+
+
+# -------------------------------------------------------------------- #
+# reading
+
+
+def get_topic_views(
+    user_id: UserID, topic_ids: Iterable[TopicID]
+) -> dict[TopicID, datetime]:
+    """Return the buffered times the user viewed the topics.
+
+    Topics without a buffered view are omitted.
+    """
+    return _get_views(_get_topic_views_key(user_id), topic_ids)
+
+
+def get_category_views(
+    user_id: UserID, category_ids: Iterable[BoardCategoryID]
+) -> dict[BoardCategoryID, datetime]:
+    """Return the buffered times the user viewed the categories.
+
+    Categories without a buffered view are omitted.
+    """
+    return _get_views(_get_category_views_key(user_id), category_ids)
+
+
+def _get_views(key: str, target_ids: Iterable) -> dict:
+    target_ids = list(target_ids)
+    if not target_ids:
+        return {}
+
+    scores = _get_redis().zmscore(
+        key, [str(target_id) for target_id in target_ids]
+    )
+
+    return {
+        target_id: _from_score(score)
+        for target_id, score in zip(target_ids, scores, strict=True)
+        if score is not None
+    }
+
+
+# -------------------------------------------------------------------- #
+# draining
+
+
+def pop_user_ids(count: int) -> list[UserID]:
+    """Remove and return up to `count` IDs of users with buffered views."""
+    values = _get_redis().spop(_USER_IDS_KEY, count) or []
+    return [UserID(UUID(value.decode())) for value in values]
+
+
+def pop_views(
+    user_ids: list[UserID],
+) -> tuple[
+    list[tuple[UserID, TopicID, datetime]],
+    list[tuple[UserID, BoardCategoryID, datetime]],
+]:
+    """Remove and return the buffered topic and category views of the
+    users.
+    """
+    if not user_ids:
+        return [], []
+
+    # Read and delete in a transaction so views recorded in the
+    # meantime are not lost.
+    pipeline = _get_redis().pipeline(transaction=True)
+    for user_id in user_ids:
+        topic_views_key = _get_topic_views_key(user_id)
+        category_views_key = _get_category_views_key(user_id)
+        pipeline.zrange(topic_views_key, 0, -1, withscores=True)
+        pipeline.zrange(category_views_key, 0, -1, withscores=True)
+        pipeline.delete(topic_views_key, category_views_key)
+    results = pipeline.execute()
+
+    topic_views = []
+    category_views = []
+
+    for index, user_id in enumerate(user_ids):
+        topic_entries, category_entries, _ = results[3 * index : 3 * index + 3]
+
+        for member, score in topic_entries:
+            topic_id = TopicID(UUID(member.decode()))
+            topic_views.append((user_id, topic_id, _from_score(score)))
+
+        for member, score in category_entries:
+            category_id = BoardCategoryID(UUID(member.decode()))
+            category_views.append((user_id, category_id, _from_score(score)))
+
+    return topic_views, category_views
+
+
+# -------------------------------------------------------------------- #
+# flush scheduling
+
+
+def mark_flush_scheduled(ttl_in_seconds: int) -> bool:
+    """Mark a flush as scheduled.
+
+    Return `True` if no flush was scheduled yet, i.e. the caller is
+    responsible for scheduling one.
+
+    The mark expires after the given time to recover from lost jobs.
+    """
+    was_set = _get_redis().set(
+        _FLUSH_SCHEDULED_KEY, '1', nx=True, ex=ttl_in_seconds
+    )
+    return bool(was_set)
+
+
+def clear_flush_scheduled() -> None:
+    """Remove the mark so that subsequent views schedule a new flush."""
+    _get_redis().delete(_FLUSH_SCHEDULED_KEY)
+
+
+# -------------------------------------------------------------------- #
+# helpers
+
+
+def _get_redis() -> Redis:
+    return current_app.redis_client
+
+
+def _get_topic_views_key(user_id: UserID) -> str:
+    return f'{_KEY_PREFIX}:topics:{user_id}'
+
+
+def _get_category_views_key(user_id: UserID) -> str:
+    return f'{_KEY_PREFIX}:categories:{user_id}'
+
+
+def _to_score(dt: datetime) -> float:
+    # Naive datetime objects are in UTC.
+    return dt.replace(tzinfo=UTC).timestamp()
+
+
+def _from_score(score: float) -> datetime:
+    return datetime.fromtimestamp(score, UTC).replace(tzinfo=None)
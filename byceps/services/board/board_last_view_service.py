@@ -6,50 +6,93 @@ byceps.services.board.board_last_view_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from datetime import datetime
+from collections.abc import Iterable
+from datetime import datetime, timedelta
 
-from sqlalchemy import delete, select
+from flask import current_app
+from sqlalchemy import delete, func, select, Table
+from sqlalchemy.dialects.postgresql import insert
 
 from byceps.database import db, upsert, upsert_many
 from byceps.services.user.models.user import UserID
+from byceps.util.jobqueue import enqueue_at
 
-from . import board_topic_query_service
+from . import board_last_view_buffer, board_topic_query_service
+from .dbmodels.category import DbBoardCategory
 from .dbmodels.last_category_view import DbLastCategoryView
 from .dbmodels.last_topic_view import DbLastTopicView
 from .dbmodels.topic import DbTopic
 from .models import BoardCategoryID, BoardCategoryWithLastUpdate, TopicID
 
 
+# Views are buffered in Redis and written to the database with this
+# delay (unless jobs are executed synchronously).
+FLUSH_DELAY = timedelta(seconds=30)
+
+FLUSH_BATCH_SIZE = 1000
+
+
 # -------------------------------------------------------------------- #
 # categories
 
 
-def contains_category_unseen_postings(
-    category: BoardCategoryWithLastUpdate, user_id: UserID
-) -> bool:
-    """Return `True` if the category contains postings created after the
-    last time the user viewed it.
+def select_categories_with_unseen_postings(
+    categories: Iterable[BoardCategoryWithLastUpdate], user_id: UserID
+) -> set[BoardCategoryID]:
+    """Return the IDs of those categories that contain postings created
+    after the last time the user viewed them.
     """
-    if category.last_posting_updated_at is None:
-        return False
+    categories = [
+        category
+        for category in categories
+        if category.last_posting_updated_at is not None
+    ]
+    if not categories:
+        return set()
 
-    db_last_view = find_last_category_view(user_id, category.id)
+    last_viewed_ats = get_category_last_viewed_ats(
+        {category.id for category in categories}, user_id
+    )
 
-    if db_last_view is None:
-        return True
+    return {
+        category.id
+        for category in categories
+        if _is_updated_since(
+            category.last_posting_updated_at, last_viewed_ats.get(category.id)
+        )
+    }
 
-    return category.last_posting_updated_at > db_last_view.occurred_at
 
+def get_category_last_viewed_ats(
+    category_ids: set[BoardCategoryID], user_id: UserID
+) -> dict[BoardCategoryID, datetime]:
+    """Return the times the categories were last viewed by the user.
 
-def find_last_category_view(
-    user_id: UserID, category_id: BoardCategoryID
-) -> DbLastCategoryView | None:
-    """Return the user's last view of the category, or `None` if not found."""
-    return db.session.scalars(
-        select(DbLastCategoryView).filter_by(
-            user_id=user_id, category_id=category_id
+    Categories the user has not viewed yet are omitted.
+    """
+    if not category_ids:
+        return {}
+
+    rows = (
+        db.session.execute(
+            select(
+                DbLastCategoryView.category_id, DbLastCategoryView.occurred_at
+            )
+            .filter(DbLastCategoryView.user_id == user_id)
+            .filter(DbLastCategoryView.category_id.in_(category_ids))
         )
-    ).first()
+        .tuples()
+        .all()
+    )
+
+    if not _is_write_behind_enabled():
+        return dict(rows)
+
+    buffered_views = board_last_view_buffer.get_category_views(
+        user_id, category_ids
+    )
+
+    return _merge_views(dict(rows), buffered_views)
 
 
 def mark_category_as_just_viewed(
@@ -58,13 +101,22 @@ def mark_category_as_just_viewed(
     """Mark the category as last viewed by the user (if logged in) at
     the current time.
     """
+    occurred_at = datetime.utcnow()
+
+    if _is_write_behind_enabled():
+        board_last_view_buffer.record_category_view(
+            user_id, category_id, occurred_at
+        )
+        _schedule_flush()
+        return
+
     table = DbLastCategoryView.__table__
     identifier = {
         'user_id': user_id,
         'category_id': category_id,
     }
     replacement = {
-        'occurred_at': datetime.utcnow(),
+        'occurred_at': occurred_at,
     }
 
     upsert(table, identifier, replacement)
@@ -82,12 +134,27 @@ def delete_last_category_views(category_id: BoardCategoryID) -> None:
 # topics
 
 
-def contains_topic_unseen_postings(db_topic: DbTopic, user_id: UserID) -> bool:
-    """Return `True` if the topic contains postings created after the
-    last time the user viewed it.
+def select_topics_with_unseen_postings(
+    db_topics: Iterable[DbTopic], user_id: UserID
+) -> set[TopicID]:
+    """Return the IDs of those topics that contain postings created
+    after the last time the user viewed them.
     """
-    last_viewed_at = find_topic_last_viewed_at(db_topic.id, user_id)
-    return last_viewed_at is None or db_topic.last_updated_at > last_viewed_at
+    db_topics = list(db_topics)
+    if not db_topics:
+        return set()
+
+    last_viewed_ats = get_topic_last_viewed_ats(
+        {db_topic.id for db_topic in db_topics}, user_id
+    )
+
+    return {
+        db_topic.id
+        for db_topic in db_topics
+        if _is_updated_since(
+            db_topic.last_updated_at, last_viewed_ats.get(db_topic.id)
+        )
+    }
 
 
 def find_topic_last_viewed_at(
@@ -96,24 +163,56 @@ def find_topic_last_viewed_at(
     """Return the time the topic was last viewed by the user (or
     nothing, if it hasn't been viewed by the user yet).
     """
-    db_last_view = db.session.scalars(
-        select(DbLastTopicView).filter_by(user_id=user_id, topic_id=topic_id)
-    ).first()
+    last_viewed_ats = get_topic_last_viewed_ats({topic_id}, user_id)
+    return last_viewed_ats.get(topic_id)
+
 
-    return db_last_view.occurred_at if (db_last_view is not None) else None
+def get_topic_last_viewed_ats(
+    topic_ids: set[TopicID], user_id: UserID
+) -> dict[TopicID, datetime]:
+    """Return the times the topics were last viewed by the user.
+
+    Topics the user has not viewed yet are omitted.
+    """
+    if not topic_ids:
+        return {}
+
+    rows = (
+        db.session.execute(
+            select(DbLastTopicView.topic_id, DbLastTopicView.occurred_at)
+            .filter(DbLastTopicView.user_id == user_id)
+            .filter(DbLastTopicView.topic_id.in_(topic_ids))
+        )
+        .tuples()
+        .all()
+    )
+
+    if not _is_write_behind_enabled():
+        return dict(rows)
+
+    buffered_views = board_last_view_buffer.get_topic_views(user_id, topic_ids)
+
+    return _merge_views(dict(rows), buffered_views)
 
 
 def mark_topic_as_just_viewed(topic_id: TopicID, user_id: UserID) -> None:
     """Mark the topic as last viewed by the user (if logged in) at the
     current time.
     """
+    occurred_at = datetime.utcnow()
+
+    if _is_write_behind_enabled():
+        board_last_view_buffer.record_topic_view(user_id, topic_id, occurred_at)
+        _schedule_flush()
+        return
+
     table = DbLastTopicView.__table__
     identifier = {
         'user_id': user_id,
         'topic_id': topic_id,
     }
     replacement = {
-        'occurred_at': datetime.utcnow(),
+        'occurred_at': occurred_at,
     }
 
     upsert(table, identifier, replacement)
@@ -146,3 +245,119 @@ def delete_last_topic_views(topic_id: TopicID) -> None:
     """Delete the topic's last views."""
     db.session.execute(delete(DbLastTopicView).filter_by(topic_id=topic_id))
     db.session.commit()
+
+
+# -------------------------------------------------------------------- #
+# write-behind
+
+
+def _is_write_behind_enabled() -> bool:
+    """Buffer views only if a worker will flush them."""
+    return current_app.config['JOBS_ASYNC']
+
+
+def _schedule_flush() -> None:
+    """Schedule a flush of the buffered views unless one is already
+    scheduled.
+    """
+    # Let the mark outlive the scheduled job in case it gets lost.
+    ttl_in_seconds = int(FLUSH_DELAY.total_seconds()) * 10
+    if board_last_view_buffer.mark_flush_scheduled(ttl_in_seconds):
+        enqueue_at(datetime.utcnow() + FLUSH_DELAY, flush_buffered_views)
+
+
+def flush_buffered_views() -> None:
+    """Write the views buffered in Redis to the database.
+
+    Meant to be run as a job on the worker.
+    """
+    # Views recorded from now on schedule another flush.
+    board_last_view_buffer.clear_flush_scheduled()
+
+    while True:
+        user_ids = board_last_view_buffer.pop_user_ids(FLUSH_BATCH_SIZE)
+        if not user_ids:
+            break
+
+        topic_views, category_views = board_last_view_buffer.pop_views(user_ids)
+
+        _write_views(
+            DbLastTopicView.__table__,
+            'topic_id',
+            _select_existing_ids(DbTopic, topic_views),
+            topic_views,
+        )
+        _write_views(
+            DbLastCategoryView.__table__,
+            'category_id',
+            _select_existing_ids(DbBoardCategory, category_views),
+            category_views,
+        )
+
+        db.session.commit()
+
+
+def _select_existing_ids(model, views) -> set:
+    """Return the IDs of those viewed topics or categories that still
+    exist.
+    """
+    target_ids = {target_id for _, target_id, _ in views}
+    if not target_ids:
+        return set()
+
+    return set(
+        db.session.scalars(
+            select(model.id).filter(model.id.in_(target_ids))
+        ).all()
+    )
+
+
+def _write_views(
+    table: Table, target_id_column_name: str, existing_target_ids, views
+) -> None:
+    """Insert or update the views, keeping later times."""
+    values = [
+        {
+            'user_id': user_id,
+            target_id_column_name: target_id,
+            'occurred_at': occurred_at,
+        }
+        for user_id, target_id, occurred_at in views
+        if target_id in existing_target_ids
+    ]
+    if not values:
+        return
+
+    stmt = insert(table).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['user_id', target_id_column_name],
+        set_={
+            'occurred_at': func.greatest(
+                table.c.occurred_at, stmt.excluded.occurred_at
+            )
+        },
+    )
+    db.session.execute(stmt)
+
+
+# -------------------------------------------------------------------- #
+# helpers
+
+
+def _merge_views(*views_dicts: dict) -> dict:
+    """Merge the view times, keeping the latest one per key."""
+    merged: dict = {}
+
+    for views in views_dicts:
+        for key, occurred_at in views.items():
+            current = merged.get(key)
+            if (current is None) or (occurred_at > current):
+                merged[key] = occurred_at
+
+    return merged
+
+
+def _is_updated_since(
+    updated_at: datetime, last_viewed_at: datetime | None
+) -> bool:
+    return (last_viewed_at is None) or (updated_at > last_viewed_at)
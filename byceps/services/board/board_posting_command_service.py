@@ -28,6 +28,8 @@ from . import (
     board_aggregation_service,
     board_posting_domain_service,
     board_posting_query_service,
+    board_posting_rendering_service,
+    board_search_service,
     board_topic_query_service,
 )
 from .dbmodels.posting import DbPosting, DbPostingReaction
@@ -49,9 +51,13 @@ def create_posting(
 
     db_posting = DbPosting(posting_id, db_topic.id, creator.id, body)
     db.session.add(db_posting)
-    db.session.commit()
+    db.session.flush()
+
+    board_aggregation_service.add_posting(db_posting)
+    board_posting_rendering_service.render_posting(db_posting)
+    board_search_service.index_posting(db_posting)
 
-    board_aggregation_service.aggregate_topic(db_topic)
+    db.session.commit()
 
     db_category = db_topic.category
     brand = brand_service.get_brand(db_category.board.brand_id)
@@ -84,6 +90,9 @@ def update_posting(
     db_posting.last_edited_by_id = editor.id
     db_posting.edit_count += 1
 
+    board_posting_rendering_service.render_posting(db_posting)
+    board_search_service.index_posting(db_posting)
+
     if commit:
         db.session.commit()
 
@@ -111,12 +120,16 @@ def hide_posting(
 
     now = datetime.utcnow()
 
+    was_hidden = db_posting.hidden
+
     db_posting.hidden = True
     db_posting.hidden_at = now
     db_posting.hidden_by_id = moderator.id
-    db.session.commit()
 
-    board_aggregation_service.aggregate_topic(db_posting.topic)
+    if not was_hidden:
+        board_aggregation_service.remove_posting(db_posting)
+
+    db.session.commit()
 
     brand = brand_service.get_brand(db_posting.topic.category.board.brand_id)
     posting_creator = _get_user(db_posting.creator_id)
@@ -144,13 +157,17 @@ def unhide_posting(
 
     now = datetime.utcnow()
 
+    was_hidden = db_posting.hidden
+
     # TODO: Store who un-hid the posting.
     db_posting.hidden = False
     db_posting.hidden_at = None
     db_posting.hidden_by_id = None
-    db.session.commit()
 
-    board_aggregation_service.aggregate_topic(db_posting.topic)
+    if was_hidden:
+        board_aggregation_service.add_posting(db_posting)
+
+    db.session.commit()
 
     brand = brand_service.get_brand(db_posting.topic.category.board.brand_id)
     posting_creator = _get_user(db_posting.creator_id)
@@ -172,6 +189,8 @@ def unhide_posting(
 
 def delete_posting(posting_id: PostingID) -> None:
     """Delete a posting."""
+    board_posting_rendering_service.delete_renderings_of_posting(posting_id)
+    board_search_service.delete_document_of_posting(posting_id)
     db.session.execute(delete(DbPosting).filter_by(id=posting_id))
     db.session.commit()
 
@@ -8,12 +8,12 @@ byceps.services.board.board_posting_query_service
 
 from collections import defaultdict
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
+from sqlalchemy.sql import ColumnElement
 
-from byceps.database import db, paginate, Pagination
+from byceps.database import db, paginate_without_count, PrecountedPagination
 from byceps.services.user import user_service
 from byceps.services.user.dbmodels.user import DbUser
-from byceps.util.iterables import index_of
 
 from .dbmodels.category import DbBoardCategory
 from .dbmodels.posting import DbPosting, DbPostingReaction
@@ -54,8 +54,17 @@ def paginate_postings(
     include_hidden: bool,
     page: int,
     per_page: int,
-) -> Pagination:
-    """Paginate postings in that topic, as visible for the user."""
+    *,
+    after: PostingID | None = None,
+) -> PrecountedPagination:
+    """Paginate postings in that topic, as visible for the user.
+
+    Pass the previous page's last posting as `after` to select the page
+    by keyset instead of offset.
+
+    The total is derived from the topic's posting count instead of
+    counting the postings.
+    """
     stmt = (
         select(DbPosting)
         .options(
@@ -69,13 +78,21 @@ def paginate_postings(
             .load_only(DbUser.id, DbUser.screen_name),
         )
         .filter_by(topic_id=topic_id)
-        .order_by(DbPosting.created_at.asc())
+        .order_by(DbPosting.created_at.asc(), DbPosting.id.asc())
     )
 
     if not include_hidden:
         stmt = stmt.filter_by(hidden=False)
 
-    db_postings = paginate(stmt, page, per_page)
+    total = _get_posting_total_of_topic(topic_id, include_hidden)
+
+    keyset_condition = None
+    if (page > 1) and (after is not None):
+        keyset_condition = _get_posting_keyset_condition(topic_id, after)
+
+    db_postings = paginate_without_count(
+        stmt, page, per_page, total, keyset_condition=keyset_condition
+    )
 
     creator_ids = {db_posting.creator_id for db_posting in db_postings.items}
     creators_by_id = user_service.get_users_indexed_by_id(
@@ -91,6 +108,48 @@ def paginate_postings(
     return db_postings
 
 
+def _get_posting_total_of_topic(topic_id: TopicID, include_hidden: bool) -> int:
+    """Return the number of postings in the topic.
+
+    The topic's posting count only covers visible postings, so hidden
+    ones have to be counted in addition if requested.
+    """
+    total = (
+        db.session.scalar(select(DbTopic.posting_count).filter_by(id=topic_id))
+        or 0
+    )
+
+    if include_hidden:
+        total += (
+            db.session.scalar(
+                select(db.func.count(DbPosting.id))
+                .filter_by(topic_id=topic_id)
+                .filter_by(hidden=True)
+            )
+            or 0
+        )
+
+    return total
+
+
+def _get_posting_keyset_condition(
+    topic_id: TopicID, after: PostingID
+) -> ColumnElement[bool] | None:
+    """Return a condition that selects the postings following the given
+    one in the topic, or `None` if that posting is not in the topic.
+    """
+    row = db.session.execute(
+        select(DbPosting.created_at, DbPosting.id)
+        .filter_by(id=after)
+        .filter_by(topic_id=topic_id)
+    ).one_or_none()
+
+    if row is None:
+        return None
+
+    return tuple_(DbPosting.created_at, DbPosting.id) > tuple_(*row)
+
+
 def _get_reactions_by_kind(
     db_reactions: list[DbPostingReaction],
 ) -> dict[str, list[PostingReactionUser]]:
@@ -111,17 +170,20 @@ def calculate_posting_page_number(
     db_posting: DbPosting, include_hidden: bool, postings_per_page: int
 ) -> int:
     """Return the number of the page the posting should appear on."""
-    stmt = select(DbPosting).filter_by(topic_id=db_posting.topic_id)
+    # Count in the order postings are paginated in, including the
+    # tiebreaker for postings created at the same time.
+    stmt = (
+        select(db.func.count(DbPosting.id))
+        .filter_by(topic_id=db_posting.topic_id)
+        .filter(
+            tuple_(DbPosting.created_at, DbPosting.id)
+            < tuple_(db_posting.created_at, db_posting.id)
+        )
+    )
 
     if not include_hidden:
         stmt = stmt.filter_by(hidden=False)
 
-    stmt = stmt.order_by(DbPosting.created_at.asc())
-
-    db_topic_postings = db.session.scalars(stmt).all()
-
-    index = index_of(db_topic_postings, lambda p: p == db_posting)
-    if index is None:
-        return 1  # Shouldn't happen.
+    index = db.session.scalar(stmt) or 0
 
     return divmod(index, postings_per_page)[0] + 1
@@ -0,0 +1,167 @@
+"""
+byceps.services.board.board_posting_rendering_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Persist the HTML renderings of posting bodies so BBcode does not have
+to be parsed again on every view.
+
+Renderings are stored per language as the markup contains localized
+text (e.g. the introduction of quotes).
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Iterable, Sequence
+from hashlib import sha256
+
+from flask_babel import force_locale
+from sqlalchemy import delete, exists, select
+
+from byceps.database import db, execute_upsert
+from byceps.services.text_markup import text_markup_service
+from byceps.util.l10n import get_locales
+
+from .dbmodels.posting import DbPosting
+from .dbmodels.posting_rendering import DbPostingRendering
+from .models import PostingID, TopicID
+
+
+def render_posting(db_posting: DbPosting) -> None:
+    """Render the posting's body as HTML in all available languages and
+    store the results.
+
+    Does not commit.
+    """
+    table = DbPostingRendering.__table__
+    body_hash = _get_body_hash(db_posting.body)
+
+    for language_code in _get_language_codes():
+        with force_locale(language_code):
+            html = text_markup_service.render_html(db_posting.body)
+
+        identifier = {
+            'posting_id': db_posting.id,
+            'language_code': language_code,
+        }
+        replacement = {
+            'body_hash': body_hash,
+            'renderer_version': text_markup_service.RENDERER_VERSION,
+            'html': html,
+        }
+
+        execute_upsert(table, identifier, replacement)
+
+
+def render_postings(posting_ids: Sequence[PostingID]) -> None:
+    """Render and store the bodies of the postings.
+
+    Meant to be run as a job on the worker.
+    """
+    db_postings = db.session.scalars(
+        select(DbPosting).filter(DbPosting.id.in_(posting_ids))
+    ).all()
+
+    for db_posting in db_postings:
+        render_posting(db_posting)
+
+    db.session.commit()
+
+
+def get_ids_of_postings_to_render() -> list[PostingID]:
+    """Return the IDs of postings without a rendering made by the
+    current renderer version.
+    """
+    return db.session.scalars(
+        select(DbPosting.id)
+        .filter(
+            ~exists()
+            .where(DbPostingRendering.posting_id == DbPosting.id)
+            .where(
+                DbPostingRendering.renderer_version
+                == text_markup_service.RENDERER_VERSION
+            )
+        )
+        .order_by(DbPosting.id)
+    ).all()
+
+
+def get_html_by_posting_id(
+    db_postings: Iterable[DbPosting], language_code: str
+) -> dict[PostingID, str]:
+    """Return the postings' bodies rendered as HTML.
+
+    Stored renderings are used if still valid. Otherwise the body is
+    rendered on the fly, in the current locale.
+    """
+    db_postings = list(db_postings)
+    if not db_postings:
+        return {}
+
+    db_renderings = db.session.scalars(
+        select(DbPostingRendering)
+        .filter(
+            DbPostingRendering.posting_id.in_(
+                {db_posting.id for db_posting in db_postings}
+            )
+        )
+        .filter_by(language_code=language_code)
+    ).all()
+
+    db_renderings_by_posting_id = {
+        db_rendering.posting_id: db_rendering for db_rendering in db_renderings
+    }
+
+    html_by_posting_id = {}
+
+    for db_posting in db_postings:
+        db_rendering = db_renderings_by_posting_id.get(db_posting.id)
+
+        if (db_rendering is not None) and _is_rendering_valid(
+            db_rendering, db_posting.body
+        ):
+            html = db_rendering.html
+        else:
+            html = text_markup_service.render_html(db_posting.body)
+
+        html_by_posting_id[db_posting.id] = html
+
+    return html_by_posting_id
+
+
+def delete_renderings_of_posting(posting_id: PostingID) -> None:
+    """Delete the renderings of the posting.
+
+    Does not commit.
+    """
+    db.session.execute(
+        delete(DbPostingRendering).filter_by(posting_id=posting_id)
+    )
+
+
+def delete_renderings_of_topic(topic_id: TopicID) -> None:
+    """Delete the renderings of all postings in the topic.
+
+    Does not commit.
+    """
+    db.session.execute(
+        delete(DbPostingRendering).where(
+            DbPostingRendering.posting_id.in_(
+                select(DbPosting.id).filter_by(topic_id=topic_id)
+            )
+        )
+    )
+
+
+def _is_rendering_valid(db_rendering: DbPostingRendering, body: str) -> bool:
+    return (
+        db_rendering.renderer_version == text_markup_service.RENDERER_VERSION
+    ) and (db_rendering.body_hash == _get_body_hash(body))
+
+
+def _get_body_hash(body: str) -> str:
+    return sha256(body.encode('utf-8')).hexdigest()
+
+
+def _get_language_codes() -> list[str]:
+    return [str(locale) for locale in get_locales()]
@@ -0,0 +1,317 @@
+"""
+byceps.services.board.board_search_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Full-text search over postings and topic titles, based on PostgreSQL's
+text search.
+
+Each posting has a search document (a `tsvector` covered by a GIN
+index) that is updated whenever the posting is created or updated.
+
+All documents are built with the text search configuration matching
+the application's default locale so that a single (constant) query can
+make use of the index.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Sequence
+from html import escape
+import re
+
+from sqlalchemy import (
+    cast,
+    ColumnElement,
+    delete,
+    exists,
+    func,
+    literal,
+    or_,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG
+
+from byceps.database import db, execute_upsert
+from byceps.util.l10n import get_default_locale
+
+from .dbmodels.category import DbBoardCategory
+from .dbmodels.posting import DbPosting
+from .dbmodels.posting_search_document import DbPostingSearchDocument
+from .dbmodels.topic import DbTopic
+from .models import (
+    BoardID,
+    PostingID,
+    PostingSearchResult,
+    PostingSearchResultPage,
+    TopicID,
+)
+
+
+# PostgreSQL text search configurations by language code
+_TEXT_SEARCH_CONFIGS_BY_LANGUAGE_CODE = {
+    'da': 'danish',
+    'de': 'german',
+    'en': 'english',
+    'es': 'spanish',
+    'fi': 'finnish',
+    'fr': 'french',
+    'it': 'italian',
+    'nl': 'dutch',
+    'no': 'norwegian',
+    'pt': 'portuguese',
+    'ru': 'russian',
+    'sv': 'swedish',
+}
+_FALLBACK_TEXT_SEARCH_CONFIG = 'simple'
+
+
+# Characters from Unicode's private use area to mark matches in
+# excerpts. They are replaced with HTML elements after escaping.
+_MATCH_START = '\ue000'
+_MATCH_STOP = '\ue001'
+
+_HEADLINE_OPTIONS_BODY = (
+    f'StartSel="{_MATCH_START}", StopSel="{_MATCH_STOP}", '
+    'MaxFragments=2, MinWords=10, MaxWords=30, FragmentDelimiter=" … "'
+)
+_HEADLINE_OPTIONS_TITLE = (
+    f'StartSel="{_MATCH_START}", StopSel="{_MATCH_STOP}", HighlightAll=true'
+)
+
+_BBCODE_TAG_PATTERN = re.compile(r'\[/?[a-z*]+(?:[= ][^\]]*)?\]', re.IGNORECASE)
+_MATCH_PATTERN = re.compile(f'{_MATCH_START}(.*?){_MATCH_STOP}', re.DOTALL)
+
+
+# -------------------------------------------------------------------- #
+# indexing
+
+
+def index_posting(db_posting: DbPosting) -> None:
+    """Create or update the posting's search document.
+
+    Does not commit.
+    """
+    text_search_config = _get_text_search_config()
+
+    text = db_posting.body
+    if db_posting.is_initial_topic_posting():
+        text = db_posting.topic.title + '\n' + text
+
+    table = DbPostingSearchDocument.__table__
+    identifier = {'posting_id': db_posting.id}
+    replacement = {
+        'text_search_config': text_search_config,
+        'document': func.to_tsvector(_to_regconfig(text_search_config), text),
+    }
+
+    execute_upsert(table, identifier, replacement)
+
+
+def index_postings(posting_ids: Sequence[PostingID]) -> None:
+    """Create or update the search documents of the postings.
+
+    Meant to be run as a job on the worker.
+    """
+    db_postings = db.session.scalars(
+        select(DbPosting).filter(DbPosting.id.in_(posting_ids))
+    ).all()
+
+    for db_posting in db_postings:
+        index_posting(db_posting)
+
+    db.session.commit()
+
+
+def get_ids_of_postings_to_index() -> list[PostingID]:
+    """Return the IDs of postings without a search document built with
+    the current text search configuration.
+    """
+    return db.session.scalars(
+        select(DbPosting.id)
+        .filter(
+            ~exists()
+            .where(DbPostingSearchDocument.posting_id == DbPosting.id)
+            .where(
+                DbPostingSearchDocument.text_search_config
+                == _get_text_search_config()
+            )
+        )
+        .order_by(DbPosting.id)
+    ).all()
+
+
+def delete_document_of_posting(posting_id: PostingID) -> None:
+    """Delete the posting's search document.
+
+    Does not commit.
+    """
+    db.session.execute(
+        delete(DbPostingSearchDocument).filter_by(posting_id=posting_id)
+    )
+
+
+def delete_documents_of_topic(topic_id: TopicID) -> None:
+    """Delete the search documents of all postings in the topic.
+
+    Does not commit.
+    """
+    db.session.execute(
+        delete(DbPostingSearchDocument).where(
+            DbPostingSearchDocument.posting_id.in_(
+                select(DbPosting.id).filter_by(topic_id=topic_id)
+            )
+        )
+    )
+
+
+# -------------------------------------------------------------------- #
+# searching
+
+
+def search_postings(
+    board_id: BoardID,
+    search_term: str,
+    *,
+    include_hidden: bool = False,
+    limit: int = 20,
+    after: PostingID | None = None,
+) -> PostingSearchResultPage:
+    """Return postings in the board that match the search term, newest
+    first.
+
+    Hidden categories are always excluded, hidden topics and postings
+    unless requested. Access to the board has to be checked by the
+    caller.
+
+    Pass the page's `next_after` value as `after` to fetch the
+    following page.
+    """
+    text_search_config = _to_regconfig(_get_text_search_config())
+    query = func.websearch_to_tsquery(text_search_config, search_term)
+
+    stmt = (
+        select(DbPosting.id, DbPosting.created_at)
+        .join(
+            DbPostingSearchDocument,
+            DbPostingSearchDocument.posting_id == DbPosting.id,
+        )
+        .join(DbTopic, DbTopic.id == DbPosting.topic_id)
+        .join(DbBoardCategory, DbBoardCategory.id == DbTopic.category_id)
+        .filter(DbBoardCategory.board_id == board_id)
+        .filter(DbBoardCategory.hidden == False)  # noqa: E712
+        .filter(DbPostingSearchDocument.document.bool_op('@@')(query))
+    )
+
+    if not include_hidden:
+        stmt = stmt.filter(DbTopic.hidden == False)  # noqa: E712
+        stmt = stmt.filter(DbPosting.hidden == False)  # noqa: E712
+
+    if after is not None:
+        after_created_at = db.session.scalar(
+            select(DbPosting.created_at).filter_by(id=after)
+        )
+        if after_created_at is not None:
+            stmt = stmt.filter(
+                tuple_(DbPosting.created_at, DbPosting.id)
+                < tuple_(after_created_at, after)
+            )
+
+    stmt = stmt.order_by(DbPosting.created_at.desc(), DbPosting.id.desc())
+
+    rows = db.session.execute(stmt.limit(limit + 1)).all()
+
+    has_more = len(rows) > limit
+    posting_ids = [posting_id for posting_id, _ in rows[:limit]]
+
+    results = _get_results(posting_ids, text_search_config, query)
+    next_after = posting_ids[-1] if has_more else None
+
+    return PostingSearchResultPage(results=results, next_after=next_after)
+
+
+def _get_results(
+    posting_ids: list[PostingID],
+    text_search_config: ColumnElement[str],
+    query: ColumnElement[str],
+) -> list[PostingSearchResult]:
+    """Assemble results for the postings, with excerpts.
+
+    Excerpts are only generated for the page's postings as doing so is
+    comparatively expensive.
+    """
+    if not posting_ids:
+        return []
+
+    rows = db.session.execute(
+        select(
+            DbPosting.id,
+            DbPosting.topic_id,
+            DbPosting.created_at,
+            DbPosting.creator_id,
+            or_(DbPosting.hidden, DbTopic.hidden),
+            func.ts_headline(
+                text_search_config,
+                DbTopic.title,
+                query,
+                _HEADLINE_OPTIONS_TITLE,
+            ),
+            func.ts_headline(
+                text_search_config,
+                DbPosting.body,
+                query,
+                _HEADLINE_OPTIONS_BODY,
+            ),
+        )
+        .join(DbTopic, DbTopic.id == DbPosting.topic_id)
+        .filter(DbPosting.id.in_(posting_ids))
+    ).all()
+
+    results_by_posting_id = {
+        posting_id: PostingSearchResult(
+            posting_id=posting_id,
+            topic_id=topic_id,
+            created_at=created_at,
+            creator_id=creator_id,
+            hidden=hidden,
+            topic_title_html=_to_html(topic_title_headline),
+            body_excerpt_html=_to_html(
+                _BBCODE_TAG_PATTERN.sub('', body_headline)
+            ),
+        )
+        for (
+            posting_id,
+            topic_id,
+            created_at,
+            creator_id,
+            hidden,
+            topic_title_headline,
+            body_headline,
+        ) in rows
+    }
+
+    return [results_by_posting_id[posting_id] for posting_id in posting_ids]
+
+
+def _to_html(headline: str) -> str:
+    """Escape the headline and mark up the matches in it."""
+    html = escape(headline)
+    html = _MATCH_PATTERN.sub(r'<mark>\1</mark>', html)
+    # Remove unpaired markers (e.g. if one was within a BBcode tag).
+    return html.replace(_MATCH_START, '').replace(_MATCH_STOP, '')
+
+
+# -------------------------------------------------------------------- #
+# configuration
+
+
+def _get_text_search_config() -> str:
+    language_code = get_default_locale().partition('_')[0]
+    return _TEXT_SEARCH_CONFIGS_BY_LANGUAGE_CODE.get(
+        language_code, _FALLBACK_TEXT_SEARCH_CONFIG
+    )
+
+
+def _to_regconfig(text_search_config: str) -> ColumnElement[str]:
+    return cast(literal(text_search_config), REGCONFIG)
@@ -31,6 +31,8 @@ from byceps.util.uuid import generate_uuid7
 from . import (
     board_aggregation_service,
     board_posting_command_service,
+    board_posting_rendering_service,
+    board_search_service,
     board_topic_query_service,
 )
 from .dbmodels.category import DbBoardCategory
@@ -55,9 +57,13 @@ def create_topic(
     db.session.add(db_topic)
     db.session.add(db_posting)
     db.session.add(db_initial_topic_posting_association)
-    db.session.commit()
+    db.session.flush()
+
+    board_aggregation_service.add_topic(db_topic, db_posting)
+    board_posting_rendering_service.render_posting(db_posting)
+    board_search_service.index_posting(db_posting)
 
-    board_aggregation_service.aggregate_topic(db_topic)
+    db.session.commit()
 
     db_category = db_topic.category
     brand = brand_service.get_brand(db_category.board.brand_id)
@@ -112,12 +118,18 @@ def hide_topic(topic_id: TopicID, moderator: User) -> BoardTopicHiddenEvent:
 
     now = datetime.utcnow()
 
+    was_hidden = db_topic.hidden
+
     db_topic.hidden = True
     db_topic.hidden_at = now
     db_topic.hidden_by_id = moderator.id
-    db.session.commit()
 
-    board_aggregation_service.aggregate_topic(db_topic)
+    if not was_hidden:
+        board_aggregation_service.remove_topic_from_category(
+            db_topic, db_topic.category
+        )
+
+    db.session.commit()
 
     brand = brand_service.get_brand(db_topic.category.board.brand_id)
     topic_creator = _get_user(db_topic.creator_id)
@@ -140,13 +152,19 @@ def unhide_topic(topic_id: TopicID, moderator: User) -> BoardTopicUnhiddenEvent:
 
     now = datetime.utcnow()
 
+    was_hidden = db_topic.hidden
+
     # TODO: Store who un-hid the topic.
     db_topic.hidden = False
     db_topic.hidden_at = None
     db_topic.hidden_by_id = None
-    db.session.commit()
 
-    board_aggregation_service.aggregate_topic(db_topic)
+    if was_hidden:
+        board_aggregation_service.add_topic_to_category(
+            db_topic, db_topic.category
+        )
+
+    db.session.commit()
 
     brand = brand_service.get_brand(db_topic.category.board.brand_id)
     topic_creator = _get_user(db_topic.creator_id)
@@ -281,10 +299,16 @@ def move_topic(
     db_new_category = db.session.get(DbBoardCategory, new_category_id)
 
     db_topic.category = db_new_category
-    db.session.commit()
 
-    for db_category in db_old_category, db_new_category:
-        board_aggregation_service.aggregate_category(db_category)
+    if not db_topic.hidden and (db_new_category.id != db_old_category.id):
+        board_aggregation_service.remove_topic_from_category(
+            db_topic, db_old_category
+        )
+        board_aggregation_service.add_topic_to_category(
+            db_topic, db_new_category
+        )
+
+    db.session.commit()
 
     brand = brand_service.get_brand(db_topic.category.board.brand_id)
     topic_creator = _get_user(db_topic.creator_id)
@@ -326,6 +350,8 @@ def delete_topic(topic_id: TopicID) -> None:
     db.session.execute(
         delete(DbInitialTopicPostingAssociation).filter_by(topic_id=topic_id)
     )
+    board_posting_rendering_service.delete_renderings_of_topic(topic_id)
+    board_search_service.delete_documents_of_topic(topic_id)
     db.session.execute(delete(DbPosting).filter_by(topic_id=topic_id))
     db.session.execute(delete(DbTopic).filter_by(id=topic_id))
     db.session.commit()
@@ -9,10 +9,16 @@ byceps.services.board.board_topic_query_service
 from collections.abc import Sequence
 from datetime import datetime
 
-from sqlalchemy import select
-from sqlalchemy.sql import Select
-
-from byceps.database import db, paginate, Pagination
+from sqlalchemy import select, tuple_
+from sqlalchemy.sql import ColumnElement, Select
+
+from byceps.database import (
+    db,
+    paginate,
+    paginate_without_count,
+    Pagination,
+    PrecountedPagination,
+)
 from byceps.services.user import user_service
 from byceps.services.user.dbmodels.user import DbUser
 from byceps.services.user.models.user import User
@@ -122,24 +128,101 @@ def get_all_topic_ids_in_category(category_id: BoardCategoryID) -> set[TopicID]:
     return set(topic_ids)
 
 
+# Topics without visible postings have no update time. Sort them as the
+# oldest ones, both in the order and the keyset condition (a comparison
+# with `NULL` would not select anything). Matches the expression in the
+# topics' pagination index.
+_last_updated_at_sort_key = db.func.coalesce(
+    DbTopic.last_updated_at,
+    db.literal_column("'-infinity'::timestamp"),
+)
+
+
 def paginate_topics_of_category(
     category_id: BoardCategoryID,
     page: int,
     per_page: int,
     *,
     include_hidden: bool = False,
-) -> Pagination:
+    after: TopicID | None = None,
+) -> PrecountedPagination:
     """Paginate topics in that category, as visible for the user.
 
     Pinned topics are returned first.
+
+    Pass the previous page's last topic as `after` to select the page
+    by keyset instead of offset.
+
+    The total is derived from the category's topic count instead of
+    counting the topics.
     """
     stmt = (
         _select_topics(include_hidden=include_hidden)
         .filter_by(category_id=category_id)
-        .order_by(DbTopic.pinned.desc(), DbTopic.last_updated_at.desc())
+        .order_by(
+            DbTopic.pinned.desc(),
+            _last_updated_at_sort_key.desc(),
+            DbTopic.id.desc(),
+        )
     )
 
-    return paginate(stmt, page, per_page)
+    total = _get_topic_total_of_category(category_id, include_hidden)
+
+    keyset_condition = None
+    if (page > 1) and (after is not None):
+        keyset_condition = _get_topic_keyset_condition(category_id, after)
+
+    return paginate_without_count(
+        stmt, page, per_page, total, keyset_condition=keyset_condition
+    )
+
+
+def _get_topic_total_of_category(
+    category_id: BoardCategoryID, include_hidden: bool
+) -> int:
+    """Return the number of topics in the category.
+
+    The category's topic count only covers visible topics, so hidden
+    ones have to be counted in addition if requested.
+    """
+    total = (
+        db.session.scalar(
+            select(DbBoardCategory.topic_count).filter_by(id=category_id)
+        )
+        or 0
+    )
+
+    if include_hidden:
+        total += (
+            db.session.scalar(
+                select(db.func.count(DbTopic.id))
+                .filter_by(category_id=category_id)
+                .filter_by(hidden=True)
+            )
+            or 0
+        )
+
+    return total
+
+
+def _get_topic_keyset_condition(
+    category_id: BoardCategoryID, after: TopicID
+) -> ColumnElement[bool] | None:
+    """Return a condition that selects the topics following the given
+    one in the category's order, or `None` if that topic is not in the
+    category (anymore).
+    """
+    row = db.session.execute(
+        select(DbTopic.pinned, _last_updated_at_sort_key, DbTopic.id)
+        .filter_by(id=after)
+        .filter_by(category_id=category_id)
+    ).one_or_none()
+
+    if row is None:
+        return None
+
+    sort_key = tuple_(DbTopic.pinned, _last_updated_at_sort_key, DbTopic.id)
+    return sort_key < tuple_(*row)
 
 
 def _select_topics(*, include_hidden: bool = False) -> Select:
@@ -10,4 +10,6 @@ from . import (
     board_access_grant,  # noqa: F401
     last_category_view,  # noqa: F401
     last_topic_view,  # noqa: F401
+    posting_rendering,  # noqa: F401
+    posting_search_document,  # noqa: F401
 )
@@ -24,6 +24,15 @@ class DbPosting(db.Model):
     """A posting."""
 
     __tablename__ = 'board_postings'
+    __table_args__ = (
+        # Supports keyset pagination of the postings in a topic.
+        db.Index(
+            'ix_board_postings_topic_id_created_at_id',
+            'topic_id',
+            'created_at',
+            'id',
+        ),
+    )
 
     id: Mapped[PostingID] = mapped_column(db.Uuid, primary_key=True)
     topic_id: Mapped[TopicID] = mapped_column(
@@ -0,0 +1,54 @@
+"""
+byceps.services.board.dbmodels.posting_rendering
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from byceps.database import db
+from byceps.services.board.models import PostingID
+from byceps.util.instances import ReprBuilder
+
+
+class DbPostingRendering(db.Model):
+    """A posting's body rendered as HTML in a specific language.
+
+    The rendering is valid as long as both the hash of the body it was
+    rendered from and the renderer version match the current ones.
+    """
+
+    __tablename__ = 'board_posting_renderings'
+
+    posting_id: Mapped[PostingID] = mapped_column(
+        db.Uuid, db.ForeignKey('board_postings.id'), primary_key=True
+    )
+    language_code: Mapped[str] = mapped_column(db.UnicodeText, primary_key=True)
+    body_hash: Mapped[str] = mapped_column(db.UnicodeText)
+    renderer_version: Mapped[int]
+    html: Mapped[str] = mapped_column(db.UnicodeText)
+
+    def __init__(
+        self,
+        posting_id: PostingID,
+        language_code: str,
+        body_hash: str,
+        renderer_version: int,
+        html: str,
+    ) -> None:
+        self.posting_id = posting_id
+        self.language_code = language_code
+        self.body_hash = body_hash
+        self.renderer_version = renderer_version
+        self.html = html
+
+    def __repr__(self) -> str:
+        return (
+            ReprBuilder(self)
+            .add_with_lookup('posting_id')
+            .add_with_lookup('language_code')
+            .add_with_lookup('renderer_version')
+            .build()
+        )
@@ -0,0 +1,43 @@
+"""
+byceps.services.board.dbmodels.posting_search_document
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column
+
+from byceps.database import db
+from byceps.services.board.models import PostingID
+from byceps.util.instances import ReprBuilder
+
+
+class DbPostingSearchDocument(db.Model):
+    """A posting's text (and, for a topic's initial posting, the topic's
+    title) prepared for full-text search.
+    """
+
+    __tablename__ = 'board_posting_search_documents'
+    __table_args__ = (
+        db.Index(
+            'ix_board_posting_search_documents_document',
+            'document',
+            postgresql_using='gin',
+        ),
+    )
+
+    posting_id: Mapped[PostingID] = mapped_column(
+        db.Uuid, db.ForeignKey('board_postings.id'), primary_key=True
+    )
+    text_search_config: Mapped[str] = mapped_column(db.UnicodeText)
+    document: Mapped[str] = mapped_column(TSVECTOR)
+
+    def __repr__(self) -> str:
+        return (
+            ReprBuilder(self)
+            .add_with_lookup('posting_id')
+            .add_with_lookup('text_search_config')
+            .build()
+        )
@@ -24,6 +24,17 @@ class DbTopic(db.Model):
     """A topic."""
 
     __tablename__ = 'board_topics'
+    __table_args__ = (
+        # Supports keyset pagination of the topics in a category.
+        # Topics without an update time are sorted as the oldest ones.
+        db.Index(
+            'ix_board_topics_category_id_pinned_last_updated_at_id',
+            'category_id',
+            'pinned',
+            db.text("coalesce(last_updated_at, '-infinity'::timestamp)"),
+            'id',
+        ),
+    )
 
     id: Mapped[TopicID] = mapped_column(db.Uuid, primary_key=True)
     category_id: Mapped[BoardCategoryID] = mapped_column(
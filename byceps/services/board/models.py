@@ -90,3 +90,22 @@ class PostingReaction:
 class PostingReactionUser:
     id: UserID
     screen_name: str | None
+
+
+@dataclass(frozen=True)
+class PostingSearchResult:
+    posting_id: PostingID
+    topic_id: TopicID
+    created_at: datetime
+    creator_id: UserID
+    hidden: bool
+    # HTML with search term matches marked up
+    topic_title_html: str
+    body_excerpt_html: str
+
+
+@dataclass(frozen=True)
+class PostingSearchResultPage:
+    results: list[PostingSearchResult]
+    # the posting to continue after, if there are more results
+    next_after: PostingID | None
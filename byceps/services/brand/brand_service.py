@@ -10,11 +10,15 @@ from sqlalchemy import delete, select
 
 from byceps.database import db
 from byceps.services.brand.models import BrandID
+from byceps.util.cache import VersionedCache
 
 from .dbmodels import DbBrand, DbBrandSetting
 from .models import Brand
 
 
+_brand_cache: VersionedCache[BrandID, Brand] = VersionedCache('brand')
+
+
 def create_brand(brand_id: BrandID, title: str) -> Brand:
     """Create a brand."""
     db_brand = DbBrand(brand_id, title)
@@ -43,6 +47,8 @@ def update_brand(
 
     db.session.commit()
 
+    _brand_cache.invalidate()
+
     return _db_entity_to_brand(db_brand)
 
 
@@ -54,6 +60,8 @@ def delete_brand(brand_id: BrandID) -> None:
     db.session.execute(delete(DbBrand).where(DbBrand.id == brand_id))
     db.session.commit()
 
+    _brand_cache.invalidate()
+
 
 def find_brand(brand_id: BrandID) -> Brand | None:
     """Return the brand with that id, or `None` if not found."""
@@ -80,6 +88,15 @@ def get_brand(brand_id: BrandID) -> Brand:
     return brand
 
 
+def get_brand_cached(brand_id: BrandID) -> Brand:
+    """Return the brand with that id, or raise an exception.
+
+    The brand is served from a process-local cache that is invalidated
+    whenever a brand is updated.
+    """
+    return _brand_cache.get(brand_id, get_brand)
+
+
 def get_all_brands() -> list[Brand]:
     """Return all brands, ordered by title."""
     db_brands = db.session.scalars(
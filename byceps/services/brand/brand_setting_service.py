@@ -6,15 +6,24 @@ byceps.services.brand.brand_setting_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from sqlalchemy import delete, select
 
 from byceps.database import db, upsert
 from byceps.services.brand.models import BrandID
+from byceps.util.cache import VersionedCache
 
 from .dbmodels import DbBrandSetting
 from .models import BrandSetting
 
 
+_values_cache: VersionedCache[BrandID, Mapping[str, str]] = VersionedCache(
+    'brand-settings', max_size=1000
+)
+
+
 def create_setting(brand_id: BrandID, name: str, value: str) -> BrandSetting:
     """Create a setting for that brand."""
     db_setting = DbBrandSetting(brand_id, name, value)
@@ -22,6 +31,8 @@ def create_setting(brand_id: BrandID, name: str, value: str) -> BrandSetting:
     db.session.add(db_setting)
     db.session.commit()
 
+    _values_cache.invalidate()
+
     return _db_entity_to_brand_setting(db_setting)
 
 
@@ -42,6 +53,8 @@ def create_or_update_setting(
 
     upsert(table, identifier, replacement)
 
+    _values_cache.invalidate()
+
     return find_setting(brand_id, name)
 
 
@@ -57,6 +70,8 @@ def remove_setting(brand_id: BrandID, name: str) -> None:
     )
     db.session.commit()
 
+    _values_cache.invalidate()
+
 
 def find_setting(brand_id: BrandID, name: str) -> BrandSetting | None:
     """Return the setting for that brand and with that name, or `None`
@@ -73,13 +88,25 @@ def find_setting(brand_id: BrandID, name: str) -> BrandSetting | None:
 def find_setting_value(brand_id: BrandID, name: str) -> str | None:
     """Return the value of the setting for that brand and with that
     name, or `None` if not found.
-    """
-    db_setting = find_setting(brand_id, name)
 
-    if db_setting is None:
-        return None
+    The settings of a brand are loaded at once and cached per process.
+    """
+    values = _values_cache.get(brand_id, _load_setting_values)
+    return values.get(name)
+
+
+def _load_setting_values(brand_id: BrandID) -> Mapping[str, str]:
+    rows = (
+        db.session.execute(
+            select(DbBrandSetting.name, DbBrandSetting.value).filter_by(
+                brand_id=brand_id
+            )
+        )
+        .tuples()
+        .all()
+    )
 
-    return db_setting.value
+    return MappingProxyType(dict(rows))
 
 
 def get_settings(brand_id: BrandID) -> set[BrandSetting]:
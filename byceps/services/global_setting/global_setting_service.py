@@ -6,14 +6,23 @@ byceps.services.global_setting.global_setting_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from sqlalchemy import delete, select
 
 from byceps.database import db, upsert
+from byceps.util.cache import VersionedCache
 
 from .dbmodels import DbGlobalSetting
 from .models import GlobalSetting
 
 
+_values_cache: VersionedCache[str, Mapping[str, str]] = VersionedCache(
+    'global-settings'
+)
+
+
 def create_setting(name: str, value: str) -> GlobalSetting:
     """Create a global setting."""
     db_setting = DbGlobalSetting(name, value)
@@ -21,6 +30,8 @@ def create_setting(name: str, value: str) -> GlobalSetting:
     db.session.add(db_setting)
     db.session.commit()
 
+    _values_cache.invalidate()
+
     return _db_entity_to_global_setting(db_setting)
 
 
@@ -34,6 +45,8 @@ def create_or_update_setting(name: str, value: str) -> GlobalSetting:
 
     upsert(table, identifier, replacement)
 
+    _values_cache.invalidate()
+
     return find_setting(name)
 
 
@@ -47,6 +60,8 @@ def remove_setting(name: str) -> None:
     )
     db.session.commit()
 
+    _values_cache.invalidate()
+
 
 def find_setting(name: str) -> GlobalSetting | None:
     """Return the global setting with that name, or `None` if not found."""
@@ -61,13 +76,21 @@ def find_setting(name: str) -> GlobalSetting | None:
 def find_setting_value(name: str) -> str | None:
     """Return the value of the global setting with that name, or `None`
     if not found.
+
+    The global settings are loaded at once and cached per process.
     """
-    setting = find_setting(name)
+    values = _values_cache.get('all', _load_setting_values)
+    return values.get(name)
 
-    if setting is None:
-        return None
 
-    return setting.value
+def _load_setting_values(_: str) -> Mapping[str, str]:
+    rows = (
+        db.session.execute(select(DbGlobalSetting.name, DbGlobalSetting.value))
+        .tuples()
+        .all()
+    )
+
+    return MappingProxyType(dict(rows))
 
 
 def get_settings() -> set[GlobalSetting]:
@@ -24,8 +24,9 @@ from byceps.services.shop.article import article_service as shop_article_service
 from byceps.services.shop.order import order_service
 from byceps.services.shop.shop import shop_service
 from byceps.services.shop.shop.models import Shop, ShopID
-from byceps.services.ticketing import ticket_service
+from byceps.services.ticketing import ticket_count_service
 from byceps.services.user import user_stats_service
+from byceps.services.webhooks import webhook_delivery_stats_service
 
 
 def serialize(metrics: Iterator[Metric]) -> Iterator[str]:
@@ -50,6 +51,7 @@ def collect_metrics() -> Iterator[Metric]:
     yield from _collect_seating_metrics(active_party_ids)
     yield from _collect_ticket_metrics(active_parties)
     yield from _collect_user_metrics()
+    yield from _collect_webhook_delivery_metrics()
 
 
 def _collect_board_metrics(brand_ids: list[BrandID]) -> Iterator[Metric]:
@@ -148,23 +150,18 @@ def _collect_ticket_metrics(active_parties: list[Party]) -> Iterator[Metric]:
         if max_ticket_quantity is not None:
             yield Metric('tickets_max', max_ticket_quantity, labels=labels)
 
-        tickets_revoked_count = ticket_service.count_revoked_tickets_for_party(
-            party_id
-        )
+        counts = ticket_count_service.get_counts(party_id)
+
         yield Metric(
-            'tickets_revoked_count', tickets_revoked_count, labels=labels
+            'tickets_revoked_count', counts.tickets_revoked, labels=labels
         )
 
-        tickets_sold_count = ticket_service.count_sold_tickets_for_party(
-            party_id
-        )
-        yield Metric('tickets_sold_count', tickets_sold_count, labels=labels)
+        yield Metric('tickets_sold_count', counts.tickets_sold, labels=labels)
 
-        tickets_checked_in_count = (
-            ticket_service.count_tickets_checked_in_for_party(party_id)
-        )
         yield Metric(
-            'tickets_checked_in_count', tickets_checked_in_count, labels=labels
+            'tickets_checked_in_count',
+            counts.tickets_checked_in,
+            labels=labels,
         )
 
 
@@ -180,3 +177,16 @@ def _collect_user_metrics() -> Iterator[Metric]:
     yield Metric('users_suspended_count', users_suspended)
     yield Metric('users_deleted_count', users_deleted)
     yield Metric('users_total_count', users_total)
+
+
+def _collect_webhook_delivery_metrics() -> Iterator[Metric]:
+    counts = webhook_delivery_stats_service.get_counts()
+    for (webhook_id, outcome), count in sorted(counts.items()):
+        yield Metric(
+            'webhook_delivery_count',
+            count,
+            labels=[
+                Label('webhook', str(webhook_id)),
+                Label('outcome', outcome),
+            ],
+        )
@@ -12,6 +12,7 @@ from itertools import groupby
 from sqlalchemy import delete, select
 
 from byceps.database import db
+from byceps.services.board import board_author_decoration_cache
 from byceps.services.orga.dbmodels import DbOrgaFlag
 from byceps.services.party import party_service
 from byceps.services.party.models import PartyID
@@ -156,12 +157,22 @@ def create_membership(
     team_id: OrgaTeamID, user_id: UserID, duties: str | None
 ) -> Membership:
     """Assign the user to the team."""
+    db_membership = _create_membership(team_id, user_id, duties)
+
+    board_author_decoration_cache.invalidate_orga_ids()
+
+    return _db_entity_to_membership(db_membership)
+
+
+def _create_membership(
+    team_id: OrgaTeamID, user_id: UserID, duties: str | None
+) -> DbMembership:
     db_membership = DbMembership(team_id, user_id, duties=duties)
 
     db.session.add(db_membership)
     db.session.commit()
 
-    return _db_entity_to_membership(db_membership)
+    return db_membership
 
 
 def update_membership(
@@ -180,6 +191,8 @@ def update_membership(
     db_membership.duties = duties
     db.session.commit()
 
+    board_author_decoration_cache.invalidate_orga_ids()
+
     return _db_entity_to_membership(db_membership)
 
 
@@ -188,6 +201,8 @@ def delete_membership(membership_id: MembershipID) -> None:
     db.session.execute(delete(DbMembership).filter_by(id=membership_id))
     db.session.commit()
 
+    board_author_decoration_cache.invalidate_orga_ids()
+
 
 def count_memberships_for_party(party_id: PartyID) -> int:
     """Return the number of memberships the party's teams have in total."""
@@ -369,12 +384,14 @@ def copy_teams_and_memberships(
     for source_team, source_members in source_teams_and_members:
         target_team = create_team(target_party_id, source_team.title)
         for source_member in source_members:
-            create_membership(
+            _create_membership(
                 target_team.id,
                 source_member.user.id,
                 source_member.membership.duties,
             )
 
+    board_author_decoration_cache.invalidate_orga_ids()
+
     return len(source_teams_and_members)
 
 
@@ -430,6 +447,19 @@ def is_orga_for_party(user_id: UserID, party_id: PartyID) -> bool:
     )
 
 
+def get_orga_ids_for_party(party_id: PartyID) -> set[UserID]:
+    """Return the IDs of the organizers (i.e. members of an organizer
+    team) of that party.
+    """
+    user_ids = db.session.scalars(
+        select(DbMembership.user_id)
+        .join(DbOrgaTeam)
+        .filter(DbOrgaTeam.party_id == party_id)
+    ).all()
+
+    return set(user_ids)
+
+
 def select_orgas_for_party(
     user_ids: set[UserID], party_id: PartyID
 ) -> set[UserID]:
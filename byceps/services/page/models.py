@@ -53,3 +53,20 @@ class PageAggregate(Page):
     title: str
     head: str | None
     body: str
+
+
+@dataclass(frozen=True)
+class SitePageIndex:
+    """The pages of a site and their current versions."""
+
+    # keyed by language code and URL path
+    pages_and_versions: dict[tuple[str, str], tuple[Page, PageVersion]]
+    url_paths_by_page_name: dict[str, str]
+
+    def find_page_and_version_for_url_path(
+        self, url_path: str, language_code: str
+    ) -> tuple[Page, PageVersion] | None:
+        """Return the page with that URL path and language code, and
+        its current version.
+        """
+        return self.pages_and_versions.get((language_code, url_path))
@@ -23,8 +23,10 @@ from byceps.services.site.models import Site, SiteID
 from byceps.services.site_navigation.models import NavMenuID
 from byceps.services.user import user_service
 from byceps.services.user.models.user import User
+from byceps.util.cache import VersionedCache
 from byceps.util.result import Err, Ok, Result
 
+from . import rendered_page_cache
 from .dbmodels import DbCurrentPageVersionAssociation, DbPage, DbPageVersion
 from .errors import PageAlreadyExistsError, PageNotFoundError
 from .models import (
@@ -33,6 +35,12 @@ from .models import (
     PageID,
     PageVersion,
     PageVersionID,
+    SitePageIndex,
+)
+
+
+_index_cache: VersionedCache[SiteID, SitePageIndex] = VersionedCache(
+    'page-index', max_size=100
 )
 
 
@@ -94,6 +102,8 @@ def create_page(
 
     db.session.commit()
 
+    invalidate_index()
+
     event = PageCreatedEvent(
         occurred_at=db_version.created_at,
         initiator=EventUser.from_user(creator),
@@ -129,6 +139,9 @@ def update_page(
 
     db.session.commit()
 
+    invalidate_index()
+    rendered_page_cache.invalidate()
+
     site = site_service.get_site(db_page.site_id)
 
     event = PageUpdatedEvent(
@@ -180,6 +193,9 @@ def delete_page(
         db.session.rollback()
         return False, None
 
+    invalidate_index()
+    rendered_page_cache.invalidate()
+
     event = PageDeletedEvent(
         occurred_at=datetime.utcnow(),
         initiator=EventUser.from_user(initiator) if initiator else None,
@@ -199,6 +215,8 @@ def set_nav_menu_id(page_id: PageID, nav_menu_id: NavMenuID | None) -> None:
     db_page.nav_menu_id = nav_menu_id
     db.session.commit()
 
+    invalidate_index()
+
 
 def find_page(page_id: PageID) -> Page | None:
     """Return the page, or `None` if not found."""
@@ -320,33 +338,40 @@ def find_current_version_for_name(
     ).scalar_one_or_none()
 
 
-def find_current_version_for_url_path(
-    site_id: SiteID, url_path: str, language_code: str
-) -> DbPageVersion | None:
-    """Return the current version of the page with that URL path and
-    language code for that site.
+def get_index_for_site(site_id: SiteID) -> SitePageIndex:
+    """Return the index of the pages of that site and their current
+    versions.
+
+    The index is cached per process.
     """
-    return db.session.execute(
-        select(DbPageVersion)
-        .join(DbCurrentPageVersionAssociation)
-        .join(DbPage)
-        .filter(DbPage.site_id == site_id)
-        .filter(DbPage.language_code == language_code)
-        .filter(DbPage.url_path == url_path)
-    ).scalar_one_or_none()
+    return _index_cache.get(site_id, _load_index_for_site)
 
 
-def get_url_paths_by_page_name_for_site(site_id: SiteID) -> dict[str, str]:
-    """Return mapping from page names to URL paths for that site."""
-    rows = (
-        db.session.execute(
-            select(DbPage.name, DbPage.url_path).filter_by(site_id=site_id)
-        )
-        .tuples()
-        .all()
-    )
+def invalidate_index() -> None:
+    """Discard the cached page indexes (in all processes).
+
+    Call after pages or their current versions have changed.
+    """
+    _index_cache.invalidate()
+
+
+def _load_index_for_site(site_id: SiteID) -> SitePageIndex:
+    db_pages = get_pages_for_site_with_current_versions(site_id)
+
+    pages_and_versions = {}
+    url_paths_by_page_name = {}
 
-    return dict(rows)
+    for db_page in db_pages:
+        page = _db_entity_to_page(db_page)
+        version = _db_entity_to_version(db_page.current_version)
+
+        pages_and_versions[page.language_code, page.url_path] = (page, version)
+        url_paths_by_page_name[page.name] = page.url_path
+
+    return SitePageIndex(
+        pages_and_versions=pages_and_versions,
+        url_paths_by_page_name=url_paths_by_page_name,
+    )
 
 
 def get_pages_for_site(site_id: SiteID) -> Sequence[Page]:
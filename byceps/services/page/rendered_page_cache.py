@@ -0,0 +1,53 @@
+"""
+byceps.services.page.rendered_page_cache
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Rendered page versions, kept per process to avoid rendering a page's
+head and body on every view.
+
+As snippets embedded in a page are rendered in the current user's
+language, rendered pages are cached per language code.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from byceps.util.cache import VersionedCache
+
+from .models import PageVersionID
+
+
+Context = dict[str, Any]
+
+
+MAX_SIZE = 500
+
+
+_cache: VersionedCache[tuple[PageVersionID, str], Context] = VersionedCache(
+    'rendered-page', max_size=MAX_SIZE
+)
+
+
+def get_context(
+    version_id: PageVersionID,
+    language_code: str,
+    render: Callable[[], Context],
+) -> Context:
+    """Return the rendered template context for that page version and
+    language.
+
+    Call `render` to obtain it if it is not cached.
+    """
+    context = _cache.get((version_id, language_code), lambda _: render())
+    return context.copy()
+
+
+def invalidate() -> None:
+    """Discard all rendered pages (in all processes).
+
+    Call after pages or snippets have changed.
+    """
+    _cache.invalidate()
@@ -17,6 +17,7 @@ from byceps.services.brand import brand_service
 from byceps.services.brand.dbmodels import DbBrand
 from byceps.services.brand.models import BrandID
 from byceps.services.party.models import PartyID
+from byceps.util.cache import VersionedCache
 
 from .dbmodels import DbParty, DbPartySetting
 from .models import Party, PartyWithBrand
@@ -26,6 +27,9 @@ class UnknownPartyIdError(Exception):
     pass
 
 
+_party_cache: VersionedCache[PartyID, Party] = VersionedCache('party')
+
+
 def create_party(
     party_id: PartyID,
     brand_id: BrandID,
@@ -85,6 +89,8 @@ def update_party(
 
     db.session.commit()
 
+    _party_cache.invalidate()
+
     return _db_entity_to_party(db_party)
 
 
@@ -96,6 +102,8 @@ def delete_party(party_id: PartyID) -> None:
     db.session.execute(delete(DbParty).where(DbParty.id == party_id))
     db.session.commit()
 
+    _party_cache.invalidate()
+
 
 def count_parties() -> int:
     """Return the number of parties (of all brands)."""
@@ -132,6 +140,15 @@ def get_party(party_id: PartyID) -> Party:
     return party
 
 
+def get_party_cached(party_id: PartyID) -> Party:
+    """Return the party with that id.
+
+    The party is served from a process-local cache that is invalidated
+    whenever a party is updated.
+    """
+    return _party_cache.get(party_id, get_party)
+
+
 def get_all_parties() -> list[Party]:
     """Return all parties."""
     db_parties = db.session.scalars(select(DbParty)).all()
@@ -6,15 +6,24 @@ byceps.services.party.party_setting_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from sqlalchemy import delete, select
 
 from byceps.database import db, upsert
 from byceps.services.party.models import PartyID
+from byceps.util.cache import VersionedCache
 
 from .dbmodels import DbPartySetting
 from .models import PartySetting
 
 
+_values_cache: VersionedCache[PartyID, Mapping[str, str]] = VersionedCache(
+    'party-settings', max_size=1000
+)
+
+
 def create_setting(party_id: PartyID, name: str, value: str) -> PartySetting:
     """Create a setting for that party."""
     db_setting = DbPartySetting(party_id, name, value)
@@ -22,6 +31,8 @@ def create_setting(party_id: PartyID, name: str, value: str) -> PartySetting:
     db.session.add(db_setting)
     db.session.commit()
 
+    _values_cache.invalidate()
+
     return _db_entity_to_party_setting(db_setting)
 
 
@@ -42,6 +53,8 @@ def create_or_update_setting(
 
     upsert(table, identifier, replacement)
 
+    _values_cache.invalidate()
+
     return find_setting(party_id, name)
 
 
@@ -57,6 +70,8 @@ def remove_setting(party_id: PartyID, name: str) -> None:
     )
     db.session.commit()
 
+    _values_cache.invalidate()
+
 
 def find_setting(party_id: PartyID, name: str) -> PartySetting | None:
     """Return the setting for that party and with that name, or `None`
@@ -73,13 +88,25 @@ def find_setting(party_id: PartyID, name: str) -> PartySetting | None:
 def find_setting_value(party_id: PartyID, name: str) -> str | None:
     """Return the value of the setting for that party and with that
     name, or `None` if not found.
-    """
-    setting = find_setting(party_id, name)
 
-    if setting is None:
-        return None
+    The settings of a party are loaded at once and cached per process.
+    """
+    values = _values_cache.get(party_id, _load_setting_values)
+    return values.get(name)
+
+
+def _load_setting_values(party_id: PartyID) -> Mapping[str, str]:
+    rows = (
+        db.session.execute(
+            select(DbPartySetting.name, DbPartySetting.value).filter_by(
+                party_id=party_id
+            )
+        )
+        .tuples()
+        .all()
+    )
 
-    return setting.value
+    return MappingProxyType(dict(rows))
 
 
 def get_settings(party_id: PartyID) -> set[PartySetting]:
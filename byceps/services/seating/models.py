@@ -13,7 +13,8 @@ from uuid import UUID
 from pydantic import BaseModel
 
 from byceps.services.party.models import PartyID
-from byceps.services.ticketing.models.ticket import TicketCategoryID
+from byceps.services.ticketing.models.ticket import TicketCategoryID, TicketID
+from byceps.services.user.models.user import UserID
 
 
 SeatingAreaID = NewType('SeatingAreaID', UUID)
@@ -54,6 +55,37 @@ class SeatUtilization:
     total: int
 
 
+@dataclass(frozen=True)
+class SeatMapOccupant:
+    id: UserID
+    screen_name: str | None
+    avatar_url: str | None
+
+
+@dataclass(frozen=True)
+class SeatMapSeat:
+    id: SeatID
+    coord_x: int
+    coord_y: int
+    rotation: int | None
+    category_id: TicketCategoryID
+    label: str | None
+    type_: str | None
+    ticket_id: TicketID | None
+    occupant: SeatMapOccupant | None
+
+    @property
+    def occupied(self) -> bool:
+        return self.ticket_id is not None
+
+
+@dataclass(frozen=True)
+class SeatMap:
+    area_id: SeatingAreaID
+    version: int
+    seats: list[SeatMapSeat]
+
+
 class SerializableSeatToImport(BaseModel):
     area_title: str
     coord_x: int
@@ -19,6 +19,7 @@ from byceps.services.ticketing.models.ticket import (
     TicketCategoryID,
 )
 
+from . import seat_map_service
 from .dbmodels.seat import DbSeat
 from .dbmodels.seat_group import (
     DbSeatGroup,
@@ -76,6 +77,10 @@ def occupy_seat_group(
 
     db.session.commit()
 
+    seat_map_service.discard_seat_maps_for_seats(
+        db_seat.id for db_seat in db_seats
+    )
+
     return db_occupancy
 
 
@@ -92,12 +97,22 @@ def switch_seat_group(
     _ensure_quantities_match(db_to_group, db_ticket_bundle)
     _ensure_actual_quantities_match(db_seats, db_tickets)
 
+    previous_seat_ids = {
+        db_ticket.occupied_seat_id
+        for db_ticket in db_tickets
+        if db_ticket.occupied_seat_id is not None
+    }
+
     db_occupancy.seat_group_id = db_to_group.id
 
     _occupy_seats(db_seats, db_tickets)
 
     db.session.commit()
 
+    seat_map_service.discard_seat_maps_for_seats(
+        previous_seat_ids | {db_seat.id for db_seat in db_seats}
+    )
+
 
 def _ensure_group_is_available(db_seat_group: DbSeatGroup) -> None:
     """Raise an error if the seat group is occupied."""
@@ -163,13 +178,19 @@ def release_seat_group(seat_group_id: SeatGroupID) -> None:
     if db_occupancy is None:
         raise ValueError('Seat group is not occupied.')
 
+    released_seat_ids = set()
+
     for db_ticket in db_occupancy.ticket_bundle.tickets:
+        if db_ticket.occupied_seat_id is not None:
+            released_seat_ids.add(db_ticket.occupied_seat_id)
         db_ticket.occupied_seat = None
 
     db.session.delete(db_occupancy)
 
     db.session.commit()
 
+    seat_map_service.discard_seat_maps_for_seats(released_seat_ids)
+
 
 def count_seat_groups_for_party(party_id: PartyID) -> int:
     """Return the number of seat groups for that party."""
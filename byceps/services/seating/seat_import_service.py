@@ -18,7 +18,12 @@ from byceps.services.ticketing import ticket_category_service
 from byceps.services.ticketing.models.ticket import TicketCategoryID
 from byceps.util.result import Err, Ok, Result
 
-from . import seat_group_service, seat_service, seating_area_service
+from . import (
+    seat_group_service,
+    seat_map_service,
+    seat_service,
+    seating_area_service,
+)
 from .models import Seat, SeatingAreaID, SeatToImport, SerializableSeatToImport
 
 
@@ -176,6 +181,9 @@ def import_seat(seat_to_import: SeatToImport) -> Result[Seat, str]:
             label=seat_to_import.label,
             type_=seat_to_import.type_,
         )
-        return Ok(imported_seat)
     except Exception as e:
         return Err(str(e))
+
+    seat_map_service.discard_seat_maps_for_seats({imported_seat.id})
+
+    return Ok(imported_seat)
@@ -0,0 +1,370 @@
+"""
+byceps.services.seating.seat_map_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Precomputed seat maps of seating areas, stored in Redis.
+
+Per area, a Redis hash has one field per seat, holding a compact JSON
+array with the seat's position, rotation, category, label, and type as
+well as the ticket occupying it and that ticket's user.
+
+A map is built from the database when it is first requested. It is
+discarded whenever seats are occupied or released, or the users of the
+tickets occupying them change, and built again on next access. Each
+change also increments a generation counter per area, which serves as
+the map's version. A build only stores the map if the generation has
+not changed while it was loading the seats, so a map built from data
+that was outdated by then is never stored.
+
+Changes to occupants' screen names and avatars are not tracked; maps
+expire after a while to pick them up.
+
+Maps are not updated in place, seat by seat. Discarding the whole map
+keeps it consistent with the database without having to replicate the
+build logic for every kind of change, at the cost of rebuilding all
+seats of an area (possibly more than a thousand) on the first access
+after each occupation, release, or change of user. As such changes are
+rare compared to reads of the map, that cost is accepted.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Iterable
+import json
+from uuid import UUID
+
+from flask import current_app
+from redis.client import Pipeline
+from redis.exceptions import WatchError
+from sqlalchemy import select
+from sqlalchemy.sql import ColumnElement
+
+from byceps.database import db
+from byceps.services.party.models import PartyID
+from byceps.services.ticketing.dbmodels.ticket import DbTicket
+from byceps.services.ticketing.models.ticket import TicketCategoryID, TicketID
+from byceps.services.user import user_service
+from byceps.services.user.models.user import UserID
+
+from . import seat_service
+from .dbmodels.area import DbSeatingArea
+from .dbmodels.seat import DbSeat
+from .models import (
+    SeatID,
+    SeatingAreaID,
+    SeatMap,
+    SeatMapOccupant,
+    SeatMapSeat,
+    SeatUtilization,
+)
+
+
+SEAT_MAP_TTL_IN_SECONDS = 10 * 60
+SEAT_UTILIZATION_TTL_IN_SECONDS = 60
+
+_KEY_PREFIX = 'byceps:seating'
+
+# Seat IDs are used as field names, so this cannot collide with them.
+_VERSION_FIELD = 'version'
+
+
+# -------------------------------------------------------------------- #
+# seat maps
+
+
+def get_seat_map(area_id: SeatingAreaID) -> SeatMap:
+    """Return the area's seat map, building it first if necessary.
+
+    Seats are ordered by their coordinates.
+    """
+    fields = _get_redis_client().hgetall(_get_seat_map_key(area_id))
+    if not fields:
+        fields = _build_seat_map(area_id)
+
+    return _deserialize_seat_map(area_id, fields)
+
+
+def _build_seat_map(area_id: SeatingAreaID) -> dict[bytes, bytes]:
+    """Build the area's seat map from the database, and store it unless
+    its seats have changed in the meantime.
+    """
+    key = _get_seat_map_key(area_id)
+    generation_key = _get_seat_map_generation_key(area_id)
+
+    with _get_redis_client().pipeline() as pipeline:
+        pipeline.watch(generation_key)
+        generation = int(pipeline.get(generation_key) or 0)
+
+        loaded_seats = _load_seats(DbSeat.area_id == area_id)
+
+        mapping = {
+            str(seat.id): _serialize_seat(seat) for _, _, seat in loaded_seats
+        }
+        mapping[_VERSION_FIELD] = str(generation)
+
+        pipeline.multi()
+        pipeline.hset(key, mapping=mapping)
+        pipeline.expire(key, SEAT_MAP_TTL_IN_SECONDS)
+        try:
+            pipeline.execute()
+        except WatchError:
+            # Seats have changed while they were loaded. Do not store
+            # the map, but build it again on next access.
+            pass
+
+    return {field.encode(): value.encode() for field, value in mapping.items()}
+
+
+def discard_seat_maps_for_seats(seat_ids: Iterable[SeatID]) -> None:
+    """Discard the seat maps of the areas those seats belong to so that
+    they are built again on next access.
+
+    Call *after* the changes have been committed.
+    """
+    seat_ids = set(seat_ids)
+    if not seat_ids:
+        return
+
+    area_and_party_ids = _get_area_and_party_ids(seat_ids)
+
+    pipeline = _get_redis_client().pipeline()
+    for area_id in {area_id for area_id, _ in area_and_party_ids}:
+        _discard_seat_map(pipeline, area_id)
+    for party_id in {party_id for _, party_id in area_and_party_ids}:
+        pipeline.delete(_get_seat_utilization_key(party_id))
+    pipeline.execute()
+
+
+def invalidate_seat_map(area_id: SeatingAreaID) -> None:
+    """Discard the area's seat map so that it is built again on next
+    access.
+    """
+    pipeline = _get_redis_client().pipeline()
+    _discard_seat_map(pipeline, area_id)
+    pipeline.execute()
+
+
+def _discard_seat_map(pipeline: Pipeline, area_id: SeatingAreaID) -> None:
+    # Incrementing the generation keeps builds that are running from
+    # storing what they have loaded.
+    pipeline.incr(_get_seat_map_generation_key(area_id))
+    pipeline.delete(_get_seat_map_key(area_id))
+
+
+def _get_area_and_party_ids(
+    seat_ids: set[SeatID],
+) -> set[tuple[SeatingAreaID, PartyID]]:
+    """Return the IDs of the areas of those seats, along with their
+    parties' IDs.
+    """
+    rows = db.session.execute(
+        select(DbSeat.area_id, DbSeatingArea.party_id)
+        .join(DbSeatingArea)
+        .filter(DbSeat.id.in_(seat_ids))
+        .distinct()
+    ).all()
+
+    return {(area_id, party_id) for area_id, party_id in rows}
+
+
+def _load_seats(
+    criterion: ColumnElement[bool],
+) -> list[tuple[SeatingAreaID, PartyID, SeatMapSeat]]:
+    """Return the matching seats, along with their area and party IDs,
+    for seat maps.
+    """
+    rows = db.session.execute(
+        select(
+            DbSeat.area_id,
+            DbSeatingArea.party_id,
+            DbSeat.id,
+            DbSeat.coord_x,
+            DbSeat.coord_y,
+            DbSeat.rotation,
+            DbSeat.category_id,
+            DbSeat.label,
+            DbSeat.type_,
+            DbTicket.id,
+            DbTicket.used_by_id,
+        )
+        .join(DbSeatingArea)
+        .outerjoin(DbTicket, DbTicket.occupied_seat_id == DbSeat.id)
+        .filter(criterion)
+    ).all()
+
+    user_ids = {row[-1] for row in rows if row[-1] is not None}
+    users_by_id = user_service.get_users_indexed_by_id(
+        user_ids, include_avatars=True
+    )
+
+    loaded_seats = []
+
+    for (
+        area_id,
+        party_id,
+        seat_id,
+        coord_x,
+        coord_y,
+        rotation,
+        category_id,
+        label,
+        type_,
+        ticket_id,
+        user_id,
+    ) in rows:
+        occupant: SeatMapOccupant | None
+        if user_id is not None:
+            user = users_by_id.get(user_id)
+            occupant = SeatMapOccupant(
+                id=user_id,
+                screen_name=user.screen_name if user else None,
+                avatar_url=user.avatar_url if user else None,
+            )
+        else:
+            occupant = None
+
+        seat = SeatMapSeat(
+            id=seat_id,
+            coord_x=coord_x,
+            coord_y=coord_y,
+            rotation=rotation,
+            category_id=category_id,
+            label=label,
+            type_=type_,
+            ticket_id=ticket_id,
+            occupant=occupant,
+        )
+
+        loaded_seats.append((area_id, party_id, seat))
+
+    return loaded_seats
+
+
+def _serialize_seat(seat: SeatMapSeat) -> str:
+    occupant = seat.occupant
+
+    values = [
+        seat.coord_x,
+        seat.coord_y,
+        seat.rotation,
+        str(seat.category_id),
+        seat.label,
+        seat.type_,
+        str(seat.ticket_id) if seat.ticket_id else None,
+        str(occupant.id) if occupant else None,
+        occupant.screen_name if occupant else None,
+        occupant.avatar_url if occupant else None,
+    ]
+
+    return json.dumps(values, separators=(',', ':'))
+
+
+def _deserialize_seat_map(
+    area_id: SeatingAreaID, fields: dict[bytes, bytes]
+) -> SeatMap:
+    version = 0
+    seats = []
+
+    for field, value in fields.items():
+        name = field.decode()
+        if name == _VERSION_FIELD:
+            version = int(value)
+        else:
+            seats.append(_deserialize_seat(SeatID(UUID(name)), value))
+
+    seats.sort(key=lambda seat: (seat.coord_x, seat.coord_y))
+
+    return SeatMap(area_id=area_id, version=version, seats=seats)
+
+
+def _deserialize_seat(seat_id: SeatID, value: bytes) -> SeatMapSeat:
+    (
+        coord_x,
+        coord_y,
+        rotation,
+        category_id,
+        label,
+        type_,
+        ticket_id,
+        user_id,
+        screen_name,
+        avatar_url,
+    ) = json.loads(value)
+
+    occupant: SeatMapOccupant | None
+    if user_id is not None:
+        occupant = SeatMapOccupant(
+            id=UserID(UUID(user_id)),
+            screen_name=screen_name,
+            avatar_url=avatar_url,
+        )
+    else:
+        occupant = None
+
+    return SeatMapSeat(
+        id=seat_id,
+        coord_x=coord_x,
+        coord_y=coord_y,
+        rotation=rotation,
+        category_id=TicketCategoryID(UUID(category_id)),
+        label=label,
+        type_=type_,
+        ticket_id=TicketID(UUID(ticket_id)) if ticket_id else None,
+        occupant=occupant,
+    )
+
+
+# -------------------------------------------------------------------- #
+# seat utilization
+
+
+def get_seat_utilization(party_id: PartyID) -> SeatUtilization:
+    """Return how many seats of how many in total are occupied.
+
+    The numbers are cached briefly, and discarded whenever seats are
+    updated in seat maps.
+    """
+    redis_client = _get_redis_client()
+    key = _get_seat_utilization_key(party_id)
+
+    fields = redis_client.hgetall(key)
+    if fields:
+        return SeatUtilization(
+            occupied=int(fields[b'occupied']), total=int(fields[b'total'])
+        )
+
+    seat_utilization = seat_service.get_seat_utilization(party_id)
+
+    pipeline = redis_client.pipeline()
+    pipeline.hset(
+        key,
+        mapping={
+            'occupied': seat_utilization.occupied,
+            'total': seat_utilization.total,
+        },
+    )
+    pipeline.expire(key, SEAT_UTILIZATION_TTL_IN_SECONDS)
+    pipeline.execute()
+
+    return seat_utilization
+
+
+# -------------------------------------------------------------------- #
+# helpers
+
+
+def _get_seat_map_key(area_id: SeatingAreaID) -> str:
+    return f'{_KEY_PREFIX}:seat_map:{area_id}'
+
+
+def _get_seat_map_generation_key(area_id: SeatingAreaID) -> str:
+    return f'{_KEY_PREFIX}:seat_map_generation:{area_id}'
+
+
+def _get_seat_utilization_key(party_id: PartyID) -> str:
+    return f'{_KEY_PREFIX}:seat_utilization:{party_id}'
+
+
+def _get_redis_client():
+    return current_app.redis_client
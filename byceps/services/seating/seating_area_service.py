@@ -12,6 +12,7 @@ from byceps.database import db
 from byceps.services.party.models import PartyID
 from byceps.services.ticketing.dbmodels.ticket import DbTicket
 
+from . import seat_map_service
 from .dbmodels.area import DbSeatingArea
 from .dbmodels.seat import DbSeat
 from .models import SeatingArea, SeatingAreaID, SeatUtilization
@@ -72,6 +73,8 @@ def delete_area(area_id: SeatingAreaID) -> None:
     db.session.execute(delete(DbSeatingArea).filter_by(id=area_id))
     db.session.commit()
 
+    seat_map_service.invalidate_seat_map(area_id)
+
 
 def count_areas_for_party(party_id: PartyID) -> int:
     """Return the number of seating areas for that party."""
@@ -19,6 +19,7 @@ from byceps.services.news import news_channel_service
 from byceps.services.news.models import NewsChannelID
 from byceps.services.party.models import PartyID
 from byceps.services.shop.storefront.models import StorefrontID
+from byceps.util.cache import VersionedCache
 
 from .dbmodels import DbSite, DbSiteSetting
 from .models import Site, SiteID, SiteWithBrand
@@ -28,6 +29,9 @@ class UnknownSiteIdError(Exception):
     pass
 
 
+_site_cache: VersionedCache[SiteID, Site] = VersionedCache('site')
+
+
 def create_site(
     site_id: SiteID,
     title: str,
@@ -96,6 +100,8 @@ def update_site(
 
     db.session.commit()
 
+    _site_cache.invalidate()
+
     return _db_entity_to_site(db_site)
 
 
@@ -105,6 +111,8 @@ def delete_site(site_id: SiteID) -> None:
     db.session.execute(delete(DbSite).filter_by(id=site_id))
     db.session.commit()
 
+    _site_cache.invalidate()
+
 
 def _find_db_site(site_id: SiteID) -> DbSite | None:
     return db.session.get(DbSite, site_id)
@@ -135,6 +143,15 @@ def get_site(site_id: SiteID) -> Site:
     return _db_entity_to_site(db_site)
 
 
+def get_site_cached(site_id: SiteID) -> Site:
+    """Return the site with that ID.
+
+    The site is served from a process-local cache that is invalidated
+    whenever a site is updated.
+    """
+    return _site_cache.get(site_id, get_site)
+
+
 def get_all_sites() -> set[Site]:
     """Return all sites."""
     db_sites = db.session.scalars(select(DbSite)).all()
@@ -232,6 +249,8 @@ def add_news_channel(site_id: SiteID, news_channel_id: NewsChannelID) -> None:
     db_site.news_channels.append(news_channel)
     db.session.commit()
 
+    _site_cache.invalidate()
+
 
 def remove_news_channel(
     site_id: SiteID, news_channel_id: NewsChannelID
@@ -245,3 +264,5 @@ def remove_news_channel(
 
     db_site.news_channels.remove(news_channel)
     db.session.commit()
+
+    _site_cache.invalidate()
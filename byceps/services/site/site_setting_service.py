@@ -6,14 +6,23 @@ byceps.services.site.site_setting_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from sqlalchemy import delete, select
 
 from byceps.database import db, upsert
+from byceps.util.cache import VersionedCache
 
 from .dbmodels import DbSiteSetting
 from .models import SiteID, SiteSetting
 
 
+_values_cache: VersionedCache[SiteID, Mapping[str, str]] = VersionedCache(
+    'site-settings', max_size=1000
+)
+
+
 def create_setting(site_id: SiteID, name: str, value: str) -> SiteSetting:
     """Create a setting for that site."""
     db_setting = DbSiteSetting(site_id, name, value)
@@ -21,6 +30,8 @@ def create_setting(site_id: SiteID, name: str, value: str) -> SiteSetting:
     db.session.add(db_setting)
     db.session.commit()
 
+    _values_cache.invalidate()
+
     return _db_entity_to_site_setting(db_setting)
 
 
@@ -41,6 +52,8 @@ def create_or_update_setting(
 
     upsert(table, identifier, replacement)
 
+    _values_cache.invalidate()
+
     return find_setting(site_id, name)
 
 
@@ -56,6 +69,8 @@ def remove_setting(site_id: SiteID, name: str) -> None:
     )
     db.session.commit()
 
+    _values_cache.invalidate()
+
 
 def find_setting(site_id: SiteID, name: str) -> SiteSetting | None:
     """Return the setting for that site and with that name, or `None`
@@ -72,13 +87,25 @@ def find_setting(site_id: SiteID, name: str) -> SiteSetting | None:
 def find_setting_value(site_id: SiteID, name: str) -> str | None:
     """Return the value of the setting for that site and with that
     name, or `None` if not found.
-    """
-    setting = find_setting(site_id, name)
 
-    if setting is None:
-        return None
+    The settings of a site are loaded at once and cached per process.
+    """
+    values = _values_cache.get(site_id, _load_setting_values)
+    return values.get(name)
+
+
+def _load_setting_values(site_id: SiteID) -> Mapping[str, str]:
+    rows = (
+        db.session.execute(
+            select(DbSiteSetting.name, DbSiteSetting.value).filter_by(
+                site_id=site_id
+            )
+        )
+        .tuples()
+        .all()
+    )
 
-    return setting.value
+    return MappingProxyType(dict(rows))
 
 
 def get_settings(site_id: SiteID) -> set[SiteSetting]:
@@ -59,6 +59,51 @@ class NavItemForRendering:
     children: list[NavItemForRendering]
 
 
+@dataclass(frozen=True)
+class SiteNavigationIndex:
+    """The visible menus and items of a site, prepared for rendering."""
+
+    # keyed by language code and menu name
+    items_by_menu_name: dict[tuple[str, str], list[NavItem]]
+    items_by_menu_id: dict[NavMenuID, list[NavItem]]
+    # keyed by language code, target type, and target
+    submenu_ids_by_target: dict[tuple[str, NavItemTargetType, str], NavMenuID]
+
+    def get_items_for_menu(
+        self, name: str, language_code: str
+    ) -> list[NavItem]:
+        """Return the items of a menu.
+
+        An empty list is returned if the menu does not exist, is hidden,
+        or contains no visible items.
+        """
+        return self.items_by_menu_name.get((language_code, name), [])
+
+    def get_items_for_menu_id(self, menu_id: NavMenuID) -> list[NavItem]:
+        """Return the items of a menu.
+
+        An empty list is returned if the menu does not exist, is hidden,
+        or contains no visible items.
+        """
+        return self.items_by_menu_id.get(menu_id, [])
+
+    def find_submenu_id_for_page(
+        self, language_code: str, page_name: str
+    ) -> NavMenuID | None:
+        """Return the ID of the submenu this page is referenced by."""
+        return self.submenu_ids_by_target.get(
+            (language_code, NavItemTargetType.page, page_name)
+        )
+
+    def find_submenu_id_for_view(
+        self, language_code: str, view_name: str
+    ) -> NavMenuID | None:
+        """Return the ID of the submenu this view is referenced by."""
+        return self.submenu_ids_by_target.get(
+            (language_code, NavItemTargetType.view, view_name)
+        )
+
+
 @dataclass(frozen=True)
 class NavMenuAggregate(NavMenu):
     items: list[NavItem]
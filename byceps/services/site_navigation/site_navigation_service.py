@@ -6,12 +6,14 @@ byceps.services.site_navigation.site_navigation_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections import defaultdict
 from collections.abc import Iterable
 
 from sqlalchemy import delete, select
 
 from byceps.database import db
 from byceps.services.site.models import SiteID
+from byceps.util.cache import VersionedCache
 from byceps.util.iterables import find, index_of
 from byceps.util.result import Err, Ok, Result
 
@@ -25,10 +27,16 @@ from .models import (
     NavMenuAggregate,
     NavMenuID,
     NavMenuTree,
+    SiteNavigationIndex,
     ViewType,
 )
 
 
+_index_cache: VersionedCache[SiteID, SiteNavigationIndex] = VersionedCache(
+    'site-navigation-index', max_size=100
+)
+
+
 def create_menu(
     site_id: SiteID,
     name: str,
@@ -44,6 +52,8 @@ def create_menu(
     db.session.add(db_menu)
     db.session.commit()
 
+    invalidate_index()
+
     return _db_entity_to_menu(db_menu)
 
 
@@ -62,6 +72,8 @@ def update_menu(
 
         db.session.commit()
 
+        invalidate_index()
+
         return db_menu
 
     return _get_db_menu(menu_id).map(_update_menu).map(_db_entity_to_menu)
@@ -92,6 +104,8 @@ def create_item(
         db_menu.items.append(db_item)
         db.session.commit()
 
+        invalidate_index()
+
         return db_item
 
     return _get_db_menu(menu_id).map(_create_item).map(_db_entity_to_item)
@@ -116,6 +130,8 @@ def update_item(
 
         db.session.commit()
 
+        invalidate_index()
+
         return db_item
 
     return _get_db_item(item_id).map(_update_item).map(_db_entity_to_item)
@@ -128,51 +144,9 @@ def delete_item(item_id: NavItemID) -> Result[None, str]:
         db.session.execute(delete(DbNavItem).where(DbNavItem.id == db_item.id))
         db.session.commit()
 
-    return _get_db_item(item_id).map(_delete_item)
-
-
-def find_submenu_id_for_page(
-    site_id: SiteID, language_code: str, page_name: str
-) -> NavMenuID | None:
-    """Return the ID of the submenu this page is referenced by.
+        invalidate_index()
 
-    If the page is referenced from multiple submenus, the one whose name
-    comes first in alphabetical order is chosen.
-    """
-    return db.session.scalars(
-        select(DbNavItem.menu_id)
-        .join(DbNavMenu)
-        .filter(DbNavMenu.site_id == site_id)
-        .filter(DbNavMenu.language_code == language_code)
-        .filter(DbNavMenu.hidden == False)  # noqa: E712
-        .filter(DbNavMenu.parent_menu_id.is_not(None))  # submenus only
-        .filter(DbNavItem._target_type == NavItemTargetType.page.name)
-        .filter(DbNavItem.target == page_name)
-        .filter(DbNavItem.hidden == False)  # noqa: E712
-        .order_by(DbNavMenu.name)
-    ).first()
-
-
-def find_submenu_id_for_view(
-    site_id: SiteID, language_code: str, view_name: str
-) -> NavMenuID | None:
-    """Return the ID of the submenu this view is referenced by.
-
-    If the view is referenced from multiple submenus, the one whose name
-    comes first in alphabetical order is chosen.
-    """
-    return db.session.scalars(
-        select(DbNavItem.menu_id)
-        .join(DbNavMenu)
-        .filter(DbNavMenu.site_id == site_id)
-        .filter(DbNavMenu.language_code == language_code)
-        .filter(DbNavMenu.hidden == False)  # noqa: E712
-        .filter(DbNavMenu.parent_menu_id.is_not(None))  # submenus only
-        .filter(DbNavItem._target_type == NavItemTargetType.view.name)
-        .filter(DbNavItem.target == view_name)
-        .filter(DbNavItem.hidden == False)  # noqa: E712
-        .order_by(DbNavMenu.name)
-    ).first()
+    return _get_db_item(item_id).map(_delete_item)
 
 
 def find_menu(menu_id: NavMenuID) -> NavMenu | None:
@@ -280,43 +254,72 @@ def _get_db_item(item_id: NavItemID) -> Result[DbNavItem, str]:
     return Ok(db_item)
 
 
-def get_items_for_menu_id(menu_id: NavMenuID) -> list[NavItem]:
-    """Return the items of a menu.
+def get_index_for_site(site_id: SiteID) -> SiteNavigationIndex:
+    """Return the index of the visible menus and items of that site.
 
-    An empty list is returned if the menu does not exist, is hidden, or
-    contains no visible items.
+    The index is cached per process.
     """
-    db_items = db.session.scalars(
-        select(DbNavItem)
-        .join(DbNavMenu)
-        .filter(DbNavMenu.id == menu_id)
-        .filter(DbNavMenu.hidden == False)  # noqa: E712
-        .filter(DbNavItem.hidden == False)  # noqa: E712
-    )
+    return _index_cache.get(site_id, _load_index_for_site)
 
-    return _db_entities_to_items(db_items)
 
+def invalidate_index() -> None:
+    """Discard the cached navigation indexes (in all processes).
 
-def get_items_for_menu(
-    site_id: SiteID, name: str, language_code: str
-) -> list[NavItem]:
-    """Return the items of a menu.
-
-    An empty list is returned if the menu does not exist, is hidden, or
-    contains no visible items.
+    Call after menus or items have changed.
     """
+    _index_cache.invalidate()
+
+
+def _load_index_for_site(site_id: SiteID) -> SiteNavigationIndex:
+    db_menus = db.session.scalars(
+        select(DbNavMenu)
+        .filter(DbNavMenu.site_id == site_id)
+        .filter(DbNavMenu.hidden == False)  # noqa: E712
+    ).all()
+
     db_items = db.session.scalars(
         select(DbNavItem)
         .join(DbNavMenu)
         .filter(DbNavMenu.site_id == site_id)
-        .filter(DbNavMenu.name == name)
-        .filter(DbNavMenu.language_code == language_code)
         .filter(DbNavMenu.hidden == False)  # noqa: E712
         .filter(DbNavItem.hidden == False)  # noqa: E712
+    ).all()
+
+    db_items_by_menu_id = defaultdict(list)
+    for db_item in db_items:
+        db_items_by_menu_id[db_item.menu_id].append(db_item)
+
+    items_by_menu_name = {}
+    items_by_menu_id = {}
+    submenu_ids_by_target = {}
+
+    # If a target is referenced from multiple submenus, the one whose
+    # name comes first in alphabetical order is chosen.
+    for db_menu in sorted(db_menus, key=lambda db_menu: db_menu.name):
+        items = _db_entities_to_items(db_items_by_menu_id[db_menu.id])
+
+        items_by_menu_name[db_menu.language_code, db_menu.name] = items
+        items_by_menu_id[db_menu.id] = items
+
+        if db_menu.parent_menu_id is None:
+            continue
+
+        for item in items:
+            if item.target_type in {
+                NavItemTargetType.page,
+                NavItemTargetType.view,
+            }:
+                submenu_ids_by_target.setdefault(
+                    (db_menu.language_code, item.target_type, item.target),
+                    db_menu.id,
+                )
+
+    return SiteNavigationIndex(
+        items_by_menu_name=items_by_menu_name,
+        items_by_menu_id=items_by_menu_id,
+        submenu_ids_by_target=submenu_ids_by_target,
     )
 
-    return _db_entities_to_items(db_items)
-
 
 def move_item_up(item_id: NavItemID) -> Result[NavItem, str]:
     """Move a menu item upwards by one position."""
@@ -332,6 +335,8 @@ def move_item_up(item_id: NavItemID) -> Result[NavItem, str]:
 
         db.session.commit()
 
+        invalidate_index()
+
         return Ok(db_item)
 
     return _get_db_item(item_id).and_then(_move_item_up).map(_db_entity_to_item)
@@ -352,6 +357,8 @@ def move_item_down(item_id: NavItemID) -> Result[NavItem, str]:
 
         db.session.commit()
 
+        invalidate_index()
+
         return Ok(db_item)
 
     return (
@@ -35,3 +35,11 @@ SnippetID = NewType('SnippetID', UUID)
 
 
 SnippetVersionID = NewType('SnippetVersionID', UUID)
+
+
+@dataclass(frozen=True)
+class CurrentSnippetVersion:
+    """The current version of a snippet, as kept in the snippet index."""
+
+    id: SnippetVersionID
+    body: str
@@ -0,0 +1,74 @@
+"""
+byceps.services.snippet.snippet_index_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Index of the current versions of all snippets of a scope, by name and
+language code, kept per process.
+
+This allows to look up the snippets rendered on a page without a query
+per snippet.
+
+The indexes are discarded by the snippet service whenever snippets are
+created, updated, or deleted.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from sqlalchemy import select
+
+from byceps.database import db
+from byceps.util.cache import VersionedCache
+
+from .dbmodels import (
+    DbCurrentSnippetVersionAssociation,
+    DbSnippet,
+    DbSnippetVersion,
+)
+from .models import CurrentSnippetVersion, SnippetScope
+
+
+SnippetIndex = dict[tuple[str, str], CurrentSnippetVersion]
+
+
+MAX_SCOPES = 100
+
+
+_cache: VersionedCache[SnippetScope, SnippetIndex] = VersionedCache(
+    'snippet-index', max_size=MAX_SCOPES
+)
+
+
+def find_current_version(
+    scope: SnippetScope, name: str, language_code: str
+) -> CurrentSnippetVersion | None:
+    """Return the current version of the snippet with that name and
+    language code in that scope, or `None` if not found.
+    """
+    index = _cache.get(scope, _load_index)
+    return index.get((name, language_code))
+
+
+def invalidate() -> None:
+    """Discard the indexes of all scopes."""
+    _cache.invalidate()
+
+
+def _load_index(scope: SnippetScope) -> SnippetIndex:
+    rows = db.session.execute(
+        select(
+            DbSnippet.name,
+            DbSnippet.language_code,
+            DbSnippetVersion.id,
+            DbSnippetVersion.body,
+        )
+        .join(DbCurrentSnippetVersionAssociation)
+        .join(DbSnippetVersion)
+        .filter(DbSnippet.scope_type == scope.type_)
+        .filter(DbSnippet.scope_name == scope.name)
+    ).all()
+
+    return {
+        (name, language_code): CurrentSnippetVersion(id=version_id, body=body)
+        for name, language_code, version_id, body in rows
+    }
@@ -18,10 +18,12 @@ from byceps.events.snippet import (
     SnippetDeletedEvent,
     SnippetUpdatedEvent,
 )
+from byceps.services.page import rendered_page_cache
 from byceps.services.user import user_service
 from byceps.services.user.models.user import User
 from byceps.util.result import Err, Ok, Result
 
+from . import snippet_index_service, snippet_template_cache
 from .dbmodels import (
     DbCurrentSnippetVersionAssociation,
     DbSnippet,
@@ -95,6 +97,8 @@ def create_snippet(
 
     db.session.commit()
 
+    _invalidate_caches(include_templates=False)
+
     event = SnippetCreatedEvent(
         occurred_at=version.created_at,
         initiator=EventUser.from_user(creator),
@@ -123,6 +127,8 @@ def update_snippet(
 
     db.session.commit()
 
+    _invalidate_caches()
+
     event = SnippetUpdatedEvent(
         occurred_at=version.created_at,
         initiator=EventUser.from_user(creator),
@@ -175,6 +181,8 @@ def delete_snippet(
         db.session.rollback()
         return False, None
 
+    _invalidate_caches()
+
     event = SnippetDeletedEvent(
         occurred_at=datetime.utcnow(),
         initiator=EventUser.from_user(initiator) if initiator else None,
@@ -187,6 +195,17 @@ def delete_snippet(
     return True, event
 
 
+def _invalidate_caches(*, include_templates: bool = True) -> None:
+    """Discard what depends on the set of snippets or their current
+    versions, including rendered pages (which can embed snippets).
+    """
+    snippet_index_service.invalidate()
+    rendered_page_cache.invalidate()
+
+    if include_templates:
+        snippet_template_cache.invalidate()
+
+
 def find_snippet(snippet_id: SnippetID) -> DbSnippet | None:
     """Return the snippet with that id, or `None` if not found."""
     return db.session.get(DbSnippet, snippet_id)
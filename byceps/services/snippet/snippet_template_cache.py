@@ -0,0 +1,44 @@
+"""
+byceps.services.snippet.snippet_template_cache
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Compiled templates of snippet versions, kept per process to avoid
+compiling a snippet's body on every rendering.
+
+As snippet versions are never changed, a compiled template can not
+become outdated. The cache is discarded whenever snippets are updated
+or deleted anyway, to release templates of versions that are no longer
+current.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from jinja2 import Environment, Template
+
+from byceps.util.cache import VersionedCache
+
+from .models import SnippetVersionID
+
+
+MAX_SIZE = 500
+
+
+_cache: VersionedCache[SnippetVersionID, Template] = VersionedCache(
+    'snippet-template', max_size=MAX_SIZE
+)
+
+
+def get_template(
+    version_id: SnippetVersionID, source: str, env: Environment
+) -> Template:
+    """Return the compiled template for that snippet version.
+
+    Compile it in the environment if it is not cached.
+    """
+    return _cache.get(version_id, lambda _: env.from_string(source))
+
+
+def invalidate() -> None:
+    """Discard all compiled templates."""
+    _cache.invalidate()
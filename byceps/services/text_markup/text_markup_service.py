@@ -80,6 +80,11 @@ def _add_quote_formatter(parser: Parser) -> None:
 _PARSER = _create_parser()
 
 
+# Increment whenever a change to the parser or the smileys alters the
+# generated HTML, so that stored renderings are considered outdated.
+RENDERER_VERSION = 1
+
+
 def render_html(value: str) -> str:
     """Render text as HTML, interpreting BBcode."""
     html = _PARSER.format(value)
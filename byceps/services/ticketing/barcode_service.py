@@ -6,10 +6,15 @@ Render Code 128 (set B) barcodes as SVG images.
 
 This implementation only supports code set B.
 
+As the code of a ticket does not change, rendered barcodes are cached
+(per process).
+
 :Copyright: 2014-2024 Jochen Kupperschmidt
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from functools import lru_cache
+
 from jinja2 import Template
 
 
@@ -127,9 +132,13 @@ VALUES_CHARS_WIDTHS = [
 ]
 
 
-VALUES_TO_WIDTHS = {value: width for value, _, width in VALUES_CHARS_WIDTHS}
 CHARS_TO_VALUES = {char: value for value, char, _ in VALUES_CHARS_WIDTHS}
 
+# The bar widths as numbers, indexed by value.
+_BAR_WIDTHS_BY_VALUE = tuple(
+    tuple(map(int, widths)) for _, _, widths in VALUES_CHARS_WIDTHS
+)
+
 
 SVG_TEMPLATE = Template(
     """
@@ -143,10 +152,43 @@ SVG_TEMPLATE = Template(
 )
 
 
-def render_svg(text, *, thickness=3):
+@lru_cache(maxsize=4096)
+def render_svg(text, *, thickness=3, image_height=100):
     values = list(_generate_values(text))
     bar_widths = list(_generate_bars(values, thickness))
-    return _generate_svg(bar_widths)
+    return _generate_svg(bar_widths, image_height=image_height)
+
+
+def render_svgs(texts, *, thickness=3, image_height=100):
+    """Render a barcode for each text (e.g. the codes of all tickets to
+    print on a sheet), but each distinct text only once.
+
+    Return the SVG images indexed by text.
+    """
+    return {
+        text: render_svg(text, thickness=thickness, image_height=image_height)
+        for text in texts
+    }
+
+
+def encode_svg_for_data_uri(svg):
+    """Encode the SVG image to be used inline as part of a data URI.
+
+    Replacements are not complete, but sufficient for barcodes.
+
+    See https://codepen.io/tigt/post/optimizing-svgs-in-data-uris
+    for details.
+    """
+    # fmt: off
+    return (
+        svg
+        .replace('\n', '%0A')
+        .replace('#', '%23')
+        .replace('<', '%3C')
+        .replace('>', '%3E')
+        .replace('"', "'")
+    )
+    # fmt: on
 
 
 def _generate_values(text):
@@ -188,9 +230,8 @@ def _calculate_check_digit_value(values):
 
 def _generate_bars(values, thickness):
     for value in values:
-        for width in VALUES_TO_WIDTHS[value]:
-            bar_width = int(width) * thickness
-            yield bar_width
+        for width in _BAR_WIDTHS_BY_VALUE[value]:
+            yield width * thickness
 
 
 def _generate_svg(bar_widths, *, image_height=100):
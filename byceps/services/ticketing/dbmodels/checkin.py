@@ -32,13 +32,19 @@ class DbTicketCheckIn(db.Model):
     initiator_id: Mapped[UserID] = mapped_column(
         db.Uuid, db.ForeignKey('users.id')
     )
+    idempotency_key: Mapped[str | None] = mapped_column(
+        db.UnicodeText, unique=True
+    )
 
     def __init__(
         self,
         occurred_at: datetime,
         ticket_id: TicketID,
         initiator_id: UserID,
+        *,
+        idempotency_key: str | None = None,
     ) -> None:
         self.occurred_at = occurred_at
         self.ticket_id = ticket_id
         self.initiator_id = initiator_id
+        self.idempotency_key = idempotency_key
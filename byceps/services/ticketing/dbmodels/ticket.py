@@ -41,7 +41,21 @@ class DbTicket(db.Model):
     """
 
     __tablename__ = 'tickets'
-    __table_args__ = (db.UniqueConstraint('party_id', 'code'),)
+    __table_args__ = (
+        db.UniqueConstraint('party_id', 'code'),
+        db.Index(
+            'ix_tickets_code_trgm',
+            'code',
+            postgresql_using='gin',
+            postgresql_ops={'code': 'gin_trgm_ops'},
+        ),
+        db.Index(
+            'ix_tickets_order_number_trgm',
+            'order_number',
+            postgresql_using='gin',
+            postgresql_ops={'order_number': 'gin_trgm_ops'},
+        ),
+    )
 
     id: Mapped[TicketID] = mapped_column(
         db.Uuid, default=generate_uuid7, primary_key=True
@@ -0,0 +1,41 @@
+"""
+byceps.services.ticketing.dbmodels.ticket_counts
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from byceps.database import db
+from byceps.services.party.models import PartyID
+
+
+class DbTicketCounts(db.Model):
+    """Materialized ticket counts of a party.
+
+    Kept up to date by the services that create, revoke, delete, and
+    check in tickets, within the same transaction.
+    """
+
+    __tablename__ = 'ticket_counts'
+
+    party_id: Mapped[PartyID] = mapped_column(
+        db.UnicodeText, db.ForeignKey('parties.id'), primary_key=True
+    )
+    tickets_sold: Mapped[int]
+    tickets_revoked: Mapped[int]
+    tickets_checked_in: Mapped[int]
+
+    def __init__(
+        self,
+        party_id: PartyID,
+        tickets_sold: int,
+        tickets_revoked: int,
+        tickets_checked_in: int,
+    ) -> None:
+        self.party_id = party_id
+        self.tickets_sold = tickets_sold
+        self.tickets_revoked = tickets_revoked
+        self.tickets_checked_in = tickets_checked_in
@@ -8,13 +8,14 @@ byceps.services.ticketing.models.checkin
 
 from dataclasses import dataclass
 from datetime import datetime
+from enum import Enum
 from uuid import UUID
 
 from byceps.services.party.models import PartyID
 from byceps.services.seating.models import SeatID
 from byceps.services.user.models.user import User, UserID
 
-from .ticket import TicketCode, TicketID
+from .ticket import TicketCategoryID, TicketCode, TicketID
 
 
 @dataclass(frozen=True)
@@ -42,3 +43,66 @@ class TicketCheckIn:
     occurred_at: datetime
     ticket_id: TicketID
     initiator_id: UserID
+
+
+@dataclass(frozen=True)
+class CheckInSnapshotUser:
+    id: UserID
+    screen_name: str | None
+    first_name: str | None
+    last_name: str | None
+    suspended: bool
+    deleted: bool
+
+
+@dataclass(frozen=True)
+class CheckInSnapshotTicket:
+    id: TicketID
+    code: TicketCode
+    category_id: TicketCategoryID
+    revoked: bool
+    user_checked_in: bool
+    used_by: CheckInSnapshotUser | None
+    seat_label: str | None
+    seating_area_title: str | None
+
+
+@dataclass(frozen=True)
+class CheckInSnapshot:
+    """The party's tickets as needed to check in users at a desk
+    without a connection to the server.
+    """
+
+    party_id: PartyID
+    version: str
+    created_at: datetime
+    category_titles_by_id: dict[TicketCategoryID, str]
+    tickets: list[CheckInSnapshotTicket]
+
+
+@dataclass(frozen=True)
+class OfflineCheckIn:
+    """A check-in recorded at a desk, to be synchronized."""
+
+    idempotency_key: str
+    ticket_id: TicketID
+    occurred_at: datetime
+
+
+OfflineCheckInStatus = Enum(
+    'OfflineCheckInStatus',
+    [
+        'checked_in',
+        'already_applied',
+        'conflict',
+        'rejected',
+    ],
+)
+
+
+@dataclass(frozen=True)
+class OfflineCheckInResult:
+    idempotency_key: str
+    ticket_id: TicketID
+    status: OfflineCheckInStatus
+    error_message: str | None
@@ -36,3 +36,10 @@ TicketBundleID = NewType('TicketBundleID', UUID)
 class TicketSaleStats:
     tickets_max: int | None
     tickets_sold: int
+
+
+@dataclass(frozen=True)
+class TicketCounts:
+    tickets_sold: int
+    tickets_revoked: int
+    tickets_checked_in: int
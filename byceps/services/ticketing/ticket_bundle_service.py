@@ -13,15 +13,16 @@ from tenacity import retry, retry_if_exception_type, stop_after_attempt
 
 from byceps.database import db, paginate, Pagination
 from byceps.services.party.models import PartyID
-from byceps.services.seating import seat_group_service
+from byceps.services.seating import seat_group_service, seat_map_service
 from byceps.services.shop.order.models.number import OrderNumber
 from byceps.services.user.models.user import User
 
+from . import ticket_count_service
 from .dbmodels.category import DbTicketCategory
 from .dbmodels.ticket import DbTicket
 from .dbmodels.ticket_bundle import DbTicketBundle
 from .models.ticket import TicketBundleID, TicketCategoryID
-from .ticket_creation_service import build_tickets, TicketCreationFailedError
+from .ticket_creation_service import insert_tickets, TicketCreationFailedError
 from .ticket_revocation_service import build_ticket_revoked_log_entry
 
 
@@ -48,19 +49,23 @@ def create_bundle(
         party_id, category_id, ticket_quantity, owner.id, label=label
     )
     db.session.add(db_bundle)
+    db.session.flush()
 
-    db_tickets = list(
-        build_tickets(
+    try:
+        db_tickets = insert_tickets(
             party_id,
             category_id,
             owner,
             ticket_quantity,
-            bundle=db_bundle,
+            bundle_id=db_bundle.id,
             order_number=order_number,
             user=user,
         )
-    )
-    db.session.add_all(db_tickets)
+    except TicketCreationFailedError:
+        db.session.rollback()
+        raise
+
+    ticket_count_service.adjust_counts(party_id, sold=len(db_tickets))
 
     db.session.commit()
 
@@ -86,7 +91,12 @@ def revoke_bundle(
     if seat_group_id is not None:
         seat_group_service.release_seat_group(seat_group_id)
 
+    newly_revoked_ticket_quantity = 0
+
     for db_ticket in db_bundle.tickets:
+        if not db_ticket.revoked:
+            newly_revoked_ticket_quantity += 1
+
         db_ticket.revoked = True
 
         db_log_entry = build_ticket_revoked_log_entry(
@@ -94,17 +104,33 @@ def revoke_bundle(
         )
         db.session.add(db_log_entry)
 
+    ticket_count_service.adjust_counts(
+        db_bundle.party_id,
+        sold=-newly_revoked_ticket_quantity,
+        revoked=newly_revoked_ticket_quantity,
+    )
+
     db.session.commit()
 
 
 def delete_bundle(bundle_id: TicketBundleID) -> None:
     """Delete a bundle and the tickets assigned to it."""
     db_bundle = get_bundle(bundle_id)
+    db_tickets = list(get_tickets_for_bundle(db_bundle.id))
+    occupied_seat_ids = {
+        db_ticket.occupied_seat_id
+        for db_ticket in db_tickets
+        if db_ticket.occupied_seat_id
+    }
+
+    ticket_count_service.adjust_counts_for_removed_tickets(db_tickets)
 
     db.session.execute(delete(DbTicket).filter_by(bundle_id=db_bundle.id))
     db.session.execute(delete(DbTicketBundle).filter_by(id=db_bundle.id))
     db.session.commit()
 
+    seat_map_service.discard_seat_maps_for_seats(occupied_seat_ids)
+
 
 def find_bundle(bundle_id: TicketBundleID) -> DbTicketBundle | None:
     """Return the ticket bundle with that id, or `None` if not found."""
@@ -0,0 +1,174 @@
+"""
+byceps.services.ticketing.ticket_checkin_search_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Find the tickets of a party, and users, at the check-in desk.
+
+A ticket matches a search term by its code, its order number, or by the
+screen name, email address, first name, or last name of its user or its
+owner. Candidates are selected through trigram indexes on those columns,
+and the tickets are returned ranked by similarity to the search term,
+with users and seats already loaded, in a single query.
+
+Users are matched the same way, but deleted users are left out.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Sequence
+
+from sqlalchemy import select, union
+from sqlalchemy.sql import ColumnElement, Select
+
+from byceps.database import db
+from byceps.services.party.models import PartyID
+from byceps.services.seating.dbmodels.seat import DbSeat
+from byceps.services.user import user_service
+from byceps.services.user.dbmodels.detail import DbUserDetail
+from byceps.services.user.dbmodels.user import DbUser
+from byceps.services.user.models.user import UserForAdmin
+
+from .dbmodels.ticket import DbTicket
+
+
+def search_tickets(
+    party_id: PartyID, search_term: str, limit: int
+) -> Sequence[DbTicket]:
+    """Return up to `limit` of the party's tickets matching the search
+    term, best matches first.
+
+    If the search term consists of multiple words, each of them has to
+    match.
+    """
+    terms = search_term.split()
+    if not terms:
+        return []
+
+    used_by = db.aliased(DbUser)
+    used_by_detail = db.aliased(DbUserDetail)
+
+    ticket_used_by = DbTicket.used_by.of_type(used_by)
+    user_detail = used_by.detail.of_type(used_by_detail)
+
+    stmt = (
+        select(DbTicket)
+        .outerjoin(ticket_used_by)
+        .outerjoin(user_detail)
+        .filter(DbTicket.party_id == party_id)
+        .options(
+            db.contains_eager(ticket_used_by).contains_eager(user_detail),
+            db.contains_eager(ticket_used_by).joinedload(used_by.avatar),
+            db.joinedload(DbTicket.owned_by).joinedload(DbUser.avatar),
+            db.joinedload(DbTicket.occupied_seat).joinedload(DbSeat.area),
+        )
+    )
+
+    for term in terms:
+        matching_ticket_ids = _select_matching_ticket_ids(
+            party_id, term
+        ).subquery()
+        stmt = stmt.filter(
+            DbTicket.id.in_(select(matching_ticket_ids.c.ticket_id))
+        )
+
+    rank = _get_rank(search_term, used_by, used_by_detail)
+
+    stmt = stmt.order_by(rank.desc(), DbTicket.created_at).limit(limit)
+
+    return db.session.scalars(stmt).unique().all()
+
+
+def _select_matching_ticket_ids(party_id: PartyID, term: str) -> Select:
+    """Select the IDs of the party's tickets matching the term.
+
+    Each column is matched separately so that its trigram index can be
+    used.
+    """
+    ilike_pattern = f'%{term}%'
+
+    matching_users = _select_matching_user_ids(term).subquery()
+    matching_user_ids = select(matching_users.c.user_id)
+
+    party_ticket_ids = select(DbTicket.id.label('ticket_id')).filter(
+        DbTicket.party_id == party_id
+    )
+
+    return union(
+        party_ticket_ids.filter(DbTicket.code.ilike(ilike_pattern)),
+        party_ticket_ids.filter(DbTicket.order_number.ilike(ilike_pattern)),
+        party_ticket_ids.filter(DbTicket.used_by_id.in_(matching_user_ids)),
+        party_ticket_ids.filter(DbTicket.owned_by_id.in_(matching_user_ids)),
+    )
+
+
+def search_users(search_term: str, limit: int) -> list[UserForAdmin]:
+    """Return up to `limit` users that have not been deleted matching
+    the search term, newest first.
+
+    If the search term consists of multiple words, each of them has to
+    match.
+    """
+    terms = search_term.split()
+    if not terms:
+        return []
+
+    stmt = select(DbUser.id).filter_by(deleted=False)
+
+    for term in terms:
+        matching_users = _select_matching_user_ids(term).subquery()
+        stmt = stmt.filter(DbUser.id.in_(select(matching_users.c.user_id)))
+
+    stmt = stmt.order_by(DbUser.created_at.desc()).limit(limit)
+
+    user_ids = set(db.session.scalars(stmt).all())
+    users = user_service.get_users_for_admin(user_ids)
+
+    return sorted(users, key=lambda user: user.created_at, reverse=True)
+
+
+def _select_matching_user_ids(term: str) -> Select:
+    """Select the IDs of the users whose screen name, email address,
+    first name, or last name matches the term.
+
+    Each column is matched separately so that its trigram index can be
+    used.
+    """
+    ilike_pattern = f'%{term}%'
+
+    return union(
+        select(DbUser.id.label('user_id')).filter(
+            DbUser.screen_name.ilike(ilike_pattern)
+        ),
+        select(DbUser.id.label('user_id')).filter(
+            DbUser.email_address.ilike(ilike_pattern)
+        ),
+        select(DbUserDetail.user_id).filter(
+            DbUserDetail.first_name.ilike(ilike_pattern)
+        ),
+        select(DbUserDetail.user_id).filter(
+            DbUserDetail.last_name.ilike(ilike_pattern)
+        ),
+    )
+
+
+def _get_rank(search_term: str, used_by, used_by_detail) -> ColumnElement:
+    """Rank a ticket by the best similarity of its code, its order
+    number, or its user's names or email address to the search term.
+    """
+    full_name = db.func.concat_ws(
+        ' ', used_by_detail.first_name, used_by_detail.last_name
+    )
+
+    columns = [
+        DbTicket.code,
+        DbTicket.order_number,
+        used_by.screen_name,
+        used_by.email_address,
+        full_name,
+    ]
+
+    # `greatest` ignores `NULL` values.
+    return db.func.greatest(
+        *[db.func.similarity(column, search_term) for column in columns]
+    )
@@ -0,0 +1,139 @@
+"""
+byceps.services.ticketing.ticket_checkin_snapshot_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Export a party's tickets for check-in desks to look them up locally.
+
+The snapshot's version is derived from its content, so a desk can ask
+whether it has changed without downloading it again.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+import hashlib
+
+from sqlalchemy import select
+
+from byceps.database import db
+from byceps.services.party.models import PartyID
+from byceps.services.seating.dbmodels.area import DbSeatingArea
+from byceps.services.seating.dbmodels.seat import DbSeat
+from byceps.services.user.dbmodels.detail import DbUserDetail
+from byceps.services.user.dbmodels.user import DbUser
+
+from .dbmodels.category import DbTicketCategory
+from .dbmodels.ticket import DbTicket
+from .models.checkin import (
+    CheckInSnapshot,
+    CheckInSnapshotTicket,
+    CheckInSnapshotUser,
+)
+from .models.ticket import TicketCategoryID, TicketCode
+
+
+def get_snapshot(party_id: PartyID) -> CheckInSnapshot:
+    """Return the party's tickets with their users, categories, seats,
+    and states.
+    """
+    created_at = datetime.utcnow()
+
+    category_rows = db.session.execute(
+        select(DbTicketCategory.id, DbTicketCategory.title)
+        .filter(DbTicketCategory.party_id == party_id)
+        .order_by(DbTicketCategory.id)
+    ).all()
+
+    ticket_rows = db.session.execute(
+        select(
+            DbTicket.id,
+            DbTicket.code,
+            DbTicket.category_id,
+            DbTicket.revoked,
+            DbTicket.user_checked_in,
+            DbUser.id,
+            DbUser.screen_name,
+            DbUserDetail.first_name,
+            DbUserDetail.last_name,
+            DbUser.suspended,
+            DbUser.deleted,
+            DbSeat.label,
+            DbSeatingArea.title,
+        )
+        .outerjoin(DbUser, DbTicket.used_by_id == DbUser.id)
+        .outerjoin(DbUserDetail, DbUserDetail.user_id == DbUser.id)
+        .outerjoin(DbSeat, DbTicket.occupied_seat_id == DbSeat.id)
+        .outerjoin(DbSeatingArea, DbSeat.area_id == DbSeatingArea.id)
+        .filter(DbTicket.party_id == party_id)
+        .order_by(DbTicket.id)
+    ).all()
+
+    version = _calculate_version(category_rows, ticket_rows)
+
+    category_titles_by_id = {
+        TicketCategoryID(category_id): title
+        for category_id, title in category_rows
+    }
+
+    tickets = [_row_to_ticket(row) for row in ticket_rows]
+
+    return CheckInSnapshot(
+        party_id=party_id,
+        version=version,
+        created_at=created_at,
+        category_titles_by_id=category_titles_by_id,
+        tickets=tickets,
+    )
+
+
+def _calculate_version(category_rows, ticket_rows) -> str:
+    """Derive a version from the rows, which must be in a stable order."""
+    digest = hashlib.sha256()
+
+    for row in [*category_rows, *ticket_rows]:
+        digest.update(repr(tuple(row)).encode())
+        digest.update(b'\n')
+
+    return digest.hexdigest()[:32]
+
+
+def _row_to_ticket(row) -> CheckInSnapshotTicket:
+    (
+        ticket_id,
+        code,
+        category_id,
+        revoked,
+        user_checked_in,
+        user_id,
+        screen_name,
+        first_name,
+        last_name,
+        suspended,
+        deleted,
+        seat_label,
+        seating_area_title,
+    ) = row
+
+    if user_id is not None:
+        used_by = CheckInSnapshotUser(
+            id=user_id,
+            screen_name=screen_name,
+            first_name=first_name,
+            last_name=last_name,
+            suspended=suspended,
+            deleted=deleted,
+        )
+    else:
+        used_by = None
+
+    return CheckInSnapshotTicket(
+        id=ticket_id,
+        code=TicketCode(code),
+        category_id=category_id,
+        revoked=revoked,
+        user_checked_in=user_checked_in,
+        used_by=used_by,
+        seat_label=seat_label,
+        seating_area_title=seating_area_title,
+    )
@@ -6,6 +6,7 @@ byceps.services.ticketing.ticket_code_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections.abc import Set as AbstractSet
 from random import sample
 from string import ascii_uppercase, digits
 
@@ -16,12 +17,18 @@ from .models.ticket import TicketCode
 
 def generate_ticket_codes(
     requested_quantity: int,
+    *,
+    excluded_codes: AbstractSet[TicketCode] = frozenset(),
 ) -> Result[set[TicketCode], str]:
-    """Generate a number of ticket codes."""
+    """Generate a number of ticket codes.
+
+    Pass the codes already in use (by the party's tickets) as
+    `excluded_codes` to avoid generating them again.
+    """
     codes: set[TicketCode] = set()
 
     for _ in range(requested_quantity):
-        generation_result = _generate_ticket_code_not_in(codes)
+        generation_result = _generate_ticket_code_not_in(codes, excluded_codes)
 
         if generation_result.is_err():
             return Err(generation_result.unwrap_err())
@@ -41,12 +48,15 @@ def generate_ticket_codes(
 
 
 def _generate_ticket_code_not_in(
-    codes: set[TicketCode], *, max_attempts: int = 4
+    codes: AbstractSet[TicketCode],
+    excluded_codes: AbstractSet[TicketCode],
+    *,
+    max_attempts: int = 4,
 ) -> Result[TicketCode, str]:
-    """Generate ticket codes and return the first one not in the set."""
+    """Generate ticket codes and return the first one in neither set."""
     for _ in range(max_attempts):
         code = _generate_ticket_code()
-        if code not in codes:
+        if code not in codes and code not in excluded_codes:
             return Ok(code)
 
     return Err(
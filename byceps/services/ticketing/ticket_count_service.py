@@ -0,0 +1,200 @@
+"""
+byceps.services.ticketing.ticket_count_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Materialized counts of sold, revoked, and checked-in tickets per party,
+to avoid counting over all tickets whenever they are displayed.
+
+The counts are adjusted by the services that change tickets, as part
+of their transactions. They can be rebuilt from the tickets themselves
+at any time.
+
+Counting a party's tickets and adjusting their counts are serialized
+through a per-party advisory lock. Otherwise a change made while the
+counts are materialized for the first time could be missed by both the
+count and the adjustment.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections import Counter, defaultdict
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from byceps.database import db, upsert
+from byceps.services.party.models import PartyID
+
+from .dbmodels.ticket import DbTicket
+from .dbmodels.ticket_counts import DbTicketCounts
+from .models.ticket import TicketCounts
+
+
+def get_counts(party_id: PartyID) -> TicketCounts:
+    """Return the ticket counts for that party.
+
+    Count the tickets (once) if their counts have not been materialized
+    yet. Pending changes in the session are not committed.
+    """
+    db_counts = db.session.get(DbTicketCounts, party_id)
+
+    if db_counts is None:
+        return _materialize_counts(party_id)
+
+    return _db_entity_to_counts(db_counts)
+
+
+def adjust_counts(
+    party_id: PartyID,
+    *,
+    sold: int = 0,
+    revoked: int = 0,
+    checked_in: int = 0,
+) -> None:
+    """Adjust the ticket counts for that party by the given deltas.
+
+    Does not commit; meant to be called as part of the transaction that
+    changes the tickets.
+
+    Nothing is adjusted if the counts have not been materialized yet;
+    they will be counted from scratch on first access. As the lock
+    taken here is held until the transaction ends, such a count
+    includes this change.
+    """
+    if not (sold or revoked or checked_in):
+        return
+
+    _lock_counts(db.session, party_id)
+
+    db.session.execute(
+        update(DbTicketCounts)
+        .where(DbTicketCounts.party_id == party_id)
+        .values(
+            tickets_sold=DbTicketCounts.tickets_sold + sold,
+            tickets_revoked=DbTicketCounts.tickets_revoked + revoked,
+            tickets_checked_in=DbTicketCounts.tickets_checked_in + checked_in,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def adjust_counts_for_removed_tickets(db_tickets: list[DbTicket]) -> None:
+    """Adjust the ticket counts for tickets that are about to be deleted.
+
+    Does not commit.
+    """
+    deltas_by_party_id: dict[PartyID, Counter[str]] = defaultdict(Counter)
+
+    for db_ticket in db_tickets:
+        deltas = deltas_by_party_id[db_ticket.party_id]
+        if db_ticket.revoked:
+            deltas['revoked'] -= 1
+        else:
+            deltas['sold'] -= 1
+        if db_ticket.user_checked_in:
+            deltas['checked_in'] -= 1
+
+    for party_id, deltas in deltas_by_party_id.items():
+        adjust_counts(party_id, **deltas)
+
+
+def rebuild_counts(party_id: PartyID) -> TicketCounts:
+    """Count the tickets for that party from scratch and replace the
+    materialized counts.
+    """
+    _lock_counts(db.session, party_id)
+
+    counts = _count_tickets(db.session, party_id)
+
+    table = DbTicketCounts.__table__
+    identifier = {'party_id': party_id}
+    replacement = _counts_to_values(counts)
+
+    upsert(table, identifier, replacement)
+
+    return counts
+
+
+def _materialize_counts(party_id: PartyID) -> TicketCounts:
+    """Count the tickets and store the counts.
+
+    This happens in a transaction of its own so that whatever is
+    pending in the caller's session is left alone.
+    """
+    with db.engine.begin() as connection:
+        # Do not wait for the lock: it might be held by the caller's
+        # own session, after adjusting the counts. Then the counts are
+        # returned, but not stored.
+        locked = connection.scalar(
+            select(db.func.pg_try_advisory_xact_lock(_get_lock_key(party_id)))
+        )
+
+        counts = _count_tickets(connection, party_id)
+
+        if locked:
+            table = DbTicketCounts.__table__
+            values = {'party_id': party_id} | _counts_to_values(counts)
+
+            # Another process might have materialized the counts in the
+            # meantime; keep those.
+            connection.execute(
+                insert(table)
+                .values(**values)
+                .on_conflict_do_nothing(constraint=table.primary_key)
+            )
+
+    return counts
+
+
+def _lock_counts(session: Session, party_id: PartyID) -> None:
+    """Lock the party's ticket counts until the transaction ends."""
+    session.execute(
+        select(db.func.pg_advisory_xact_lock(_get_lock_key(party_id)))
+    )
+
+
+def _get_lock_key(party_id: PartyID):
+    return db.func.hashtext(f'ticket_counts:{party_id}')
+
+
+def _count_tickets(
+    connection: Connection | Session, party_id: PartyID
+) -> TicketCounts:
+    sold, revoked, checked_in = connection.execute(
+        select(
+            db.func.count(DbTicket.id).filter(
+                DbTicket.revoked == False  # noqa: E712
+            ),
+            db.func.count(DbTicket.id).filter(
+                DbTicket.revoked == True  # noqa: E712
+            ),
+            db.func.count(DbTicket.id).filter(
+                DbTicket.user_checked_in == True  # noqa: E712
+            ),
+        ).filter(DbTicket.party_id == party_id)
+    ).one()
+
+    return TicketCounts(
+        tickets_sold=sold,
+        tickets_revoked=revoked,
+        tickets_checked_in=checked_in,
+    )
+
+
+def _counts_to_values(counts: TicketCounts) -> dict[str, int]:
+    return {
+        'tickets_sold': counts.tickets_sold,
+        'tickets_revoked': counts.tickets_revoked,
+        'tickets_checked_in': counts.tickets_checked_in,
+    }
+
+
+def _db_entity_to_counts(db_counts: DbTicketCounts) -> TicketCounts:
+    return TicketCounts(
+        tickets_sold=db_counts.tickets_sold,
+        tickets_revoked=db_counts.tickets_revoked,
+        tickets_checked_in=db_counts.tickets_checked_in,
+    )
@@ -6,20 +6,26 @@ byceps.services.ticketing.ticket_creation_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Iterator
+from datetime import datetime
 
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from tenacity import retry, retry_if_exception_type, stop_after_attempt
 
 from byceps.database import db
 from byceps.services.party.models import PartyID
 from byceps.services.shop.order.models.number import OrderNumber
 from byceps.services.user.models.user import User
+from byceps.util.uuid import generate_uuid7
 
-from . import ticket_code_service
+from . import ticket_code_service, ticket_count_service
 from .dbmodels.ticket import DbTicket
-from .dbmodels.ticket_bundle import DbTicketBundle
-from .models.ticket import TicketCategoryID
+from .models.ticket import (
+    TicketBundleID,
+    TicketCategoryID,
+    TicketCode,
+    TicketID,
+)
 
 
 class TicketCreationFailedError(Exception):
@@ -70,8 +76,8 @@ def create_tickets(
     user: User | None = None,
 ) -> list[DbTicket]:
     """Create a number of tickets of the same category for a single owner."""
-    db_tickets = list(
-        build_tickets(
+    try:
+        db_tickets = insert_tickets(
             party_id,
             category_id,
             owner,
@@ -79,46 +85,108 @@ def create_tickets(
             order_number=order_number,
             user=user,
         )
-    )
+    except TicketCreationFailedError:
+        db.session.rollback()
+        raise
 
-    db.session.add_all(db_tickets)
+    ticket_count_service.adjust_counts(party_id, sold=len(db_tickets))
 
-    try:
-        db.session.commit()
-    except IntegrityError as exc:
-        db.session.rollback()
-        raise TicketCreationFailedWithConflictError(exc) from exc
+    db.session.commit()
 
     return db_tickets
 
 
-def build_tickets(
+def insert_tickets(
     party_id: PartyID,
     category_id: TicketCategoryID,
     owner: User,
     quantity: int,
     *,
-    bundle: DbTicketBundle | None = None,
+    bundle_id: TicketBundleID | None = None,
     order_number: OrderNumber | None = None,
     user: User | None = None,
-) -> Iterator[DbTicket]:
+) -> list[DbTicket]:
+    """Insert a number of tickets, with multi-row statements.
+
+    Codes are generated so that they avoid the codes already in use for
+    the party (which are few compared to the about 2.4 million possible
+    codes). Should a concurrent transaction claim one of them anyway,
+    the tickets affected are skipped and created with other codes.
+
+    Does not commit.
+    """
     if quantity < 1:
         raise ValueError('Ticket quantity must be positive.')
 
-    generation_result = ticket_code_service.generate_ticket_codes(quantity)
+    codes_in_use = _get_ticket_codes_for_party(party_id)
 
-    if generation_result.is_err():
-        raise TicketCreationFailedError(generation_result.unwrap_err())
+    created_at = datetime.utcnow()
+    used_by_id = user.id if user else None
 
-    codes = generation_result.unwrap()
+    ticket_ids: list[TicketID] = []
 
-    for code in codes:
-        yield DbTicket(
-            party_id,
-            code,
-            category_id,
-            owner.id,
-            bundle=bundle,
-            order_number=order_number,
-            used_by_id=user.id if user else None,
+    for _ in range(_MAX_INSERT_ROUNDS):
+        missing_quantity = quantity - len(ticket_ids)
+
+        generation_result = ticket_code_service.generate_ticket_codes(
+            missing_quantity, excluded_codes=codes_in_use
         )
+        if generation_result.is_err():
+            raise TicketCreationFailedError(generation_result.unwrap_err())
+
+        codes = generation_result.unwrap()
+
+        rows = [
+            {
+                'id': generate_uuid7(),
+                'created_at': created_at,
+                'party_id': party_id,
+                'code': code,
+                'bundle_id': bundle_id,
+                'category_id': category_id,
+                'owned_by_id': owner.id,
+                'order_number': order_number,
+                'used_by_id': used_by_id,
+                'revoked': False,
+                'user_checked_in': False,
+            }
+            for code in sorted(codes)
+        ]
+
+        inserted_ticket_ids = db.session.scalars(
+            insert(DbTicket)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=['party_id', 'code'])
+            .returning(DbTicket.id)
+        ).all()
+
+        ticket_ids.extend(inserted_ticket_ids)
+        codes_in_use |= codes
+
+        if len(ticket_ids) == quantity:
+            break
+    else:
+        raise TicketCreationFailedWithConflictError(
+            f'Could not create {quantity} tickets with unique codes.'
+        )
+
+    return list(
+        db.session.scalars(
+            select(DbTicket)
+            .filter(DbTicket.id.in_(ticket_ids))
+            .order_by(DbTicket.id)
+        ).all()
+    )
+
+
+# Conflicts only occur through concurrent ticket creations for the
+# same party, so very few rounds suffice.
+_MAX_INSERT_ROUNDS = 3
+
+
+def _get_ticket_codes_for_party(party_id: PartyID) -> set[TicketCode]:
+    return set(
+        db.session.scalars(
+            select(DbTicket.code).filter(DbTicket.party_id == party_id)
+        ).all()
+    )
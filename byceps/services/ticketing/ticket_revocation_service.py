@@ -7,9 +7,15 @@ byceps.services.ticketing.ticket_revocation_service
 """
 
 from byceps.database import db
+from byceps.services.board import board_author_decoration_cache
 from byceps.services.user.models.user import UserID
 
-from . import ticket_log_service, ticket_seat_management_service, ticket_service
+from . import (
+    ticket_count_service,
+    ticket_log_service,
+    ticket_seat_management_service,
+    ticket_service,
+)
 from .dbmodels.log import DbTicketLogEntry
 from .models.ticket import TicketID
 
@@ -26,6 +32,11 @@ def revoke_ticket(
             db_ticket.id, initiator_id
         ).unwrap()
 
+    if not db_ticket.revoked:
+        ticket_count_service.adjust_counts(
+            db_ticket.party_id, sold=-1, revoked=1
+        )
+
     db_ticket.revoked = True
 
     db_log_entry = build_ticket_revoked_log_entry(
@@ -35,6 +46,8 @@ def revoke_ticket(
 
     db.session.commit()
 
+    board_author_decoration_cache.invalidate_ticket_user_ids()
+
 
 def revoke_tickets(
     ticket_ids: set[TicketID],
@@ -53,6 +66,11 @@ def revoke_tickets(
             ).unwrap()
 
     for db_ticket in db_tickets:
+        if not db_ticket.revoked:
+            ticket_count_service.adjust_counts(
+                db_ticket.party_id, sold=-1, revoked=1
+            )
+
         db_ticket.revoked = True
 
         db_log_entry = build_ticket_revoked_log_entry(
@@ -62,6 +80,8 @@ def revoke_tickets(
 
     db.session.commit()
 
+    board_author_decoration_cache.invalidate_ticket_user_ids()
+
 
 def build_ticket_revoked_log_entry(
     ticket_id: TicketID, initiator_id: UserID, reason: str | None = None
@@ -14,13 +14,14 @@ from sqlalchemy import delete, select
 from byceps.database import db, paginate, Pagination
 from byceps.services.party import party_service
 from byceps.services.party.models import PartyID
+from byceps.services.seating import seat_map_service
 from byceps.services.seating.dbmodels.seat import DbSeat
 from byceps.services.seating.models import SeatID
 from byceps.services.shop.order.models.number import OrderNumber
 from byceps.services.user.dbmodels.user import DbUser
 from byceps.services.user.models.user import UserID
 
-from . import ticket_code_service, ticket_log_service
+from . import ticket_code_service, ticket_count_service, ticket_log_service
 from .dbmodels.category import DbTicketCategory
 from .dbmodels.log import DbTicketLogEntry
 from .dbmodels.ticket import DbTicket
@@ -61,10 +62,19 @@ def update_ticket_code(
 
 def delete_ticket(ticket_id: TicketID) -> None:
     """Delete a ticket and its log entries."""
+    db_ticket = find_ticket(ticket_id)
+    occupied_seat_ids: set[SeatID] = set()
+    if db_ticket is not None:
+        ticket_count_service.adjust_counts_for_removed_tickets([db_ticket])
+        if db_ticket.occupied_seat_id:
+            occupied_seat_ids.add(db_ticket.occupied_seat_id)
+
     db.session.execute(delete(DbTicketLogEntry).filter_by(ticket_id=ticket_id))
     db.session.execute(delete(DbTicket).filter_by(id=ticket_id))
     db.session.commit()
 
+    seat_map_service.discard_seat_maps_for_seats(occupied_seat_ids)
+
 
 def find_ticket(ticket_id: TicketID) -> DbTicket | None:
     """Return the ticket with that id, or `None` if not found."""
@@ -111,6 +121,31 @@ def get_tickets_created_by_order(
     ).all()
 
 
+def get_tickets_for_printing(
+    party_id: PartyID, *, order_number: OrderNumber | None = None
+) -> Sequence[DbTicket]:
+    """Return the party's non-revoked tickets (optionally only those
+    created by that order), with what is printed on them.
+    """
+    stmt = (
+        select(DbTicket)
+        .filter(DbTicket.party_id == party_id)
+        .filter(DbTicket.revoked == False)  # noqa: E712
+        .options(
+            db.joinedload(DbTicket.category),
+            db.joinedload(DbTicket.owned_by).joinedload(DbUser.detail),
+            db.joinedload(DbTicket.used_by).joinedload(DbUser.detail),
+            db.joinedload(DbTicket.occupied_seat),
+        )
+        .order_by(DbTicket.created_at, DbTicket.code)
+    )
+
+    if order_number is not None:
+        stmt = stmt.filter(DbTicket.order_number == order_number)
+
+    return db.session.scalars(stmt).all()
+
+
 def get_tickets_for_seat_manager(
     user_id: UserID, party_id: PartyID
 ) -> Sequence[DbTicket]:
@@ -327,55 +362,15 @@ def get_tickets_with_details_for_party_paginated(
     return paginate(stmt, page, per_page)
 
 
-def count_revoked_tickets_for_party(party_id: PartyID) -> int:
-    """Return the number of revoked tickets for that party."""
-    return (
-        db.session.scalar(
-            select(db.func.count(DbTicket.id))
-            .filter_by(party_id=party_id)
-            .filter_by(revoked=True)
-        )
-        or 0
-    )
-
-
-def count_sold_tickets_for_party(party_id: PartyID) -> int:
-    """Return the number of "sold" (i.e. generated and not revoked)
-    tickets for that party.
-    """
-    return (
-        db.session.scalar(
-            select(db.func.count(DbTicket.id))
-            .filter_by(party_id=party_id)
-            .filter_by(revoked=False)
-        )
-        or 0
-    )
-
-
-def count_tickets_checked_in_for_party(party_id: PartyID) -> int:
-    """Return the number tickets for that party that were used to check
-    in their respective user.
-    """
-    return (
-        db.session.scalar(
-            select(db.func.count(DbTicket.id))
-            .filter_by(party_id=party_id)
-            .filter_by(user_checked_in=True)
-        )
-        or 0
-    )
-
-
 def get_ticket_sale_stats(party_id: PartyID) -> TicketSaleStats:
     """Return the number of maximum and sold tickets, respectively."""
-    party = party_service.get_party(party_id)
+    party = party_service.get_party_cached(party_id)
 
-    sold = count_sold_tickets_for_party(party.id)
+    counts = ticket_count_service.get_counts(party.id)
 
     return TicketSaleStats(
         tickets_max=party.max_ticket_quantity,
-        tickets_sold=sold,
+        tickets_sold=counts.tickets_sold,
     )
 
 
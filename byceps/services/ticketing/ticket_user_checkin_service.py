@@ -6,6 +6,8 @@ byceps.services.ticketing.ticket_user_checkin_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections.abc import Sequence
+
 from sqlalchemy import select
 
 from byceps.database import db
@@ -13,13 +15,28 @@ from byceps.events.ticketing import TicketCheckedInEvent
 from byceps.services.party.models import PartyID
 from byceps.services.ticketing.dbmodels.checkin import DbTicketCheckIn
 from byceps.services.user import user_service
-from byceps.services.user.models.user import User
+from byceps.services.user.models.user import User, UserID
 from byceps.util.result import Err, Ok, Result
 
-from . import ticket_domain_service, ticket_log_service, ticket_service
+from . import (
+    ticket_count_service,
+    ticket_domain_service,
+    ticket_log_service,
+    ticket_service,
+)
 from .dbmodels.ticket import DbTicket
-from .errors import TicketingError, UserIdUnknownError
-from .models.checkin import PotentialTicketForCheckIn, TicketCheckIn
+from .errors import (
+    TicketingError,
+    UserAlreadyCheckedInError,
+    UserIdUnknownError,
+)
+from .models.checkin import (
+    OfflineCheckIn,
+    OfflineCheckInResult,
+    OfflineCheckInStatus,
+    PotentialTicketForCheckIn,
+    TicketCheckIn,
+)
 from .models.log import TicketLogEntry
 from .models.ticket import TicketCode, TicketID
 
@@ -67,21 +84,213 @@ def _persist_check_in(
     check_in: TicketCheckIn,
     event: TicketCheckedInEvent,
     log_entry: TicketLogEntry,
+) -> None:
+    _add_check_in(db_ticket, event, log_entry)
+
+    ticket_count_service.adjust_counts(db_ticket.party_id, checked_in=1)
+
+    db.session.commit()
+
+
+def _add_check_in(
+    db_ticket: DbTicket,
+    event: TicketCheckedInEvent,
+    log_entry: TicketLogEntry,
+    *,
+    idempotency_key: str | None = None,
 ) -> None:
     db_ticket.user_checked_in = True
 
     initiator_id = event.initiator.id if event.initiator else None
 
     db_check_in = DbTicketCheckIn(
-        event.occurred_at, event.ticket_id, initiator_id
+        event.occurred_at,
+        event.ticket_id,
+        initiator_id,
+        idempotency_key=idempotency_key,
     )
     db.session.add(db_check_in)
 
     db_log_entry = ticket_log_service.to_db_entry(log_entry)
     db.session.add(db_log_entry)
 
+
+def check_in_users_in_bulk(
+    party_id: PartyID,
+    offline_check_ins: Sequence[OfflineCheckIn],
+    initiator: User,
+) -> tuple[list[OfflineCheckInResult], list[TicketCheckedInEvent]]:
+    """Apply check-ins recorded at a desk in a single transaction.
+
+    Each check-in carries an idempotency key. Check-ins whose key has
+    already been applied (by an earlier, maybe partially failed,
+    synchronization) are not applied again.
+
+    Return a result for each check-in (in the given order) and the
+    events of those that were applied.
+    """
+    # Lock the tickets to detect check-ins by concurrent
+    # synchronizations of other desks.
+    ticket_ids = {
+        offline_check_in.ticket_id for offline_check_in in offline_check_ins
+    }
+    db_tickets_by_id = {
+        db_ticket.id: db_ticket
+        for db_ticket in db.session.scalars(
+            select(DbTicket)
+            .filter(DbTicket.id.in_(ticket_ids))
+            .order_by(DbTicket.id)
+            .with_for_update()
+        )
+    }
+
+    # Look up applied keys only once the tickets are locked so that a
+    # retry waiting for the synchronization it repeats sees its keys.
+    applied_ticket_ids_by_key = _get_applied_ticket_ids_by_idempotency_key(
+        {
+            offline_check_in.idempotency_key
+            for offline_check_in in offline_check_ins
+        }
+    )
+
+    user_ids = {
+        db_ticket.used_by_id
+        for db_ticket in db_tickets_by_id.values()
+        if db_ticket.used_by_id is not None
+    }
+    users_by_id = user_service.get_users_indexed_by_id(user_ids)
+
+    results = []
+    events = []
+
+    for offline_check_in in offline_check_ins:
+        idempotency_key = offline_check_in.idempotency_key
+
+        applied_ticket_id = applied_ticket_ids_by_key.get(idempotency_key)
+        if applied_ticket_id is not None:
+            results.append(
+                OfflineCheckInResult(
+                    idempotency_key=idempotency_key,
+                    ticket_id=applied_ticket_id,
+                    status=OfflineCheckInStatus.already_applied,
+                    error_message=None,
+                )
+            )
+            continue
+
+        check_in_result = _check_in_user_offline(
+            party_id,
+            offline_check_in,
+            initiator,
+            db_tickets_by_id.get(offline_check_in.ticket_id),
+            users_by_id,
+        )
+
+        if check_in_result.is_err():
+            err = check_in_result.unwrap_err()
+            status = (
+                OfflineCheckInStatus.conflict
+                if isinstance(err, UserAlreadyCheckedInError)
+                else OfflineCheckInStatus.rejected
+            )
+            results.append(
+                OfflineCheckInResult(
+                    idempotency_key=idempotency_key,
+                    ticket_id=offline_check_in.ticket_id,
+                    status=status,
+                    error_message=err.message,
+                )
+            )
+            continue
+
+        event = check_in_result.unwrap()
+        events.append(event)
+        applied_ticket_ids_by_key[idempotency_key] = event.ticket_id
+
+        results.append(
+            OfflineCheckInResult(
+                idempotency_key=idempotency_key,
+                ticket_id=event.ticket_id,
+                status=OfflineCheckInStatus.checked_in,
+                error_message=None,
+            )
+        )
+
+    if events:
+        ticket_count_service.adjust_counts(party_id, checked_in=len(events))
+
     db.session.commit()
 
+    return results, events
+
+
+def _get_applied_ticket_ids_by_idempotency_key(
+    idempotency_keys: set[str],
+) -> dict[str, TicketID]:
+    if not idempotency_keys:
+        return {}
+
+    rows = db.session.execute(
+        select(
+            DbTicketCheckIn.idempotency_key, DbTicketCheckIn.ticket_id
+        ).filter(DbTicketCheckIn.idempotency_key.in_(idempotency_keys))
+    ).all()
+
+    return {idempotency_key: ticket_id for idempotency_key, ticket_id in rows}
+
+
+def _check_in_user_offline(
+    party_id: PartyID,
+    offline_check_in: OfflineCheckIn,
+    initiator: User,
+    db_ticket: DbTicket | None,
+    users_by_id: dict[UserID, User],
+) -> Result[TicketCheckedInEvent, TicketingError]:
+    if db_ticket is None:
+        return Err(
+            TicketingError(f"Unknown ticket ID '{offline_check_in.ticket_id}'")
+        )
+
+    used_by_id = db_ticket.used_by_id
+    if used_by_id is None:
+        used_by = None
+    else:
+        used_by = users_by_id.get(used_by_id)
+        if used_by is None:
+            return Err(UserIdUnknownError(f"Unknown user ID '{used_by_id}'"))
+
+    # Reflects check-ins applied earlier in the same batch.
+    potential_ticket_for_check_in = PotentialTicketForCheckIn(
+        id=db_ticket.id,
+        party_id=db_ticket.party_id,
+        code=TicketCode(db_ticket.code),
+        occupied_seat_id=db_ticket.occupied_seat_id,
+        used_by=used_by,
+        revoked=db_ticket.revoked,
+        user_checked_in=db_ticket.user_checked_in,
+    )
+
+    check_in_result = ticket_domain_service.check_in_user(
+        party_id,
+        potential_ticket_for_check_in,
+        initiator,
+        occurred_at=offline_check_in.occurred_at,
+    )
+
+    if check_in_result.is_err():
+        return Err(check_in_result.unwrap_err())
+
+    _, event, log_entry = check_in_result.unwrap()
+
+    _add_check_in(
+        db_ticket,
+        event,
+        log_entry,
+        idempotency_key=offline_check_in.idempotency_key,
+    )
+
+    return Ok(event)
+
 
 def revert_user_check_in(ticket_id: TicketID, initiator: User) -> None:
     """Revert a user check-in that was done by mistake."""
@@ -92,6 +301,8 @@ def revert_user_check_in(ticket_id: TicketID, initiator: User) -> None:
 
     db_ticket.user_checked_in = False
 
+    ticket_count_service.adjust_counts(db_ticket.party_id, checked_in=-1)
+
     db_log_entry = ticket_log_service.build_db_entry(
         'user-check-in-reverted',
         db_ticket.id,
@@ -7,6 +7,8 @@ byceps.services.ticketing.ticket_user_management_service
 """
 
 from byceps.database import db
+from byceps.services.board import board_author_decoration_cache
+from byceps.services.seating import seat_map_service
 from byceps.services.user import user_service
 from byceps.services.user.models.user import UserID
 from byceps.util.result import Err, Ok, Result
@@ -120,6 +122,13 @@ def appoint_user(
 
     db.session.commit()
 
+    board_author_decoration_cache.invalidate_ticket_user_ids()
+
+    if db_ticket.occupied_seat_id is not None:
+        seat_map_service.discard_seat_maps_for_seats(
+            {db_ticket.occupied_seat_id}
+        )
+
     return Ok(None)
 
 
@@ -154,4 +163,11 @@ def withdraw_user(
 
     db.session.commit()
 
+    board_author_decoration_cache.invalidate_ticket_user_ids()
+
+    if db_ticket.occupied_seat_id is not None:
+        seat_map_service.discard_seat_maps_for_seats(
+            {db_ticket.occupied_seat_id}
+        )
+
     return Ok(None)
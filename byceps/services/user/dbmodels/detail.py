@@ -21,6 +21,20 @@ class DbUserDetail(db.Model):
     """Detailed information about a specific user."""
 
     __tablename__ = 'user_details'
+    __table_args__ = (
+        db.Index(
+            'ix_user_details_first_name_trgm',
+            'first_name',
+            postgresql_using='gin',
+            postgresql_ops={'first_name': 'gin_trgm_ops'},
+        ),
+        db.Index(
+            'ix_user_details_last_name_trgm',
+            'last_name',
+            postgresql_using='gin',
+            postgresql_ops={'last_name': 'gin_trgm_ops'},
+        ),
+    )
 
     user_id: Mapped[UserID] = mapped_column(
         db.Uuid, db.ForeignKey('users.id'), primary_key=True
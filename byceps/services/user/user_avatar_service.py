@@ -11,6 +11,7 @@ from typing import BinaryIO
 from sqlalchemy import select
 
 from byceps.database import db
+from byceps.services.authn.session import current_user_cache
 from byceps.services.image import image_service
 from byceps.util import upload
 from byceps.util.image import create_thumbnail
@@ -74,6 +75,8 @@ def update_avatar_image(
 
     db.session.commit()
 
+    current_user_cache.invalidate_user(user_id)
+
     return Ok(db_avatar.id)
 
 
@@ -104,6 +107,8 @@ def remove_avatar_image(user_id: UserID, initiator: User) -> None:
 
     db.session.commit()
 
+    current_user_cache.invalidate_user(user_id)
+
 
 def get_db_avatar(avatar_id: UserAvatarID) -> DbUserAvatar:
     """Return the avatar with that ID, or raise exception if not found."""
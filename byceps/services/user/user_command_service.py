@@ -20,6 +20,7 @@ from byceps.events.user import (
     UserEmailAddressChangedEvent,
     UserScreenNameChangedEvent,
 )
+from byceps.services.authn.session import current_user_cache
 from byceps.services.authz import authz_service
 from byceps.services.authz.models import RoleID
 
@@ -107,6 +108,8 @@ def _persist_account_suspension(
 
     db.session.commit()
 
+    current_user_cache.invalidate_user(db_user.id)
+
 
 def unsuspend_account(
     user: User, initiator: User, reason: str
@@ -133,6 +136,8 @@ def _persist_account_unsuspension(
 
     db.session.commit()
 
+    current_user_cache.invalidate_user(db_user.id)
+
 
 def change_screen_name(
     user: User,
@@ -163,6 +168,8 @@ def _persist_screen_name_change(
 
     db.session.commit()
 
+    current_user_cache.invalidate_user(db_user.id)
+
 
 def change_email_address(
     user: User,
@@ -214,6 +221,8 @@ def update_locale(user_id: UserID, locale: Locale | None) -> None:
     db_user.locale = locale.language if (locale is not None) else None
     db.session.commit()
 
+    current_user_cache.invalidate_user(user_id)
+
 
 def update_user_details(
     user_id: UserID,
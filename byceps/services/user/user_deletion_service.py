@@ -59,6 +59,8 @@ def _persist_account_deletion(
 
     db.session.commit()
 
+    authz_service.invalidate_index()
+
 
 def _anonymize_account(db_user: DbUser) -> None:
     """Remove user details from the account."""
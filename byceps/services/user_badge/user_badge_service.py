@@ -9,6 +9,7 @@ byceps.services.user_badge.user_badge_service
 from sqlalchemy import delete, select
 
 from byceps.database import db
+from byceps.services.board import board_author_decoration_cache
 from byceps.services.brand.models import BrandID
 
 from .dbmodels import DbBadge
@@ -63,6 +64,9 @@ def update_badge(
 
     db.session.commit()
 
+    # Whether the badge is featured might have changed.
+    board_author_decoration_cache.invalidate_featured_badges()
+
     return _db_entity_to_badge(db_badge)
 
 
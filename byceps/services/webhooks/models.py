@@ -31,6 +31,19 @@ class OutgoingWebhook:
     enabled: bool
 
 
+@dataclass(frozen=True)
+class WebhookRoutingTable:
+    """The enabled webhooks, indexed by the names of the events they
+    subscribe to.
+    """
+
+    webhooks_by_event_name: dict[str, list[OutgoingWebhook]]
+
+    def get_webhooks(self, event_name: str) -> list[OutgoingWebhook]:
+        """Return the enabled webhooks that subscribe to the event."""
+        return self.webhooks_by_event_name.get(event_name, [])
+
+
 @dataclass(frozen=True)
 class Announcement:
     text: str
@@ -44,3 +57,4 @@ class AnnouncementRequest:
     data: dict[str, Any]
     expected_response_status_code: int | None
     announce_at: datetime | None = None
+    format: str | None = None
@@ -0,0 +1,47 @@
+"""
+byceps.services.webhooks.webhook_delivery_stats_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Count the outcomes of announcement deliveries per webhook.
+
+The counters are kept in Redis so that all worker processes contribute
+to them, and are exposed as metrics.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from uuid import UUID
+
+from flask import current_app
+
+from .models import WebhookID
+
+
+_COUNTS_KEY = 'byceps:webhooks:delivery_counts'
+
+
+def increment_count(
+    webhook_id: WebhookID, outcome: str, *, amount: int = 1
+) -> None:
+    """Add to the count of deliveries with that outcome."""
+    if amount < 1:
+        return
+
+    current_app.redis_client.hincrby(
+        _COUNTS_KEY, f'{webhook_id}:{outcome}', amount
+    )
+
+
+def get_counts() -> dict[tuple[WebhookID, str], int]:
+    """Return the delivery counts, indexed by webhook ID and outcome."""
+    values = current_app.redis_client.hgetall(_COUNTS_KEY)
+
+    counts = {}
+
+    for field, value in values.items():
+        webhook_id_str, _, outcome = field.decode().partition(':')
+        webhook_id = WebhookID(UUID(webhook_id_str))
+        counts[(webhook_id, outcome)] = int(value)
+
+    return counts
@@ -6,15 +6,29 @@ byceps.services.webhooks.webhook_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections import defaultdict
 from typing import Any
 
 from sqlalchemy import delete, select
 
 from byceps.database import db
+from byceps.util.cache import VersionedCache
 from byceps.util.result import Err, Ok, Result
 
 from .dbmodels import DbOutgoingWebhook
-from .models import EventFilters, OutgoingWebhook, WebhookID
+from .models import (
+    EventFilters,
+    OutgoingWebhook,
+    WebhookID,
+    WebhookRoutingTable,
+)
+
+
+_ROUTING_TABLE_CACHE_KEY = 'all'
+
+_routing_table_cache: VersionedCache[str, WebhookRoutingTable] = VersionedCache(
+    'webhook-routing-table'
+)
 
 
 def create_outgoing_webhook(
@@ -43,6 +57,8 @@ def create_outgoing_webhook(
     db.session.add(db_webhook)
     db.session.commit()
 
+    invalidate_routing_table()
+
     return _db_entity_to_outgoing_webhook(db_webhook)
 
 
@@ -73,6 +89,8 @@ def update_outgoing_webhook(
 
     db.session.commit()
 
+    invalidate_routing_table()
+
     return Ok(_db_entity_to_outgoing_webhook(db_webhook))
 
 
@@ -83,6 +101,8 @@ def delete_outgoing_webhook(webhook_id: WebhookID) -> None:
     )
     db.session.commit()
 
+    invalidate_routing_table()
+
 
 def find_webhook(webhook_id: WebhookID) -> OutgoingWebhook | None:
     """Return the webhook with that ID, if found."""
@@ -108,19 +128,40 @@ def get_all_webhooks() -> list[OutgoingWebhook]:
     ]
 
 
-def get_enabled_outgoing_webhooks(event_type: str) -> list[OutgoingWebhook]:
-    """Return the configurations for enabled outgoing webhooks for that
-    event type.
+def get_routing_table() -> WebhookRoutingTable:
+    """Return the enabled webhooks indexed by the events they subscribe
+    to.
+
+    The table is loaded once per process and kept until webhooks are
+    created, updated, or deleted.
     """
-    db_webhooks = db.session.scalars(
-        select(DbOutgoingWebhook)
-        .filter(DbOutgoingWebhook._event_types.contains([event_type]))
-        .filter_by(enabled=True)
-    ).all()
+    return _routing_table_cache.get(
+        _ROUTING_TABLE_CACHE_KEY, _load_routing_table
+    )
 
-    return [
-        _db_entity_to_outgoing_webhook(db_webhook) for db_webhook in db_webhooks
-    ]
+
+def invalidate_routing_table() -> None:
+    """Discard the routing table in all processes."""
+    _routing_table_cache.invalidate()
+
+
+def _load_routing_table(_: str) -> WebhookRoutingTable:
+    webhooks_by_event_name = defaultdict(list)
+
+    for webhook in get_all_webhooks():
+        if not webhook.enabled:
+            continue
+
+        for event_name in webhook.event_types:
+            webhooks_by_event_name[event_name].append(webhook)
+
+    # Stable order is easier to test.
+    for webhooks in webhooks_by_event_name.values():
+        webhooks.sort(key=lambda wh: wh.extra_fields.get('channel', ''))
+
+    return WebhookRoutingTable(
+        webhooks_by_event_name=dict(webhooks_by_event_name)
+    )
 
 
 def _db_entity_to_outgoing_webhook(
@@ -38,18 +38,28 @@ def register_permissions(
 
 def get_permissions_for_user(user_id: UserID) -> frozenset[str]:
     """Return the permissions this user has been granted."""
-    registered_permission_ids = (
-        permission_registry.get_registered_permission_ids()
-    )
-    user_permission_ids = authz_service.get_permission_ids_for_user(user_id)
+    permissions, _ = get_permissions_for_user_with_index_version(user_id)
+    return permissions
+
+
+def get_permissions_for_user_with_index_version(
+    user_id: UserID,
+) -> tuple[frozenset[str], int]:
+    """Return the permissions this user has been granted, and the
+    version of the authorization index they have been taken from.
+    """
+    authz_index, index_version = authz_service.get_index_with_version()
+    user_permission_ids = authz_index.get_permission_ids_for_user(user_id)
 
     # Ignore unregistered permission IDs.
-    return frozenset(
+    permissions = frozenset(
         str(permission_id)
-        for permission_id in registered_permission_ids
-        if permission_id in user_permission_ids
+        for permission_id in user_permission_ids
+        if permission_registry.is_permission_registered(permission_id)
     )
 
+    return permissions, index_version
+
 
 class PermissionRegistry:
     """A collection of valid permissions."""
@@ -63,6 +73,10 @@ class PermissionRegistry:
         """Add permission to the registry."""
         self._permissions[permission_id] = label
 
+    def is_permission_registered(self, permission_id: PermissionID) -> bool:
+        """Return `True` if the permission is registered."""
+        return permission_id in self._permissions
+
     def get_registered_permission_ids(self) -> frozenset[PermissionID]:
         """Return all registered permission IDs."""
         return frozenset(self._permissions.keys())
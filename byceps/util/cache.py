@@ -0,0 +1,197 @@
+"""
+byceps.util.cache
+~~~~~~~~~~~~~~~~~
+
+Process-local caches that are invalidated across processes through
+a version counter in Redis_.
+
+Each cache remembers the version of the shared counter its entries
+were loaded at. Once another process (e.g. the admin application)
+increments that counter, the entries are discarded and loaded again
+on next access.
+
+To avoid a Redis round trip on every lookup, the shared version is
+only checked again after the configured interval has passed. Local
+invalidations take effect immediately.
+
+.. _Redis: https://redis.io/
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from threading import Lock
+import time
+from typing import Generic, TypeVar
+
+from flask import current_app
+
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+DEFAULT_VERSION_CHECK_INTERVAL = 1.0  # seconds
+
+
+class VersionedCache(Generic[K, V]):
+    """A process-local key/value cache invalidated by a shared version
+    counter.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_size: int | None = None,
+        version_check_interval: float = DEFAULT_VERSION_CHECK_INTERVAL,
+    ) -> None:
+        self.name = name
+        self.max_size = max_size
+        self.version_check_interval = version_check_interval
+
+        self._version_key = f'byceps:cache:{name}:version'
+        self._version: int | None = None
+        self._version_checked_at: float | None = None
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: K, load: Callable[[K], V]) -> V:
+        """Return the cached value for the key.
+
+        Call `load` to obtain the value if it is not cached (anymore).
+        Exceptions raised by `load` are propagated; nothing is cached
+        in that case.
+        """
+        value, _ = self.get_with_version(key, load)
+        return value
+
+    def get_with_version(self, key: K, load: Callable[[K], V]) -> tuple[V, int]:
+        """Return the cached value for the key, and the version of the
+        shared counter it is valid for.
+
+        The version can lag behind the shared one for as long as the
+        version check interval.
+        """
+        version = self._get_version()
+
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            elif key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key], version
+
+        value = load(key)
+
+        with self._lock:
+            # Do not keep a value loaded for a version that has been
+            # superseded in the meantime.
+            if version == self._version:
+                self._entries[key] = value
+                self._evict_excess_entries()
+
+        return value, version
+
+    def get_many(
+        self, keys: Iterable[K], load_many: Callable[[set[K]], Mapping[K, V]]
+    ) -> dict[K, V]:
+        """Return the cached values for the keys.
+
+        Call `load_many` once with all keys that are not cached (anymore)
+        to obtain their values. Keys it does not return a value for are
+        omitted from the result (and not cached).
+        """
+        version = self._get_version()
+
+        values = {}
+        missing_keys = set()
+
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+
+            for key in keys:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    values[key] = self._entries[key]
+                else:
+                    missing_keys.add(key)
+
+        if not missing_keys:
+            return values
+
+        loaded_values = load_many(missing_keys)
+
+        with self._lock:
+            for key in missing_keys:
+                if key not in loaded_values:
+                    continue
+
+                value = loaded_values[key]
+                values[key] = value
+
+                # Do not keep a value loaded for a version that has
+                # been superseded in the meantime.
+                if version == self._version:
+                    self._entries[key] = value
+
+            self._evict_excess_entries()
+
+        return values
+
+    def invalidate(self) -> None:
+        """Discard all entries, in this and all other processes.
+
+        Call *after* the underlying data has been committed.
+        """
+        _get_redis_client().incr(self._version_key)
+
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+            self._version_checked_at = None
+
+    def get_shared_version(self) -> int:
+        """Return the current version of the shared counter, bypassing
+        the version check interval.
+        """
+        value = _get_redis_client().get(self._version_key)
+        return int(value) if value is not None else 0
+
+    def _get_version(self) -> int:
+        now = time.monotonic()
+
+        with self._lock:
+            checked_at = self._version_checked_at
+            if (
+                (checked_at is not None)
+                and (self._version is not None)
+                and (now - checked_at < self.version_check_interval)
+            ):
+                return self._version
+
+        version = self.get_shared_version()
+
+        with self._lock:
+            self._version_checked_at = now
+
+        return version
+
+    def _evict_excess_entries(self) -> None:
+        if self.max_size is None:
+            return
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _get_redis_client():
+    return current_app.redis_client
@@ -11,12 +11,16 @@ from uuid import UUID
 from babel import parse_locale
 from flask import session
 
-from byceps.services.authn.session import authn_session_service
+from byceps.services.authn.session import (
+    authn_session_service,
+    current_user_cache,
+)
 from byceps.services.authn.session.models import CurrentUser
+from byceps.services.authz import authz_service
 from byceps.services.user import user_service
 from byceps.services.user.models.user import User, UserID
 
-from .authz import get_permissions_for_user
+from .authz import get_permissions_for_user_with_index_version
 
 
 KEY_LOCALE = 'locale'
@@ -37,6 +41,10 @@ def start(user_id: UserID, auth_token: str, *, permanent: bool = False) -> None:
 
 def end() -> None:
     """End the user's session by deleting the session cookie."""
+    user_id = _get_session_user_id()
+    if user_id is not None:
+        current_user_cache.invalidate_user(user_id)
+
     session.pop(KEY_USER_ID, None)
     session.pop(KEY_USER_AUTH_TOKEN, None)
     session.permanent = False
@@ -45,11 +53,11 @@ def end() -> None:
 def get_current_user(required_permissions: set[str]) -> CurrentUser:
     session_locale = _get_session_locale()
 
-    user = _find_user()
-    if user is None:
+    user_and_permissions = _find_user_with_permissions()
+    if user_and_permissions is None:
         return authn_session_service.get_anonymous_current_user(session_locale)
 
-    permissions = get_permissions_for_user(user.id)
+    user, permissions = user_and_permissions
     if not required_permissions.issubset(permissions):
         return authn_session_service.get_anonymous_current_user(session_locale)
 
@@ -60,40 +68,78 @@ def get_current_user(required_permissions: set[str]) -> CurrentUser:
     )
 
 
-def _find_user() -> User | None:
-    """Return the current user if authenticated, `None` if not.
+def _find_user_with_permissions() -> tuple[User, frozenset[str]] | None:
+    """Return the current user and their permissions if authenticated,
+    `None` if not.
 
-    Return `None` if:
-    - the ID is unknown.
-    - the account is not enabled.
-    - the auth token is invalid.
+    Recently identified users are looked up in the cache first.
     """
-    user_id_str = session.get(KEY_USER_ID)
+    user_id = _get_session_user_id()
     auth_token = session.get(KEY_USER_AUTH_TOKEN)
 
-    if user_id_str is None:
+    if (user_id is None) or (auth_token is None):
         return None
 
-    try:
-        user_id = UserID(UUID(user_id_str))
-    except ValueError:
+    current_index_version = authz_service.get_current_index_version()
+
+    cached = current_user_cache.find_user_with_permissions(
+        user_id, auth_token, current_index_version
+    )
+    if cached is not None:
+        return cached
+
+    user = _find_user(user_id, auth_token)
+    if user is None:
         return None
 
+    permissions, index_version = get_permissions_for_user_with_index_version(
+        user.id
+    )
+
+    # Do not cache permissions taken from an index this process has not
+    # yet reloaded after a change, as they might include revoked ones.
+    if index_version == current_index_version:
+        current_user_cache.store_user_with_permissions(
+            user, auth_token, permissions, index_version
+        )
+
+    return user, permissions
+
+
+def _find_user(user_id: UserID, auth_token: str) -> User | None:
+    """Return the current user if authenticated, `None` if not.
+
+    Return `None` if:
+    - the ID is unknown.
+    - the account is not enabled.
+    - the auth token is invalid.
+    """
     user = user_service.find_active_user(user_id, include_avatar=True)
 
     if user is None:
         return None
 
     # Validate auth token.
-    if (auth_token is None) or not authn_session_service.is_session_valid(
-        user.id, auth_token
-    ):
+    if not authn_session_service.is_session_valid(user.id, auth_token):
         # Bad auth token, not logging in.
         return None
 
     return user
 
 
+def _get_session_user_id() -> UserID | None:
+    """Return the user ID stored in the session, if any (and valid)."""
+    user_id_str = session.get(KEY_USER_ID)
+
+    if user_id_str is None:
+        return None
+
+    try:
+        return UserID(UUID(user_id_str))
+    except ValueError:
+        return None
+
+
 def _get_session_locale() -> str | None:
     """Return the locale set in the session, if any."""
     return session.get(KEY_LOCALE)
@@ -0,0 +1,266 @@
+"""
+tests.helpers.redis
+~~~~~~~~~~~~~~~~~~~
+
+An in-memory stand-in for the parts of the Redis client API used by
+BYCEPS, to exercise Redis-backed code in unit tests.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Callable
+from copy import deepcopy
+from fnmatch import fnmatchcase
+from functools import partial
+from typing import Any, Self
+
+from redis.exceptions import WatchError
+
+
+class InMemoryRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, Any] = {}
+
+    # keys
+
+    def delete(self, *keys: str) -> int:
+        num_deleted = 0
+        for key in keys:
+            if self.values.pop(key, None) is not None:
+                num_deleted += 1
+        return num_deleted
+
+    def expire(self, key: str, seconds: int) -> bool:
+        return key in self.values
+
+    def scan_iter(self, match: str = '*', count: int | None = None):
+        return [key for key in list(self.values) if fnmatchcase(key, match)]
+
+    # strings
+
+    def get(self, key: str) -> bytes | None:
+        value = self.values.get(key)
+        return _encode(value) if value is not None else None
+
+    def set(
+        self, key: str, value: Any, ex: int | None = None, nx: bool = False
+    ) -> bool | None:
+        if nx and (key in self.values):
+            return None
+        self.values[key] = value
+        return True
+
+    def incr(self, key: str, amount: int = 1) -> int:
+        self.values[key] = int(self.values.get(key, 0)) + amount
+        return self.values[key]
+
+    # hashes
+
+    def hget(self, key: str, field: str) -> bytes | None:
+        value = self.values.get(key, {}).get(field)
+        return _encode(value) if value is not None else None
+
+    def hset(
+        self,
+        key: str,
+        field: str | None = None,
+        value: Any = None,
+        mapping: dict[str, Any] | None = None,
+    ) -> int:
+        items = dict(mapping or {})
+        if field is not None:
+            items[field] = value
+        fields = self.values.setdefault(key, {})
+        num_added = len(items.keys() - fields.keys())
+        fields.update(items)
+        return num_added
+
+    def hsetnx(self, key: str, field: str, value: Any) -> bool:
+        fields = self.values.setdefault(key, {})
+        if field in fields:
+            return False
+        fields[field] = value
+        return True
+
+    def hincrby(self, key: str, field: str, amount: int = 1) -> int:
+        fields = self.values.setdefault(key, {})
+        fields[field] = int(fields.get(field, 0)) + amount
+        return fields[field]
+
+    def hgetall(self, key: str) -> dict[bytes, bytes]:
+        return {
+            _encode(field): _encode(value)
+            for field, value in self.values.get(key, {}).items()
+        }
+
+    # lists
+
+    def rpush(self, key: str, *values: Any) -> int:
+        items = self.values.setdefault(key, [])
+        items.extend(_encode(value) for value in values)
+        return len(items)
+
+    def lpush(self, key: str, *values: Any) -> int:
+        items = self.values.setdefault(key, [])
+        for value in values:
+            items.insert(0, _encode(value))
+        return len(items)
+
+    def lrange(self, key: str, start: int, end: int) -> list[bytes]:
+        items = self.values.get(key, [])
+        return items[start:] if end == -1 else items[start : end + 1]
+
+    def llen(self, key: str) -> int:
+        return len(self.values.get(key, []))
+
+    def lmove(
+        self, source: str, destination: str, src: str, dest: str
+    ) -> bytes | None:
+        items = self.values.get(source, [])
+        if not items:
+            return None
+        value = items.pop(0 if src == 'LEFT' else -1)
+        if not items:
+            self.values.pop(source)
+        target = self.values.setdefault(destination, [])
+        if dest == 'LEFT':
+            target.insert(0, value)
+        else:
+            target.append(value)
+        return value
+
+    def ltrim(self, key: str, start: int, end: int) -> bool:
+        items = self.values.get(key, [])
+        items[:] = items[start:] if end == -1 else items[start : end + 1]
+        if not items:
+            self.values.pop(key, None)
+        return True
+
+    # sets
+
+    def sadd(self, key: str, *values: Any) -> int:
+        members = self.values.setdefault(key, set())
+        new_values = {_encode(value) for value in values} - members
+        members.update(new_values)
+        return len(new_values)
+
+    def spop(self, key: str, count: int | None = None):
+        members = self.values.get(key, set())
+        popped = [members.pop() for _ in range(min(count or 1, len(members)))]
+        if not members:
+            self.values.pop(key, None)
+        if count is None:
+            return popped[0] if popped else None
+        return popped
+
+    # sorted sets
+
+    def zadd(
+        self, key: str, mapping: dict[str, float], gt: bool = False
+    ) -> int:
+        scores = self.values.setdefault(key, {})
+        num_added = 0
+        for member, score in mapping.items():
+            encoded_member = _encode(member)
+            current = scores.get(encoded_member)
+            if current is None:
+                num_added += 1
+            elif gt and (score <= current):
+                continue
+            scores[encoded_member] = float(score)
+        return num_added
+
+    def zmscore(self, key: str, members: list[str]) -> list[float | None]:
+        scores = self.values.get(key, {})
+        return [scores.get(_encode(member)) for member in members]
+
+    def zrange(
+        self, key: str, start: int, end: int, withscores: bool = False
+    ) -> list:
+        items = sorted(
+            self.values.get(key, {}).items(), key=lambda item: item[1]
+        )
+        items = items[start:] if end == -1 else items[start : end + 1]
+        if withscores:
+            return items
+        return [member for member, _ in items]
+
+    # pipelines
+
+    def pipeline(self, transaction: bool = True) -> 'InMemoryPipeline':
+        return InMemoryPipeline(self)
+
+
+class InMemoryPipeline:
+    """Execute queued commands right away, return their results on
+    `execute`.
+
+    After `watch`, commands return their results right away. After
+    `multi`, they are held back until `execute`, which fails if a
+    watched key has been changed in the meantime.
+    """
+
+    def __init__(self, redis: InMemoryRedis) -> None:
+        self._redis = redis
+        self._results: list[Any] = []
+        self._watched_values: dict[str, Any] | None = None
+        self._queued_commands: list[Callable[[], Any]] | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.reset()
+
+    def watch(self, *keys: str) -> None:
+        self._watched_values = {
+            key: deepcopy(self._redis.values.get(key)) for key in keys
+        }
+
+    def multi(self) -> None:
+        self._queued_commands = []
+
+    def reset(self) -> None:
+        self._results = []
+        self._watched_values = None
+        self._queued_commands = None
+
+    def __getattr__(self, name: str):
+        command = getattr(self._redis, name)
+
+        def queue(*args, **kwargs):
+            if self._queued_commands is not None:
+                self._queued_commands.append(partial(command, *args, **kwargs))
+                return self
+
+            result = command(*args, **kwargs)
+            if self._watched_values is not None:
+                return result
+
+            self._results.append(result)
+            return self
+
+        return queue
+
+    def execute(self) -> list[Any]:
+        if self._queued_commands is not None:
+            queued_commands = self._queued_commands
+            watched_values = self._watched_values or {}
+            self.reset()
+
+            for key, value in watched_values.items():
+                if self._redis.values.get(key) != value:
+                    raise WatchError(f'Watched key "{key}" has changed.')
+
+            return [command() for command in queued_commands]
+
+        results = self._results
+        self._results = []
+        return results
+
+
+def _encode(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode()
@@ -0,0 +1,118 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.database import db
+from byceps.services.ticketing import (
+    ticket_creation_service,
+    ticket_service,
+    ticket_user_checkin_service,
+)
+from byceps.util.uuid import generate_uuid7
+
+
+def test_check_in_users_in_bulk(
+    party,
+    make_ticket,
+    admin_user,
+    api_client,
+    api_client_authz_header,
+):
+    ticket1 = make_ticket()
+    ticket2 = make_ticket()
+    ticket_without_user = make_ticket(with_user=False)
+
+    url = f'http://api.acmecon.test/v1/ticketing/checkins/{party.id}'
+    headers = [api_client_authz_header]
+    json_data = {
+        'initiator_id': str(admin_user.id),
+        'check_ins': [
+            _build_item('key-1', ticket1.id),
+            _build_item('key-2', ticket2.id),
+            # Checked in at another desk, too.
+            _build_item('key-3', ticket1.id),
+            _build_item('key-4', ticket_without_user.id),
+            _build_item('key-5', generate_uuid7()),
+        ],
+    }
+
+    response = api_client.post(url, headers=headers, json=json_data)
+
+    assert response.status_code == 200
+    assert [
+        (result['idempotency_key'], result['status'])
+        for result in response.get_json()['results']
+    ] == [
+        ('key-1', 'checked_in'),
+        ('key-2', 'checked_in'),
+        ('key-3', 'conflict'),
+        ('key-4', 'rejected'),
+        ('key-5', 'rejected'),
+    ]
+
+    for ticket in ticket1, ticket2:
+        assert ticket_service.get_ticket(ticket.id).user_checked_in
+
+    check_in = ticket_user_checkin_service.find_check_in_for_ticket(ticket1.id)
+    assert check_in.occurred_at.isoformat() == '2024-03-08T17:42:00'
+
+    # Repeating the synchronization does not apply check-ins again.
+    response = api_client.post(url, headers=headers, json=json_data)
+
+    assert response.status_code == 200
+    assert [result['status'] for result in response.get_json()['results']] == [
+        'already_applied',
+        'already_applied',
+        'conflict',
+        'rejected',
+        'rejected',
+    ]
+
+
+def test_check_in_users_in_bulk_with_invalid_request(
+    party, api_client, api_client_authz_header
+):
+    url = f'http://api.acmecon.test/v1/ticketing/checkins/{party.id}'
+    headers = [api_client_authz_header]
+    json_data = {'check_ins': [{'idempotency_key': 'key-1'}]}
+
+    response = api_client.post(url, headers=headers, json=json_data)
+
+    assert response.status_code == 400
+
+
+def _build_item(idempotency_key, ticket_id):
+    return {
+        'idempotency_key': idempotency_key,
+        'ticket_id': str(ticket_id),
+        'occurred_at': '2024-03-08T18:42:00+01:00',
+    }
+
+
+@pytest.fixture(scope='module')
+def party(brand, make_party):
+    return make_party(brand.id, 'checkin-bulk')
+
+
+@pytest.fixture(scope='module')
+def category(make_ticket_category, party):
+    return make_ticket_category(party.id, 'Standard')
+
+
+@pytest.fixture()
+def make_ticket(category, user, make_user):
+    def _wrapper(*, with_user: bool = True):
+        ticket = ticket_creation_service.create_ticket(
+            category.party_id, category.id, user
+        )
+
+        if with_user:
+            ticket.used_by_id = make_user().id
+            db.session.commit()
+
+        return ticket
+
+    return _wrapper
@@ -0,0 +1,94 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.database import db
+from byceps.services.ticketing import ticket_creation_service
+
+
+def test_get_checkin_snapshot(
+    party, category, ticket, ticket_user, api_client, api_client_authz_header
+):
+    url = f'http://api.acmecon.test/v1/ticketing/checkin_snapshot/{party.id}'
+    headers = [api_client_authz_header]
+
+    response = api_client.get(url, headers=headers)
+
+    assert response.status_code == 200
+    assert response.content_type == 'application/json'
+
+    data = response.get_json()
+    assert data['party_id'] == party.id
+    assert data['version'] == response.get_etag()[0]
+    assert data['categories'] == {str(category.id): 'Standard'}
+    assert data['tickets'] == [
+        {
+            'id': str(ticket.id),
+            'code': ticket.code,
+            'category_id': str(category.id),
+            'revoked': False,
+            'user_checked_in': False,
+            'user': {
+                'id': str(ticket_user.id),
+                'screen_name': ticket_user.screen_name,
+                'first_name': 'John Joseph',
+                'last_name': 'Doe',
+                'suspended': False,
+                'deleted': False,
+            },
+            'seat': None,
+        }
+    ]
+
+
+def test_get_checkin_snapshot_conditionally(
+    party, ticket, api_client, api_client_authz_header
+):
+    url = f'http://api.acmecon.test/v1/ticketing/checkin_snapshot/{party.id}'
+    headers = [api_client_authz_header]
+
+    version = api_client.get(url, headers=headers).get_json()['version']
+
+    response = api_client.get(
+        url, headers=[*headers, ('If-None-Match', f'"{version}"')]
+    )
+    assert response.status_code == 304
+
+    ticket.revoked = True
+    db.session.commit()
+
+    response = api_client.get(
+        url, headers=[*headers, ('If-None-Match', f'"{version}"')]
+    )
+    assert response.status_code == 200
+    assert response.get_json()['version'] != version
+
+
+@pytest.fixture(scope='module')
+def party(brand, make_party):
+    return make_party(brand.id, 'checkin-snapshot')
+
+
+@pytest.fixture(scope='module')
+def category(make_ticket_category, party):
+    return make_ticket_category(party.id, 'Standard')
+
+
+@pytest.fixture(scope='module')
+def ticket_user(make_user):
+    return make_user()
+
+
+@pytest.fixture(scope='module')
+def ticket(category, user, ticket_user):
+    ticket = ticket_creation_service.create_ticket(
+        category.party_id, category.id, user
+    )
+
+    ticket.used_by_id = ticket_user.id
+    db.session.commit()
+
+    return ticket
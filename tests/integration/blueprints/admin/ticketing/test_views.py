@@ -12,6 +12,22 @@ def test_ticket_index(party, ticketing_admin_client, ticket):
     assert response.status_code == 200
 
 
+def test_ticket_printable_html_for_party(party, ticketing_admin_client, ticket):
+    url = f'{BASE_URL}/ticketing/tickets/for_party/{party.id}/printable.html'
+    response = ticketing_admin_client.get(url)
+    assert response.status_code == 200
+    assert ticket.code in response.get_data(as_text=True)
+
+
+def test_ticket_printable_html_for_order(party, ticketing_admin_client, ticket):
+    url = f'{BASE_URL}/ticketing/tickets/for_party/{party.id}/printable.html'
+    response = ticketing_admin_client.get(
+        url, query_string={'order_number': 'ORDER-UNKNOWN'}
+    )
+    assert response.status_code == 200
+    assert ticket.code not in response.get_data(as_text=True)
+
+
 def test_ticket_view(ticketing_admin_client, ticket):
     url = f'{BASE_URL}/ticketing/tickets/{ticket.id}'
     response = ticketing_admin_client.get(url)
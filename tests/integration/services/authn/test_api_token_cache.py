@@ -0,0 +1,63 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.services.authn.api import authn_api_service
+from byceps.services.authz.models import PermissionID
+
+
+PERMISSIONS = {PermissionID('example.do_this')}
+
+
+@pytest.fixture()
+def api_token(admin_app, admin_user):
+    api_token = authn_api_service.create_api_token(admin_user.id, PERMISSIONS)
+    yield api_token
+    if authn_api_service.find_api_token_by_token(api_token.token):
+        authn_api_service.delete_api_token(api_token.id)
+
+
+def test_find_created_api_token(api_token):
+    actual = authn_api_service.find_api_token_by_token_cached(api_token.token)
+
+    assert actual == api_token
+
+
+def test_unknown_token_is_not_cached(admin_app):
+    cache = authn_api_service._api_token_cache
+    size_before = len(cache)
+
+    actual = authn_api_service.find_api_token_by_token_cached('unknown')
+
+    assert actual is None
+    assert len(cache) == size_before
+
+
+def test_suspend_and_unsuspend_invalidate(api_token):
+    # Have the token cached.
+    authn_api_service.find_api_token_by_token_cached(api_token.token)
+
+    authn_api_service.suspend_api_token(api_token.id)
+
+    actual = authn_api_service.find_api_token_by_token_cached(api_token.token)
+    assert actual is not None
+    assert actual.suspended
+
+    authn_api_service.unsuspend_api_token(api_token.id)
+
+    actual = authn_api_service.find_api_token_by_token_cached(api_token.token)
+    assert actual is not None
+    assert not actual.suspended
+
+
+def test_delete_invalidates(api_token):
+    # Have the token cached.
+    authn_api_service.find_api_token_by_token_cached(api_token.token)
+
+    authn_api_service.delete_api_token(api_token.id)
+
+    actual = authn_api_service.find_api_token_by_token_cached(api_token.token)
+    assert actual is None
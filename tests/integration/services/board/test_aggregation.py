@@ -0,0 +1,130 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.database import db
+from byceps.services.board import (
+    board_aggregation_service,
+    board_category_command_service,
+    board_posting_command_service,
+    board_topic_command_service,
+)
+from byceps.services.board.dbmodels.category import DbBoardCategory
+from byceps.services.board.dbmodels.topic import DbTopic
+
+from tests.helpers import generate_token
+
+
+def test_incremental_aggregates_match_full_recount(admin_app, board, make_user):
+    creator = make_user()
+    replier = make_user()
+    moderator = make_user()
+
+    category1 = _create_category(board.id)
+    category2 = _create_category(board.id)
+
+    topic1, _ = board_topic_command_service.create_topic(
+        category1.id, creator, 'First', 'Body'
+    )
+    topic2, _ = board_topic_command_service.create_topic(
+        category1.id, creator, 'Second', 'Body'
+    )
+    assert _get_category_state(category1.id) == (2, 2, creator.id)
+
+    board_posting_command_service.create_posting(topic1.id, replier, 'Reply 1')
+    db_reply2, _ = board_posting_command_service.create_posting(
+        topic1.id, replier, 'Reply 2'
+    )
+    assert _get_topic_state(topic1.id) == (3, replier.id)
+    assert _get_category_state(category1.id) == (2, 4, replier.id)
+
+    # Hiding the latest posting falls back to the one before.
+    board_posting_command_service.hide_posting(db_reply2.id, moderator)
+    assert _get_topic_state(topic1.id) == (2, replier.id)
+    assert _get_category_state(category1.id) == (2, 3, replier.id)
+
+    # Hiding again must not decrement twice.
+    board_posting_command_service.hide_posting(db_reply2.id, moderator)
+    assert _get_topic_state(topic1.id) == (2, replier.id)
+
+    board_posting_command_service.unhide_posting(db_reply2.id, moderator)
+    assert _get_topic_state(topic1.id) == (3, replier.id)
+    assert _get_category_state(category1.id) == (2, 4, replier.id)
+
+    board_topic_command_service.hide_topic(topic1.id, moderator)
+    assert _get_category_state(category1.id) == (1, 1, creator.id)
+
+    board_topic_command_service.unhide_topic(topic1.id, moderator)
+    assert _get_category_state(category1.id) == (2, 4, replier.id)
+
+    board_topic_command_service.move_topic(topic1.id, category2.id, moderator)
+    assert _get_category_state(category1.id) == (1, 1, creator.id)
+    assert _get_category_state(category2.id) == (1, 3, replier.id)
+
+    incremental_states = _get_states(
+        [topic1.id, topic2.id], [category1.id, category2.id]
+    )
+
+    board_aggregation_service.aggregate_board(board.id)
+
+    recounted_states = _get_states(
+        [topic1.id, topic2.id], [category1.id, category2.id]
+    )
+
+    assert incremental_states == recounted_states
+
+
+# helpers
+
+
+def _create_category(board_id):
+    return board_category_command_service.create_category(
+        board_id, generate_token(), generate_token(), 'Stuff'
+    )
+
+
+def _get_topic_state(topic_id):
+    db.session.expire_all()
+    db_topic = db.session.get(DbTopic, topic_id)
+    return db_topic.posting_count, db_topic.last_updated_by_id
+
+
+def _get_category_state(category_id):
+    db.session.expire_all()
+    db_category = db.session.get(DbBoardCategory, category_id)
+    return (
+        db_category.topic_count,
+        db_category.posting_count,
+        db_category.last_posting_updated_by_id,
+    )
+
+
+def _get_states(topic_ids, category_ids):
+    db.session.expire_all()
+
+    topic_states = [
+        (
+            db_topic.posting_count,
+            db_topic.last_updated_at,
+            db_topic.last_updated_by_id,
+        )
+        for db_topic in [
+            db.session.get(DbTopic, topic_id) for topic_id in topic_ids
+        ]
+    ]
+
+    category_states = [
+        (
+            db_category.topic_count,
+            db_category.posting_count,
+            db_category.last_posting_updated_at,
+            db_category.last_posting_updated_by_id,
+        )
+        for db_category in [
+            db.session.get(DbBoardCategory, category_id)
+            for category_id in category_ids
+        ]
+    ]
+
+    return topic_states, category_states
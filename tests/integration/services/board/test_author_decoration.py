@@ -0,0 +1,30 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.board import board_author_decoration_service
+from byceps.services.orga_team import orga_team_service
+
+
+def test_orga_ids_follow_membership_changes(admin_app, party, make_user):
+    orga = make_user()
+    team = orga_team_service.create_team(party.id, 'Support')
+
+    assert orga.id not in board_author_decoration_service.get_orga_ids(party.id)
+
+    membership = orga_team_service.create_membership(team.id, orga.id, None)
+
+    assert orga.id in board_author_decoration_service.get_orga_ids(party.id)
+
+    orga_team_service.delete_membership(membership.id)
+
+    assert orga.id not in board_author_decoration_service.get_orga_ids(party.id)
+
+
+def test_users_without_badges_are_included(admin_app, make_user):
+    user = make_user()
+
+    assert board_author_decoration_service.get_featured_badges([user.id]) == {
+        user.id: frozenset()
+    }
@@ -0,0 +1,125 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.database import db
+from byceps.services.board import (
+    board_category_command_service,
+    board_posting_command_service,
+    board_posting_query_service,
+    board_topic_command_service,
+    board_topic_query_service,
+)
+
+from byceps.services.board.dbmodels.topic import DbTopic
+
+from tests.helpers import generate_token
+
+
+def test_paginate_topics_of_category(admin_app, board, make_user):
+    creator = make_user()
+    moderator = make_user()
+
+    category = board_category_command_service.create_category(
+        board.id, generate_token(), generate_token(), 'Stuff'
+    )
+    for i in range(5):
+        board_topic_command_service.create_topic(
+            category.id, creator, f'Topic {i}', 'Body'
+        )
+
+    page1 = board_topic_query_service.paginate_topics_of_category(
+        category.id, 1, 2
+    )
+    assert page1.total == 5
+    assert page1.pages == 3
+
+    page2_by_offset = board_topic_query_service.paginate_topics_of_category(
+        category.id, 2, 2
+    )
+    page2_by_keyset = board_topic_query_service.paginate_topics_of_category(
+        category.id, 2, 2, after=page1.items[-1].id
+    )
+    assert _get_ids(page2_by_keyset) == _get_ids(page2_by_offset)
+    assert not (set(_get_ids(page1)) & set(_get_ids(page2_by_keyset)))
+
+    # Hidden topics are only included in the total if requested.
+    board_topic_command_service.hide_topic(page1.items[0].id, moderator)
+
+    assert (
+        board_topic_query_service.paginate_topics_of_category(
+            category.id, 1, 2
+        ).total
+        == 4
+    )
+    assert (
+        board_topic_query_service.paginate_topics_of_category(
+            category.id, 1, 2, include_hidden=True
+        ).total
+        == 5
+    )
+
+
+def test_paginate_topics_without_update_time(admin_app, board, make_user):
+    creator = make_user()
+
+    category = board_category_command_service.create_category(
+        board.id, generate_token(), generate_token(), 'Stuff'
+    )
+    topic_ids = []
+    for i in range(4):
+        topic, _ = board_topic_command_service.create_topic(
+            category.id, creator, f'Topic {i}', 'Body'
+        )
+        topic_ids.append(topic.id)
+
+    # A topic without visible postings has no update time.
+    db.session.get(DbTopic, topic_ids[1]).last_updated_at = None
+    db.session.commit()
+
+    page1 = board_topic_query_service.paginate_topics_of_category(
+        category.id, 1, 2
+    )
+    page2 = board_topic_query_service.paginate_topics_of_category(
+        category.id, 2, 2, after=page1.items[-1].id
+    )
+
+    # It is sorted as the oldest topic, and is not skipped.
+    assert _get_ids(page2)[-1] == topic_ids[1]
+    assert set(_get_ids(page1) + _get_ids(page2)) == set(topic_ids)
+
+
+def test_paginate_postings(admin_app, board, make_user):
+    creator = make_user()
+
+    category = board_category_command_service.create_category(
+        board.id, generate_token(), generate_token(), 'Stuff'
+    )
+    topic, _ = board_topic_command_service.create_topic(
+        category.id, creator, 'Title', 'Body'
+    )
+    for i in range(4):
+        board_posting_command_service.create_posting(
+            topic.id, creator, f'Reply {i}'
+        )
+
+    page1 = board_posting_query_service.paginate_postings(topic.id, False, 1, 2)
+    assert page1.total == 5
+    assert page1.pages == 3
+
+    page3_by_offset = board_posting_query_service.paginate_postings(
+        topic.id, False, 3, 2
+    )
+    page2 = board_posting_query_service.paginate_postings(
+        topic.id, False, 2, 2, after=page1.items[-1].id
+    )
+    page3_by_keyset = board_posting_query_service.paginate_postings(
+        topic.id, False, 3, 2, after=page2.items[-1].id
+    )
+    assert _get_ids(page3_by_keyset) == _get_ids(page3_by_offset)
+    assert not page3_by_keyset.has_next
+
+
+def _get_ids(pagination):
+    return [item.id for item in pagination.items]
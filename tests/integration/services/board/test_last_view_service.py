@@ -0,0 +1,88 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+
+from byceps.services.board import (
+    board_category_command_service,
+    board_last_view_buffer,
+    board_last_view_service,
+    board_topic_command_service,
+    board_topic_query_service,
+)
+
+from tests.helpers import generate_token
+
+
+def test_select_topics_with_unseen_postings(admin_app, board, make_user):
+    creator = make_user()
+    reader = make_user()
+
+    category = board_category_command_service.create_category(
+        board.id, generate_token(), generate_token(), 'Stuff'
+    )
+    topic1 = create_topic(category.id, creator)
+    topic2 = create_topic(category.id, creator)
+
+    board_last_view_service.mark_topic_as_just_viewed(topic1.id, reader.id)
+
+    db_topics = [
+        board_topic_query_service.get_db_topic(topic.id)
+        for topic in [topic1, topic2]
+    ]
+
+    assert board_last_view_service.select_topics_with_unseen_postings(
+        db_topics, reader.id
+    ) == {topic2.id}
+    assert (
+        board_last_view_service.select_topics_with_unseen_postings(
+            [], reader.id
+        )
+        == set()
+    )
+
+
+def test_flush_buffered_views(admin_app, board, make_user):
+    creator = make_user()
+    reader = make_user()
+
+    category = board_category_command_service.create_category(
+        board.id, generate_token(), generate_token(), 'Stuff'
+    )
+    topic = create_topic(category.id, creator)
+
+    earlier = datetime(2024, 3, 8, 14, 21, 3)
+    later = datetime(2024, 3, 8, 14, 25, 41)
+
+    board_last_view_service.mark_topic_as_just_viewed(topic.id, reader.id)
+    stored_viewed_at = board_last_view_service.find_topic_last_viewed_at(
+        topic.id, reader.id
+    )
+
+    board_last_view_buffer.record_topic_view(reader.id, topic.id, earlier)
+    board_last_view_buffer.record_category_view(reader.id, category.id, later)
+
+    board_last_view_service.flush_buffered_views()
+
+    # An earlier buffered view does not overwrite a later stored one.
+    assert (
+        board_last_view_service.find_topic_last_viewed_at(topic.id, reader.id)
+        == stored_viewed_at
+    )
+    assert board_last_view_service.get_category_last_viewed_ats(
+        {category.id}, reader.id
+    ) == {category.id: later}
+
+    assert board_last_view_buffer.pop_user_ids(10) == []
+
+
+# helpers
+
+
+def create_topic(category_id, creator):
+    topic, _ = board_topic_command_service.create_topic(
+        category_id, creator, 'Title', 'Body'
+    )
+    return topic
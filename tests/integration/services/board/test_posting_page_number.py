@@ -0,0 +1,92 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+
+from sqlalchemy import update
+
+from byceps.database import db
+from byceps.services.board import (
+    board_category_command_service,
+    board_posting_command_service,
+    board_posting_query_service,
+    board_topic_command_service,
+)
+from byceps.services.board.dbmodels.posting import DbPosting
+
+from tests.helpers import generate_token
+
+
+def test_calculate_posting_page_number(admin_app, board, make_user):
+    creator = make_user()
+    moderator = make_user()
+
+    category = board_category_command_service.create_category(
+        board.id, generate_token(), generate_token(), 'Stuff'
+    )
+    topic, _ = board_topic_command_service.create_topic(
+        category.id, creator, 'Title', 'Body'
+    )
+
+    # The initial topic posting comes first.
+    db_postings = [
+        board_posting_command_service.create_posting(
+            topic.id, creator, f'Reply {number}'
+        )[0]
+        for number in range(1, 6)
+    ]
+
+    board_posting_command_service.hide_posting(db_postings[0].id, moderator)
+
+    last_posting = db_postings[-1]
+
+    def calculate(include_hidden: bool, postings_per_page: int) -> int:
+        return board_posting_query_service.calculate_posting_page_number(
+            last_posting, include_hidden, postings_per_page
+        )
+
+    # Five postings precede the last one, four of them visible.
+    assert calculate(True, 5) == 2
+    assert calculate(False, 5) == 1
+    assert calculate(False, 2) == 3
+
+
+def test_calculate_posting_page_number_for_same_creation_time(
+    admin_app, board, make_user
+):
+    creator = make_user()
+
+    category = board_category_command_service.create_category(
+        board.id, generate_token(), generate_token(), 'Stuff'
+    )
+    topic, _ = board_topic_command_service.create_topic(
+        category.id, creator, 'Title', 'Body'
+    )
+    for number in range(1, 4):
+        board_posting_command_service.create_posting(
+            topic.id, creator, f'Reply {number}'
+        )
+
+    # Have all postings be created at the same time.
+    created_at = datetime.utcnow()
+    db.session.execute(
+        update(DbPosting)
+        .filter_by(topic_id=topic.id)
+        .values(created_at=created_at)
+    )
+    db.session.commit()
+
+    postings_per_page = 2
+    postings = board_posting_query_service.paginate_postings(
+        topic.id, False, 2, postings_per_page
+    )
+
+    for db_posting in postings.items:
+        assert (
+            board_posting_query_service.calculate_posting_page_number(
+                db_posting, False, postings_per_page
+            )
+            == 2
+        )
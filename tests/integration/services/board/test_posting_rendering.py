@@ -0,0 +1,81 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from sqlalchemy import select
+
+from byceps.database import db
+from byceps.services.board import (
+    board_category_command_service,
+    board_posting_command_service,
+    board_posting_rendering_service,
+    board_topic_command_service,
+)
+from byceps.services.board.dbmodels.posting_rendering import (
+    DbPostingRendering,
+)
+
+from tests.helpers import generate_token
+
+
+def test_renderings_are_stored_and_used(admin_app, board, make_user):
+    creator = make_user()
+
+    category = board_category_command_service.create_category(
+        board.id, generate_token(), generate_token(), 'Stuff'
+    )
+    topic, _ = board_topic_command_service.create_topic(
+        category.id, creator, 'Title', 'Body'
+    )
+
+    db_posting, _ = board_posting_command_service.create_posting(
+        topic.id, creator, '[b]bold[/b]'
+    )
+
+    db_renderings = _get_renderings(db_posting.id)
+    assert 'en' in {r.language_code for r in db_renderings}
+    assert all(r.html == '<strong>bold</strong>' for r in db_renderings)
+
+    board_posting_command_service.update_posting(
+        db_posting.id, creator, '[i]italic[/i]'
+    )
+
+    db_renderings = _get_renderings(db_posting.id)
+    assert all(r.html == '<em>italic</em>' for r in db_renderings)
+
+    # Stored renderings are preferred ...
+    _tamper_with_rendering(db_posting.id, 'en', '<em>stored</em>')
+    assert board_posting_rendering_service.get_html_by_posting_id(
+        [db_posting], 'en'
+    ) == {db_posting.id: '<em>stored</em>'}
+
+    # ... unless the body has changed since.
+    db_posting.body = '[u]underline[/u]'
+    db.session.commit()
+    assert board_posting_rendering_service.get_html_by_posting_id(
+        [db_posting], 'en'
+    ) == {db_posting.id: '<u>underline</u>'}
+
+    # Only postings without a current rendering need to be backfilled.
+    assert db_posting.id not in (
+        board_posting_rendering_service.get_ids_of_postings_to_render()
+    )
+
+    board_posting_command_service.delete_posting(db_posting.id)
+
+    assert _get_renderings(db_posting.id) == []
+
+
+def _get_renderings(posting_id):
+    return db.session.scalars(
+        select(DbPostingRendering).filter_by(posting_id=posting_id)
+    ).all()
+
+
+def _tamper_with_rendering(posting_id, language_code, html):
+    db_rendering = db.session.get(
+        DbPostingRendering, (posting_id, language_code)
+    )
+    db_rendering.html = html
+    db.session.commit()
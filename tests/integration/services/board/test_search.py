@@ -0,0 +1,88 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.board import (
+    board_category_command_service,
+    board_posting_command_service,
+    board_search_service,
+    board_topic_command_service,
+)
+
+from tests.helpers import generate_token
+
+
+def test_search_postings(admin_app, board, make_user):
+    creator = make_user()
+    moderator = make_user()
+
+    category = board_category_command_service.create_category(
+        board.id, generate_token(), generate_token(), 'Stuff'
+    )
+    topic, _ = board_topic_command_service.create_topic(
+        category.id, creator, 'Seating plan', 'Where do we sit?'
+    )
+
+    db_postings = [
+        board_posting_command_service.create_posting(
+            topic.id, creator, f'[b]Table[/b] number {number} & co'
+        )[0]
+        for number in range(1, 4)
+    ]
+    board_posting_command_service.create_posting(
+        topic.id, creator, 'Something else entirely'
+    )
+
+    board_posting_command_service.hide_posting(db_postings[0].id, moderator)
+
+    def search(search_term, **kwargs):
+        return board_search_service.search_postings(
+            board.id, search_term, **kwargs
+        )
+
+    # The topic title is searchable through the initial posting.
+    page = search('seating')
+    assert [r.posting_id for r in page.results] == [topic.initial_posting_id]
+    assert '<mark>' in page.results[0].topic_title_html
+
+    # Newest first, hidden postings excluded by default.
+    page = search('table')
+    assert [r.posting_id for r in page.results] == [
+        db_postings[2].id,
+        db_postings[1].id,
+    ]
+    assert page.next_after is None
+
+    excerpt = page.results[0].body_excerpt_html
+    assert '[b]' not in excerpt
+    assert '&amp;' in excerpt
+    assert '<mark>' in excerpt
+
+    # Keyset pagination, including hidden postings.
+    page1 = search('table', include_hidden=True, limit=2)
+    assert [r.posting_id for r in page1.results] == [
+        db_postings[2].id,
+        db_postings[1].id,
+    ]
+    assert page1.next_after == db_postings[1].id
+
+    page2 = search(
+        'table', include_hidden=True, limit=2, after=page1.next_after
+    )
+    assert [r.posting_id for r in page2.results] == [db_postings[0].id]
+    assert page2.results[0].hidden
+    assert page2.next_after is None
+
+    # Updated postings are reindexed.
+    board_posting_command_service.update_posting(
+        db_postings[2].id, creator, 'Chair'
+    )
+    assert [r.posting_id for r in search('chair').results] == [
+        db_postings[2].id
+    ]
+
+    # Hidden topics are excluded by default.
+    board_topic_command_service.hide_topic(topic.id, moderator)
+    assert search('chair').results == []
+    assert len(search('chair', include_hidden=True).results) == 1
@@ -0,0 +1,48 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.site_navigation import site_navigation_service
+from byceps.services.site_navigation.models import NavItemTargetType
+
+
+def test_index(site):
+    main_menu = site_navigation_service.create_menu(site.id, 'main', 'en')
+    hidden_menu = site_navigation_service.create_menu(
+        site.id, 'secret', 'en', hidden=True
+    )
+    submenu_b = site_navigation_service.create_menu(
+        site.id, 'sub-b', 'en', parent_menu_id=main_menu.id
+    )
+    submenu_a = site_navigation_service.create_menu(
+        site.id, 'sub-a', 'en', parent_menu_id=main_menu.id
+    )
+
+    item_news = create_item(main_menu.id, NavItemTargetType.view, 'news')
+    create_item(main_menu.id, NavItemTargetType.url, '/hidden', hidden=True)
+    create_item(hidden_menu.id, NavItemTargetType.url, '/secret')
+    create_item(submenu_b.id, NavItemTargetType.page, 'info')
+    create_item(submenu_a.id, NavItemTargetType.page, 'info')
+
+    index = site_navigation_service.get_index_for_site(site.id)
+
+    assert index.get_items_for_menu('main', 'en') == [item_news]
+    assert index.get_items_for_menu('main', 'de') == []
+    assert index.get_items_for_menu('secret', 'en') == []
+    assert index.find_submenu_id_for_page('en', 'info') == submenu_a.id
+    assert index.find_submenu_id_for_view('en', 'news') is None
+
+    # Changes are reflected.
+    create_item(submenu_b.id, NavItemTargetType.view, 'news')
+    index = site_navigation_service.get_index_for_site(site.id)
+    assert index.find_submenu_id_for_view('en', 'news') == submenu_b.id
+
+
+# helpers
+
+
+def create_item(menu_id, target_type, target, *, hidden=False):
+    return site_navigation_service.create_item(
+        menu_id, target_type, target, target, target, hidden=hidden
+    ).unwrap()
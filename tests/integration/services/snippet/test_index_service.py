@@ -0,0 +1,38 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.snippet import snippet_index_service, snippet_service
+from byceps.services.snippet.models import CurrentSnippetVersion, SnippetScope
+
+
+def test_find_current_version(admin_app, brand, make_user):
+    scope = SnippetScope.for_brand(brand.id)
+    creator = make_user()
+
+    version_en, _ = snippet_service.create_snippet(
+        scope, 'welcome', 'en', creator, 'Welcome!'
+    )
+    version_de, _ = snippet_service.create_snippet(
+        scope, 'welcome', 'de', creator, 'Willkommen!'
+    )
+
+    assert snippet_index_service.find_current_version(
+        scope, 'welcome', 'de'
+    ) == CurrentSnippetVersion(id=version_de.id, body='Willkommen!')
+    assert (
+        snippet_index_service.find_current_version(scope, 'welcome', 'fr')
+        is None
+    )
+
+    version_en_updated, _ = snippet_service.update_snippet(
+        version_en.snippet_id, creator, 'Welcome, again!'
+    )
+
+    assert snippet_index_service.find_current_version(
+        scope, 'welcome', 'en'
+    ) == CurrentSnippetVersion(id=version_en_updated.id, body='Welcome, again!')
+
+    for version in version_en, version_de:
+        snippet_service.delete_snippet(version.snippet_id)
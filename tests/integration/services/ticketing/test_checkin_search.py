@@ -0,0 +1,109 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.database import db
+from byceps.services.ticketing import (
+    ticket_checkin_search_service,
+    ticket_creation_service,
+)
+
+from tests.helpers import generate_token
+
+
+@pytest.fixture()
+def last_name():
+    return f'Keen{generate_token(6)}'
+
+
+@pytest.fixture()
+def ticket_user(make_user, last_name):
+    return make_user(
+        f'Checkin{generate_token(6)}',
+        first_name='Rosalind',
+        last_name=last_name,
+    )
+
+
+@pytest.fixture()
+def ticket(admin_app, category, ticket_owner, ticket_user):
+    ticket = ticket_creation_service.create_ticket(
+        category.party_id, category.id, ticket_owner
+    )
+
+    ticket.used_by_id = ticket_user.id
+    db.session.commit()
+
+    return ticket
+
+
+def test_search_by_code(party, ticket):
+    assert _search(party, ticket.code) == [ticket.id]
+
+
+def test_search_by_user_screen_name(party, ticket, ticket_user):
+    assert _search(party, ticket_user.screen_name.lower()) == [ticket.id]
+
+
+def test_search_by_user_full_name(party, ticket, last_name):
+    assert _search(party, f'rosalind {last_name.lower()}') == [ticket.id]
+
+
+def test_search_by_owner(party, ticket, ticket_owner):
+    assert ticket.id in _search(party, ticket_owner.screen_name)
+
+
+def test_all_terms_have_to_match(party, ticket):
+    assert _search(party, 'Rosalind Unknown') == []
+
+
+def test_exact_code_match_ranks_first(party, category, ticket, ticket_owner):
+    other_ticket = ticket_creation_service.create_ticket(
+        category.party_id, category.id, ticket_owner
+    )
+
+    result = _search(party, other_ticket.code)
+
+    assert result[0] == other_ticket.id
+
+
+def test_user_and_seat_are_loaded(party, ticket, ticket_user, last_name):
+    db.session.expunge_all()
+
+    tickets = ticket_checkin_search_service.search_tickets(
+        party.id, ticket.code, 10
+    )
+
+    loaded_ticket = tickets[0]
+    assert loaded_ticket.used_by.screen_name == ticket_user.screen_name
+    assert loaded_ticket.used_by.detail.last_name == last_name
+    assert loaded_ticket.occupied_seat is None
+
+
+def test_search_users_by_full_name(ticket_user, last_name):
+    users = ticket_checkin_search_service.search_users(
+        f'rosalind {last_name}', 10
+    )
+
+    assert ticket_user.id in {user.id for user in users}
+
+
+def test_search_users_excludes_deleted_users(make_user):
+    last_name = f'Gone{generate_token(6)}'
+    user = make_user(last_name=last_name)
+    deleted_user = make_user(last_name=last_name, deleted=True)
+
+    users = ticket_checkin_search_service.search_users(last_name, 10)
+
+    assert [u.id for u in users] == [user.id]
+    assert deleted_user.id not in {u.id for u in users}
+
+
+def _search(party, search_term):
+    tickets = ticket_checkin_search_service.search_tickets(
+        party.id, search_term, 10
+    )
+    return [ticket.id for ticket in tickets]
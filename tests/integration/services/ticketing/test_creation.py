@@ -32,14 +32,30 @@ def test_create_ticket_with_existing_code(
     )
     assert existing_ticket.code == 'TAKEN'
 
-    with pytest.raises(
-        ticket_creation_service.TicketCreationFailedWithConflictError
-    ):
+    with pytest.raises(ticket_creation_service.TicketCreationFailedError):
         ticket_creation_service.create_ticket(
             category.party_id, category.id, ticket_owner
         )
 
 
+@patch('byceps.services.ticketing.ticket_code_service._generate_ticket_code')
+def test_create_ticket_avoids_existing_code(
+    generate_ticket_code_mock, admin_app, category, ticket_owner
+):
+    codes_iter = iter(['INUSE', 'INUSE', 'UNUSD'])
+    generate_ticket_code_mock.side_effect = lambda: next(codes_iter)
+
+    existing_ticket = ticket_creation_service.create_ticket(
+        category.party_id, category.id, ticket_owner
+    )
+    assert existing_ticket.code == 'INUSE'
+
+    ticket = ticket_creation_service.create_ticket(
+        category.party_id, category.id, ticket_owner
+    )
+    assert ticket.code == 'UNUSD'
+
+
 def test_create_tickets(admin_app, category, ticket_owner):
     quantity = 3
     tickets = ticket_creation_service.create_tickets(
@@ -50,6 +66,16 @@ def test_create_tickets(admin_app, category, ticket_owner):
         assert_created_ticket(ticket, category.id, ticket_owner.id)
 
 
+def test_create_many_tickets(admin_app, category, ticket_owner):
+    quantity = 500
+    tickets = ticket_creation_service.create_tickets(
+        category.party_id, category.id, ticket_owner, quantity
+    )
+
+    assert len(tickets) == quantity
+    assert len({ticket.code for ticket in tickets}) == quantity
+
+
 @patch('byceps.services.ticketing.ticket_code_service._generate_ticket_code')
 def test_create_tickets_with_clashing_generated_codes(
     generate_ticket_code_mock, admin_app, category, ticket_owner
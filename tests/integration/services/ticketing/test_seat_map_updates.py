@@ -0,0 +1,103 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.services.seating import (
+    seat_map_service,
+    seat_service,
+    seating_area_service,
+)
+
+# Import models to ensure the corresponding tables are created so
+# `Seat.assignment` is available.
+import byceps.services.seating.dbmodels.seat_group  # noqa: F401
+from byceps.services.ticketing import (
+    ticket_creation_service,
+    ticket_seat_management_service,
+    ticket_service,
+    ticket_user_management_service,
+)
+
+
+@pytest.fixture(scope='module')
+def area(party):
+    area = seating_area_service.create_area(party.id, 'seat-map', 'Seat Map')
+    yield area
+    seating_area_service.delete_area(area.id)
+
+
+@pytest.fixture()
+def seat1(area, category):
+    seat = seat_service.create_seat(area.id, 10, 10, category.id, label='A1')
+    yield seat
+    seat_service.delete_seat(seat.id)
+    seat_map_service.invalidate_seat_map(area.id)
+
+
+@pytest.fixture()
+def seat2(area, category):
+    seat = seat_service.create_seat(area.id, 20, 10, category.id, label='A2')
+    yield seat
+    seat_service.delete_seat(seat.id)
+    seat_map_service.invalidate_seat_map(area.id)
+
+
+@pytest.fixture()
+def ticket(admin_app, category, ticket_owner):
+    ticket = ticket_creation_service.create_ticket(
+        category.party_id, category.id, ticket_owner
+    )
+    yield ticket
+    ticket_service.delete_ticket(ticket.id)
+
+
+def test_seat_map_follows_occupancy(
+    admin_app, area, seat1, seat2, ticket, ticket_owner
+):
+    seat_map = seat_map_service.get_seat_map(area.id)
+    assert [seat.label for seat in seat_map.seats] == ['A1', 'A2']
+    assert not any(seat.occupied for seat in seat_map.seats)
+
+    # occupy seat
+
+    ticket_seat_management_service.occupy_seat(
+        ticket.id, seat1.id, ticket_owner.id
+    )
+
+    seat_map = seat_map_service.get_seat_map(area.id)
+    assert _get_ticket_ids_by_label(seat_map) == {'A1': ticket.id, 'A2': None}
+    assert seat_map.seats[0].occupant is None
+
+    # appoint user
+
+    ticket_user_management_service.appoint_user(
+        ticket.id, ticket_owner.id, ticket_owner.id
+    )
+
+    seat_map = seat_map_service.get_seat_map(area.id)
+    occupant = seat_map.seats[0].occupant
+    assert occupant is not None
+    assert occupant.screen_name == ticket_owner.screen_name
+
+    # switch seat
+
+    ticket_seat_management_service.occupy_seat(
+        ticket.id, seat2.id, ticket_owner.id
+    )
+
+    seat_map = seat_map_service.get_seat_map(area.id)
+    assert _get_ticket_ids_by_label(seat_map) == {'A1': None, 'A2': ticket.id}
+
+    # release seat
+
+    ticket_seat_management_service.release_seat(ticket.id, ticket_owner.id)
+
+    seat_map = seat_map_service.get_seat_map(area.id)
+    assert not any(seat.occupied for seat in seat_map.seats)
+
+
+def _get_ticket_ids_by_label(seat_map):
+    return {seat.label: seat.ticket_id for seat in seat_map.seats}
@@ -0,0 +1,54 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.database import db
+from byceps.services.ticketing import (
+    ticket_category_service,
+    ticket_count_service,
+    ticket_creation_service,
+    ticket_revocation_service,
+)
+from byceps.services.ticketing.dbmodels.category import DbTicketCategory
+from byceps.services.ticketing.models.ticket import TicketCounts
+
+
+def test_counts_follow_ticket_changes(
+    admin_app, brand, make_party, make_ticket_category, ticket_owner
+):
+    party = make_party(brand.id)
+    category = make_ticket_category(party.id, 'Regular')
+
+    assert ticket_count_service.get_counts(party.id) == TicketCounts(
+        tickets_sold=0, tickets_revoked=0, tickets_checked_in=0
+    )
+
+    tickets = ticket_creation_service.create_tickets(
+        party.id, category.id, ticket_owner, 3
+    )
+
+    ticket_revocation_service.revoke_ticket(tickets[0].id, ticket_owner.id)
+
+    expected = TicketCounts(
+        tickets_sold=2, tickets_revoked=1, tickets_checked_in=0
+    )
+    assert ticket_count_service.get_counts(party.id) == expected
+    assert ticket_count_service.rebuild_counts(party.id) == expected
+
+
+def test_get_counts_does_not_commit_pending_changes(
+    admin_app, brand, make_party
+):
+    party = make_party(brand.id)
+
+    db_category = DbTicketCategory(party.id, 'Pending')
+    db.session.add(db_category)
+    db.session.flush()
+    category_id = db_category.id
+
+    ticket_count_service.get_counts(party.id)
+
+    db.session.rollback()
+
+    assert ticket_category_service.find_category(category_id) is None
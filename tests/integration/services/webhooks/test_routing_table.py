@@ -0,0 +1,55 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.webhooks import webhook_service
+
+from tests.helpers import generate_token
+
+
+def test_routing_table(admin_app):
+    event_name = f'test-event-{generate_token()}'
+    other_event_name = f'test-event-{generate_token()}'
+
+    assert webhook_service.get_routing_table().get_webhooks(event_name) == []
+
+    webhook_b = _create_webhook({event_name}, 'b')
+    webhook_a = _create_webhook({event_name, other_event_name}, 'a')
+
+    routing_table = webhook_service.get_routing_table()
+    assert routing_table.get_webhooks(event_name) == [webhook_a, webhook_b]
+    assert routing_table.get_webhooks(other_event_name) == [webhook_a]
+
+    # Disabled webhooks are excluded.
+    webhook_service.update_outgoing_webhook(
+        webhook_a.id,
+        webhook_a.event_types,
+        webhook_a.event_filters,
+        webhook_a.format,
+        webhook_a.text_prefix,
+        webhook_a.extra_fields,
+        webhook_a.url,
+        webhook_a.description,
+        False,
+    )
+
+    routing_table = webhook_service.get_routing_table()
+    assert routing_table.get_webhooks(event_name) == [webhook_b]
+    assert routing_table.get_webhooks(other_event_name) == []
+
+    webhook_service.delete_outgoing_webhook(webhook_a.id)
+    webhook_service.delete_outgoing_webhook(webhook_b.id)
+
+    assert webhook_service.get_routing_table().get_webhooks(event_name) == []
+
+
+def _create_webhook(event_types, channel):
+    return webhook_service.create_outgoing_webhook(
+        event_types,
+        {},
+        'weitersager',
+        'https://webhooks.test/',
+        True,
+        extra_fields={'channel': channel},
+    )
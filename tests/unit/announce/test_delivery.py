@@ -0,0 +1,205 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.announce import delivery
+from byceps.announce.delivery import PendingDelivery, RateLimit, TokenBucket
+from byceps.services.webhooks import webhook_delivery_stats_service
+from byceps.services.webhooks.models import AnnouncementRequest, WebhookID
+from byceps.util.uuid import generate_uuid4
+
+from tests.helpers.redis import InMemoryRedis
+
+
+URL = 'https://webhooks.test/chat'
+
+
+def test_coalesce_joins_texts_for_same_room():
+    deliveries = [
+        _build_delivery({'room_id': '!one', 'text': 'A'}, 'matrix'),
+        _build_delivery({'room_id': '!one', 'text': 'B'}, 'matrix'),
+        _build_delivery({'room_id': '!two', 'text': 'C'}, 'matrix'),
+        _build_delivery({'room_id': '!one', 'text': 'D'}, 'matrix'),
+    ]
+
+    assert delivery.coalesce(deliveries) == [
+        _build_delivery({'room_id': '!one', 'text': 'A\nB'}, 'matrix'),
+        _build_delivery({'room_id': '!two', 'text': 'C'}, 'matrix'),
+        _build_delivery({'room_id': '!one', 'text': 'D'}, 'matrix'),
+    ]
+
+
+def test_coalesce_keeps_irc_messages_separate():
+    deliveries = [
+        _build_delivery({'channel': '#one', 'text': 'A'}, 'weitersager'),
+        _build_delivery({'channel': '#one', 'text': 'B'}, 'weitersager'),
+    ]
+
+    assert delivery.coalesce(deliveries) == deliveries
+
+
+def test_coalesce_respects_maximum_message_length():
+    text = 'x' * ((delivery.MAX_MESSAGE_LENGTH - 1) // 2)
+    deliveries = [
+        _build_delivery({'content': text}, 'discord') for _ in range(3)
+    ]
+
+    messages = delivery.coalesce(deliveries)
+
+    assert [len(message.data['content']) for message in messages] == [
+        len(text) * 2 + 1,
+        len(text),
+    ]
+
+
+def test_token_bucket():
+    bucket = TokenBucket.create_full(RateLimit(capacity=2, refill_rate=0.5), 0)
+
+    bucket.take(0)
+    bucket.take(0)
+    assert bucket.get_wait_time(0) == 2.0
+    assert bucket.get_wait_time(1) == 1.0
+    assert bucket.get_wait_time(2) == 0.0
+
+    bucket.block(2, 30)
+    assert bucket.get_wait_time(10) == 22.0
+
+
+def test_deliver_pauses_when_rate_limited(app_with_redis, monkeypatch):
+    webhook_id = WebhookID(generate_uuid4())
+    session = FakeSession([204, 429])
+    scheduled_delays = []
+
+    monkeypatch.setattr(delivery, '_get_session', lambda url: session)
+    monkeypatch.setattr(
+        delivery,
+        'enqueue_at',
+        lambda dt, func, *args: scheduled_delays.append(dt),
+    )
+
+    with app_with_redis.app_context():
+        for text in ['one', 'two', 'three']:
+            delivery.submit(
+                _build_announcement_request(webhook_id, {'content': text})
+            )
+
+        # Only one delivery is scheduled for the burst.
+        assert len(scheduled_delays) == 1
+
+        # The burst is coalesced into a single message.
+        delivery.deliver_pending_announcements(webhook_id)
+
+        assert session.posted_texts == ['one\ntwo\nthree']
+
+        counts = webhook_delivery_stats_service.get_counts()
+        assert counts[(webhook_id, 'coalesced')] == 2
+        assert counts[(webhook_id, 'delivered')] == 1
+
+        # An endpoint throttling us is not asked again before the
+        # requested time.
+        delivery.submit(
+            _build_announcement_request(webhook_id, {'content': 'four'})
+        )
+        delivery.deliver_pending_announcements(webhook_id)
+        delivery.deliver_pending_announcements(webhook_id)
+
+        assert session.posted_texts == ['one\ntwo\nthree', 'four']
+
+        counts = webhook_delivery_stats_service.get_counts()
+        assert counts[(webhook_id, 'rate_limited')] == 1
+        assert counts[(webhook_id, 'throttled')] == 1
+
+        assert _get_texts(webhook_id, 'outbox') == ['four']
+        assert _get_texts(webhook_id, 'processing') == []
+
+
+def test_deliver_keeps_announcements_until_sent(app_with_redis, monkeypatch):
+    webhook_id = WebhookID(generate_uuid4())
+    session = FakeSession([204], crash_on_first_post=True)
+
+    monkeypatch.setattr(delivery, '_get_session', lambda url: session)
+    monkeypatch.setattr(delivery, 'enqueue_at', lambda dt, func, *args: None)
+
+    with app_with_redis.app_context():
+        for text in ['one', 'two']:
+            delivery.submit(
+                _build_announcement_request(webhook_id, {'content': text})
+            )
+
+        # The job dies while sending.
+        with pytest.raises(RuntimeError):
+            delivery.deliver_pending_announcements(webhook_id)
+
+        assert _get_texts(webhook_id, 'outbox') == []
+        assert _get_texts(webhook_id, 'processing') == ['one', 'two']
+
+        delivery.submit(
+            _build_announcement_request(webhook_id, {'content': 'three'})
+        )
+
+        # The next job delivers what was left behind first.
+        delivery.deliver_pending_announcements(webhook_id)
+
+        assert session.posted_texts == ['one\ntwo\nthree']
+        assert _get_texts(webhook_id, 'outbox') == []
+        assert _get_texts(webhook_id, 'processing') == []
+
+
+# helpers
+
+
+def _build_delivery(data, format):
+    return PendingDelivery(
+        url=URL, data=data, expected_response_status_code=None, format=format
+    )
+
+
+def _build_announcement_request(webhook_id, data):
+    return AnnouncementRequest(
+        webhook_id=webhook_id,
+        url='https://discord.com/api/webhooks/123/abc',
+        data=data,
+        expected_response_status_code=204,
+        format='discord',
+    )
+
+
+def _get_texts(webhook_id, list_name):
+    key = f'{delivery._KEY_PREFIX}:{list_name}:{webhook_id}'
+    values = delivery._get_redis().lrange(key, 0, -1)
+    return [
+        PendingDelivery.from_json(value).data['content'] for value in values
+    ]
+
+
+class FakeResponse:
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+        self.headers = {'Retry-After': '30'} if status_code == 429 else {}
+
+
+class FakeSession:
+    def __init__(
+        self, status_codes: list[int], *, crash_on_first_post: bool = False
+    ) -> None:
+        self.status_codes = status_codes
+        self.posted_texts: list[str] = []
+        self.crash_on_next_post = crash_on_first_post
+
+    def post(self, url, *, json, timeout):
+        if self.crash_on_next_post:
+            self.crash_on_next_post = False
+            raise RuntimeError('worker died')
+
+        self.posted_texts.append(json['content'])
+        return FakeResponse(self.status_codes[len(self.posted_texts) - 1])
+
+
+@pytest.fixture()
+def app_with_redis(make_app):
+    app = make_app(additional_config={'JOBS_ASYNC': True})
+    app.redis_client = InMemoryRedis()
+    return app
@@ -0,0 +1,111 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.services.authn.session import current_user_cache
+
+from tests.helpers.redis import InMemoryRedis
+
+
+PERMISSIONS = frozenset(['board.view_hidden', 'shop_order.view'])
+VERSION = 3
+
+
+def test_store_and_find(app_with_redis, user):
+    with app_with_redis.app_context():
+        current_user_cache.store_user_with_permissions(
+            user, 'token-1', PERMISSIONS, VERSION
+        )
+
+        actual = current_user_cache.find_user_with_permissions(
+            user.id, 'token-1', VERSION
+        )
+
+    assert actual == (user, PERMISSIONS)
+
+
+def test_find_with_other_auth_token(app_with_redis, user):
+    with app_with_redis.app_context():
+        current_user_cache.store_user_with_permissions(
+            user, 'token-1', PERMISSIONS, VERSION
+        )
+
+        actual = current_user_cache.find_user_with_permissions(
+            user.id, 'token-2', VERSION
+        )
+
+    assert actual is None
+
+
+def test_find_for_other_permissions_version(app_with_redis, user):
+    with app_with_redis.app_context():
+        current_user_cache.store_user_with_permissions(
+            user, 'token-1', PERMISSIONS, VERSION
+        )
+
+        actual = current_user_cache.find_user_with_permissions(
+            user.id, 'token-1', VERSION + 1
+        )
+
+    assert actual is None
+
+
+def test_invalidate_user(app_with_redis, make_user):
+    user1 = make_user()
+    user2 = make_user()
+
+    with app_with_redis.app_context():
+        current_user_cache.store_user_with_permissions(
+            user1, 'token-1', PERMISSIONS, VERSION
+        )
+        current_user_cache.store_user_with_permissions(
+            user2, 'token-2', PERMISSIONS, VERSION
+        )
+
+        current_user_cache.invalidate_user(user1.id)
+
+        assert (
+            current_user_cache.find_user_with_permissions(
+                user1.id, 'token-1', VERSION
+            )
+            is None
+        )
+        assert (
+            current_user_cache.find_user_with_permissions(
+                user2.id, 'token-2', VERSION
+            )
+            is not None
+        )
+
+
+def test_invalidate_all_users(app_with_redis, make_user):
+    user1 = make_user()
+    user2 = make_user()
+
+    with app_with_redis.app_context():
+        current_user_cache.store_user_with_permissions(
+            user1, 'token-1', PERMISSIONS, VERSION
+        )
+        current_user_cache.store_user_with_permissions(
+            user2, 'token-2', PERMISSIONS, VERSION
+        )
+
+        current_user_cache.invalidate_all_users()
+
+        for user, auth_token in [(user1, 'token-1'), (user2, 'token-2')]:
+            assert (
+                current_user_cache.find_user_with_permissions(
+                    user.id, auth_token, VERSION
+                )
+                is None
+            )
+
+
+@pytest.fixture()
+def app_with_redis(make_app):
+    app = make_app()
+    app.redis_client = InMemoryRedis()
+    return app
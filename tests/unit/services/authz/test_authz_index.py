@@ -0,0 +1,88 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.authz.models import (
+    AuthzIndex,
+    PermissionID,
+    Role,
+    RoleID,
+)
+from byceps.services.user.models.user import UserID
+
+from tests.helpers import generate_uuid
+
+
+ROLE_ID_1 = RoleID('board_moderator')
+ROLE_ID_2 = RoleID('news_editor')
+ROLE_ID_3 = RoleID('orga')
+
+USER_ID_1 = UserID(generate_uuid())
+USER_ID_2 = UserID(generate_uuid())
+USER_ID_3 = UserID(generate_uuid())
+
+
+def test_get_role_ids_for_user():
+    index = build_index()
+
+    assert index.get_role_ids_for_user(USER_ID_1) == {ROLE_ID_1, ROLE_ID_2}
+    assert index.get_role_ids_for_user(USER_ID_2) == {ROLE_ID_2}
+    assert index.get_role_ids_for_user(USER_ID_3) == frozenset()
+
+
+def test_get_permission_ids_for_user():
+    index = build_index()
+
+    assert index.get_permission_ids_for_user(USER_ID_1) == {
+        PermissionID('board.hide'),
+        PermissionID('board.view_hidden'),
+        PermissionID('news_item.create'),
+    }
+    assert index.get_permission_ids_for_user(USER_ID_2) == {
+        PermissionID('news_item.create'),
+    }
+    assert index.get_permission_ids_for_user(USER_ID_3) == frozenset()
+
+
+def test_get_user_ids_for_role():
+    index = build_index()
+
+    assert index.get_user_ids_for_role(ROLE_ID_1) == {USER_ID_1}
+    assert index.get_user_ids_for_role(ROLE_ID_2) == {USER_ID_1, USER_ID_2}
+    assert index.get_user_ids_for_role(ROLE_ID_3) == frozenset()
+
+
+def test_get_permission_ids_for_role_without_permissions():
+    index = build_index()
+
+    assert index.get_permission_ids_for_role(ROLE_ID_3) == frozenset()
+
+
+# helpers
+
+
+def build_index() -> AuthzIndex:
+    return AuthzIndex(
+        roles_by_id={
+            role_id: Role(id=role_id, title=role_id)
+            for role_id in [ROLE_ID_1, ROLE_ID_2, ROLE_ID_3]
+        },
+        permission_ids_by_role_id={
+            ROLE_ID_1: frozenset(
+                [
+                    PermissionID('board.hide'),
+                    PermissionID('board.view_hidden'),
+                ]
+            ),
+            ROLE_ID_2: frozenset([PermissionID('news_item.create')]),
+        },
+        role_ids_by_user_id={
+            USER_ID_1: frozenset([ROLE_ID_1, ROLE_ID_2]),
+            USER_ID_2: frozenset([ROLE_ID_2]),
+        },
+        user_ids_by_role_id={
+            ROLE_ID_1: frozenset([USER_ID_1]),
+            ROLE_ID_2: frozenset([USER_ID_1, USER_ID_2]),
+        },
+    )
@@ -0,0 +1,73 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+
+import pytest
+
+from byceps.services.board import board_last_view_buffer
+from byceps.services.board.models import BoardCategoryID, TopicID
+from byceps.services.user.models.user import UserID
+from byceps.util.uuid import generate_uuid4, generate_uuid7
+
+from tests.helpers.redis import InMemoryRedis
+
+
+EARLIER = datetime(2024, 3, 8, 14, 21, 3, 123456)
+LATER = datetime(2024, 3, 8, 14, 25, 41, 654321)
+
+
+def test_latest_view_is_kept(app_with_redis):
+    user_id = UserID(generate_uuid4())
+    topic_id = TopicID(generate_uuid7())
+    other_topic_id = TopicID(generate_uuid7())
+
+    with app_with_redis.app_context():
+        board_last_view_buffer.record_topic_view(user_id, topic_id, LATER)
+        board_last_view_buffer.record_topic_view(user_id, topic_id, EARLIER)
+
+        views = board_last_view_buffer.get_topic_views(
+            user_id, [topic_id, other_topic_id]
+        )
+
+    assert views == {topic_id: LATER}
+
+
+def test_pop_views(app_with_redis):
+    user_id = UserID(generate_uuid4())
+    topic_id = TopicID(generate_uuid7())
+    category_id = BoardCategoryID(generate_uuid7())
+
+    with app_with_redis.app_context():
+        board_last_view_buffer.record_topic_view(user_id, topic_id, EARLIER)
+        board_last_view_buffer.record_category_view(user_id, category_id, LATER)
+
+        user_ids = board_last_view_buffer.pop_user_ids(10)
+        topic_views, category_views = board_last_view_buffer.pop_views(user_ids)
+
+        assert user_ids == [user_id]
+        assert topic_views == [(user_id, topic_id, EARLIER)]
+        assert category_views == [(user_id, category_id, LATER)]
+
+        # Everything has been drained.
+        assert board_last_view_buffer.pop_user_ids(10) == []
+        assert board_last_view_buffer.get_topic_views(user_id, [topic_id]) == {}
+
+
+def test_flush_is_scheduled_once(app_with_redis):
+    with app_with_redis.app_context():
+        assert board_last_view_buffer.mark_flush_scheduled(60)
+        assert not board_last_view_buffer.mark_flush_scheduled(60)
+
+        board_last_view_buffer.clear_flush_scheduled()
+
+        assert board_last_view_buffer.mark_flush_scheduled(60)
+
+
+@pytest.fixture()
+def app_with_redis(make_app):
+    app = make_app()
+    app.redis_client = InMemoryRedis()
+    return app
@@ -0,0 +1,66 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+
+from byceps.services.page.models import (
+    Page,
+    PageID,
+    PageVersion,
+    PageVersionID,
+    SitePageIndex,
+)
+from byceps.services.site.models import SiteID
+from byceps.services.user.models.user import UserID
+from byceps.util.uuid import generate_uuid4, generate_uuid7
+
+
+def test_find_page_and_version_for_url_path():
+    page_and_version_en = create_page_and_version('about', 'en', '/about')
+    page_and_version_de = create_page_and_version('about', 'de', '/about')
+
+    index = SitePageIndex(
+        pages_and_versions={
+            ('en', '/about'): page_and_version_en,
+            ('de', '/about'): page_and_version_de,
+        },
+        url_paths_by_page_name={'about': '/about'},
+    )
+
+    assert (
+        index.find_page_and_version_for_url_path('/about', 'de')
+        == page_and_version_de
+    )
+    assert index.find_page_and_version_for_url_path('/about', 'fr') is None
+    assert index.find_page_and_version_for_url_path('/imprint', 'en') is None
+
+
+# helpers
+
+
+def create_page_and_version(
+    name: str, language_code: str, url_path: str
+) -> tuple[Page, PageVersion]:
+    page = Page(
+        id=PageID(generate_uuid7()),
+        site_id=SiteID('acmecon-2014-website'),
+        name=name,
+        language_code=language_code,
+        url_path=url_path,
+        published=True,
+        nav_menu_id=None,
+    )
+
+    version = PageVersion(
+        id=PageVersionID(generate_uuid7()),
+        page_id=page.id,
+        created_at=datetime.utcnow(),
+        creator_id=UserID(generate_uuid4()),
+        title=name.title(),
+        head=None,
+        body='',
+    )
+
+    return page, version
@@ -0,0 +1,168 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.services.party.models import PartyID
+from byceps.services.seating import seat_map_service
+from byceps.services.seating.models import (
+    SeatID,
+    SeatingAreaID,
+    SeatMapOccupant,
+    SeatMapSeat,
+    SeatUtilization,
+)
+from byceps.services.ticketing.models.ticket import TicketCategoryID, TicketID
+from byceps.services.user.models.user import UserID
+from byceps.util.uuid import generate_uuid4, generate_uuid7
+
+from tests.helpers.redis import InMemoryRedis
+
+
+AREA_ID = SeatingAreaID(generate_uuid7())
+PARTY_ID = PartyID('lanparty-2024')
+CATEGORY_ID = TicketCategoryID(generate_uuid4())
+
+
+def test_seat_map_is_built_on_first_access(app_with_redis, database):
+    seat1 = _build_seat(coord_x=20, coord_y=10)
+    seat2 = _build_seat(coord_x=10, coord_y=10, occupied=True)
+    database.extend([seat1, seat2])
+
+    with app_with_redis.app_context():
+        seat_map = seat_map_service.get_seat_map(AREA_ID)
+
+    assert seat_map.area_id == AREA_ID
+    assert seat_map.version == 0
+    # Seats are ordered by coordinates.
+    assert seat_map.seats == [seat2, seat1]
+    assert not seat_map.seats[1].occupied
+    assert seat_map.seats[0].occupied
+
+
+def test_discarded_seat_map_is_rebuilt(app_with_redis, database):
+    seat = _build_seat(coord_x=10, coord_y=10)
+    database.append(seat)
+
+    with app_with_redis.app_context():
+        seat_map_service.get_seat_map(AREA_ID)
+
+        occupied_seat = _occupy(seat)
+        database[:] = [occupied_seat]
+        seat_map_service.discard_seat_maps_for_seats({seat.id})
+
+        seat_map = seat_map_service.get_seat_map(AREA_ID)
+
+    assert seat_map.version == 1
+    assert seat_map.seats == [occupied_seat]
+
+
+def test_build_does_not_store_map_outdated_meanwhile(
+    app_with_redis, database, monkeypatch
+):
+    seat = _build_seat(coord_x=10, coord_y=10)
+    occupied_seat = _occupy(seat)
+    database.append(occupied_seat)
+
+    load_seats = seat_map_service._load_seats
+
+    def load_seats_before_occupation(criterion):
+        # The build reads the released seat. Then, before it stores
+        # the map, the seat is occupied.
+        monkeypatch.setattr(seat_map_service, '_load_seats', load_seats)
+        seat_map_service.discard_seat_maps_for_seats({seat.id})
+        return [(AREA_ID, PARTY_ID, seat)]
+
+    monkeypatch.setattr(
+        seat_map_service, '_load_seats', load_seats_before_occupation
+    )
+
+    with app_with_redis.app_context():
+        assert seat_map_service.get_seat_map(AREA_ID).seats == [seat]
+
+        assert seat_map_service.get_seat_map(AREA_ID).seats == [occupied_seat]
+
+
+def test_get_seat_utilization_is_cached(app_with_redis, database, monkeypatch):
+    seat = _build_seat(coord_x=10, coord_y=10)
+    database.append(seat)
+
+    counts = iter([(3, 10), (4, 10)])
+    monkeypatch.setattr(
+        seat_map_service.seat_service,
+        'get_seat_utilization',
+        lambda party_id: SeatUtilization(*next(counts)),
+    )
+
+    with app_with_redis.app_context():
+        assert seat_map_service.get_seat_utilization(PARTY_ID).occupied == 3
+        assert seat_map_service.get_seat_utilization(PARTY_ID).occupied == 3
+
+        seat_map_service.discard_seat_maps_for_seats({seat.id})
+
+        assert seat_map_service.get_seat_utilization(PARTY_ID).occupied == 4
+
+
+# helpers
+
+
+def _build_seat(*, coord_x: int, coord_y: int, occupied: bool = False):
+    seat = SeatMapSeat(
+        id=SeatID(generate_uuid7()),
+        coord_x=coord_x,
+        coord_y=coord_y,
+        rotation=90,
+        category_id=CATEGORY_ID,
+        label=f'Seat {coord_x}/{coord_y}',
+        type_=None,
+        ticket_id=None,
+        occupant=None,
+    )
+
+    return _occupy(seat) if occupied else seat
+
+
+def _occupy(seat: SeatMapSeat) -> SeatMapSeat:
+    return SeatMapSeat(
+        id=seat.id,
+        coord_x=seat.coord_x,
+        coord_y=seat.coord_y,
+        rotation=seat.rotation,
+        category_id=seat.category_id,
+        label=seat.label,
+        type_=seat.type_,
+        ticket_id=TicketID(generate_uuid7()),
+        occupant=SeatMapOccupant(
+            id=UserID(generate_uuid7()),
+            screen_name='Occupant',
+            avatar_url=None,
+        ),
+    )
+
+
+@pytest.fixture()
+def database(monkeypatch):
+    """Stand in for the seats stored in the database."""
+    seats: list[SeatMapSeat] = []
+
+    def load_seats(criterion):
+        return [(AREA_ID, PARTY_ID, seat) for seat in seats]
+
+    def get_area_and_party_ids(seat_ids):
+        return {(AREA_ID, PARTY_ID)}
+
+    monkeypatch.setattr(seat_map_service, '_load_seats', load_seats)
+    monkeypatch.setattr(
+        seat_map_service, '_get_area_and_party_ids', get_area_and_party_ids
+    )
+
+    return seats
+
+
+@pytest.fixture()
+def app_with_redis(make_app):
+    app = make_app()
+    app.redis_client = InMemoryRedis()
+    return app
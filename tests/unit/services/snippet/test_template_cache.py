@@ -0,0 +1,48 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.services.snippet import snippet_template_cache
+from byceps.services.snippet.models import SnippetVersionID
+from byceps.util.templating import create_sandboxed_environment
+from byceps.util.uuid import generate_uuid7
+
+from tests.helpers.redis import InMemoryRedis
+
+
+def test_template_is_compiled_once_per_version(app_with_redis):
+    env = create_sandboxed_environment()
+    version_id = SnippetVersionID(generate_uuid7())
+
+    with app_with_redis.app_context():
+        template1 = snippet_template_cache.get_template(
+            version_id, 'Hello, {{ name }}!', env
+        )
+        template2 = snippet_template_cache.get_template(
+            version_id, 'ignored', env
+        )
+
+    assert template2 is template1
+    assert template1.render(name='world') == 'Hello, world!'
+
+
+def test_invalidate_discards_templates(app_with_redis):
+    env = create_sandboxed_environment()
+    version_id = SnippetVersionID(generate_uuid7())
+
+    with app_with_redis.app_context():
+        snippet_template_cache.get_template(version_id, 'before', env)
+        snippet_template_cache.invalidate()
+        template = snippet_template_cache.get_template(version_id, 'after', env)
+
+    assert template.render() == 'after'
+
+
+@pytest.fixture()
+def app_with_redis(make_app):
+    app = make_app()
+    app.redis_client = InMemoryRedis()
+    return app
@@ -0,0 +1,49 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.ticketing import barcode_service
+
+
+def test_render_svg():
+    svg = barcode_service.render_svg('BCDFG', thickness=2, image_height=60)
+
+    # start symbol + 5 symbols + check digit symbol: 11 modules each
+    # stop symbol: 13 modules
+    assert svg.startswith(
+        '<svg xmlns="http://www.w3.org/2000/svg" width="180" height="60" '
+        'viewBox="0 0 180 60">'
+    )
+
+    # Start B: 211214
+    assert (
+        '  <rect x="0" width="4" height="60"/>\n'
+        '  <rect x="6" width="2" height="60"/>\n'
+        '  <rect x="12" width="2" height="60"/>\n'
+    ) in svg
+
+
+def test_render_svg_is_cached():
+    svg1 = barcode_service.render_svg('HJKLM')
+    svg2 = barcode_service.render_svg('HJKLM')
+
+    assert svg1 is svg2
+
+
+def test_render_svgs():
+    svgs = barcode_service.render_svgs(['BCDFG', 'HJKLM', 'BCDFG'])
+
+    assert svgs == {
+        'BCDFG': barcode_service.render_svg('BCDFG'),
+        'HJKLM': barcode_service.render_svg('HJKLM'),
+    }
+
+
+def test_encode_svg_for_data_uri():
+    svg = '<svg fill="#000">\n</svg>'
+
+    assert (
+        barcode_service.encode_svg_for_data_uri(svg)
+        == "%3Csvg fill='%23000'%3E%0A%3C/svg%3E"
+    )
@@ -3,6 +3,8 @@
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from datetime import datetime
+
 import pytest
 
 from byceps.events.ticketing import TicketCheckedInEvent
@@ -59,6 +61,22 @@ def test_check_in_user(party, build_ticket, ticket_user, initiator):
     }
 
 
+def test_check_in_user_at_earlier_time(
+    party, build_ticket, ticket_user, initiator
+):
+    ticket = build_ticket(party.id, used_by=ticket_user)
+    occurred_at = datetime(2024, 3, 8, 17, 42, 0)
+
+    actual = ticket_domain_service.check_in_user(
+        party.id, ticket, initiator, occurred_at=occurred_at
+    )
+
+    check_in, event, log_entry = actual.unwrap()
+    assert check_in.occurred_at == occurred_at
+    assert event.occurred_at == occurred_at
+    assert log_entry.occurred_at == occurred_at
+
+
 def test_check_in_user_with_ticket_for_another_party(
     other_party, party, build_ticket, ticket_user, initiator
 ):
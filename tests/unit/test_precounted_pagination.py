@@ -0,0 +1,42 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.database import PrecountedPagination
+
+
+@pytest.mark.parametrize(
+    ('page', 'total', 'expected_pages', 'expected_prev', 'expected_next'),
+    [
+        (1, 0, 0, None, None),
+        (1, 10, 1, None, None),
+        (1, 11, 2, None, 2),
+        (2, 25, 3, 1, 3),
+        (3, 25, 3, 2, None),
+    ],
+)
+def test_page_numbers(
+    page, total, expected_pages, expected_prev, expected_next
+):
+    pagination = PrecountedPagination(page, 10, total, [])
+
+    assert pagination.pages == expected_pages
+    assert pagination.prev_num == expected_prev
+    assert pagination.next_num == expected_next
+
+
+def test_iter_pages():
+    pagination = PrecountedPagination(7, 10, 200, [])
+
+    actual = list(pagination.iter_pages())
+
+    assert actual == [1, 2, None, 5, 6, 7, 8, 9, 10, 11, None, 19, 20]
+
+
+def test_iter_items():
+    pagination = PrecountedPagination(1, 10, 2, ['a', 'b'])
+
+    assert list(pagination) == ['a', 'b']
@@ -0,0 +1,146 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.util.cache import VersionedCache
+
+from tests.helpers.redis import InMemoryRedis
+
+
+def test_get_loads_once(app_with_redis):
+    loader = CountingLoader()
+    cache = VersionedCache('test', version_check_interval=0)
+
+    with app_with_redis.app_context():
+        assert cache.get('key', loader) == 'value-for-key'
+        assert cache.get('key', loader) == 'value-for-key'
+
+    assert loader.calls == ['key']
+
+
+def test_invalidate_discards_entries(app_with_redis):
+    loader = CountingLoader()
+    cache = VersionedCache('test', version_check_interval=60)
+
+    with app_with_redis.app_context():
+        cache.get('key', loader)
+        cache.invalidate()
+        cache.get('key', loader)
+
+    assert loader.calls == ['key', 'key']
+
+
+def test_version_bumped_elsewhere_discards_entries(app_with_redis):
+    loader = CountingLoader()
+    cache = VersionedCache('test', version_check_interval=0)
+    other_cache = VersionedCache('test', version_check_interval=0)
+
+    with app_with_redis.app_context():
+        cache.get('key', loader)
+        other_cache.invalidate()  # as another process would
+        cache.get('key', loader)
+
+    assert loader.calls == ['key', 'key']
+
+
+def test_version_is_only_checked_after_interval(app_with_redis):
+    loader = CountingLoader()
+    cache = VersionedCache('test', version_check_interval=60)
+    other_cache = VersionedCache('test', version_check_interval=60)
+
+    with app_with_redis.app_context():
+        cache.get('key', loader)
+        other_cache.invalidate()
+        cache.get('key', loader)
+
+    assert loader.calls == ['key']
+
+
+def test_get_with_version_reports_version_loaded_for(app_with_redis):
+    loader = CountingLoader()
+    cache = VersionedCache('test', version_check_interval=60)
+    other_cache = VersionedCache('test', version_check_interval=60)
+
+    with app_with_redis.app_context():
+        assert cache.get_with_version('key', loader) == ('value-for-key', 0)
+
+        other_cache.invalidate()
+
+        # The stale entry is still served, but the shared version tells.
+        assert cache.get_with_version('key', loader) == ('value-for-key', 0)
+        assert cache.get_shared_version() == 1
+
+
+def test_failed_load_is_not_cached(app_with_redis):
+    cache = VersionedCache('test', version_check_interval=0)
+
+    def fail(key):
+        raise ValueError(key)
+
+    with app_with_redis.app_context():
+        with pytest.raises(ValueError):
+            cache.get('key', fail)
+
+        assert cache.get('key', lambda key: 'later') == 'later'
+
+
+def test_max_size_evicts_least_recently_used(app_with_redis):
+    loader = CountingLoader()
+    cache = VersionedCache('test', max_size=2, version_check_interval=0)
+
+    with app_with_redis.app_context():
+        cache.get('a', loader)
+        cache.get('b', loader)
+        cache.get('a', loader)
+        cache.get('c', loader)  # evicts 'b'
+        cache.get('a', loader)
+        cache.get('b', loader)
+
+    assert loader.calls == ['a', 'b', 'c', 'b']
+    assert len(cache) == 2
+
+
+def test_get_many_loads_missing_keys_at_once(app_with_redis):
+    calls = []
+    cache = VersionedCache('test', version_check_interval=0)
+
+    def load_many(keys):
+        calls.append(keys)
+        return {key: f'value-for-{key}' for key in keys if key != 'unknown'}
+
+    with app_with_redis.app_context():
+        cache.get('a', CountingLoader())
+
+        assert cache.get_many(['a', 'b', 'c', 'unknown'], load_many) == {
+            'a': 'value-for-a',
+            'b': 'value-for-b',
+            'c': 'value-for-c',
+        }
+        assert cache.get_many(['b', 'c'], load_many) == {
+            'b': 'value-for-b',
+            'c': 'value-for-c',
+        }
+
+    assert calls == [{'b', 'c', 'unknown'}]
+
+
+# helpers
+
+
+class CountingLoader:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def __call__(self, key: str) -> str:
+        self.calls.append(key)
+        return f'value-for-{key}'
+
+
+@pytest.fixture()
+def app_with_redis(make_app):
+    app = make_app()
+    app.redis_client = InMemoryRedis()
+    return app